@@ -1,7 +1,10 @@
+from django.conf import settings
 from django.core.cache import caches
 from django.db import connections
 from django.http import HttpRequest, JsonResponse
 
+from tenants.pool import available_counts
+
 
 def healthz(request: HttpRequest) -> JsonResponse:
     return JsonResponse({"status": "ok"}, status=200)
@@ -13,10 +16,13 @@ def readyz(request: HttpRequest) -> JsonResponse:
         "cache": _check_cache(),
     }
     status_code = 200 if all(checks.values()) else 503
-    payload = {
+    payload: dict[str, object] = {
         "status": "ok" if status_code == 200 else "degraded",
         "checks": checks,
     }
+    if settings.TENANT_POOL_SIZE:
+        # Informational: an empty pool only slows tenant creation down.
+        payload["tenant_pool"] = _tenant_pool()
     return JsonResponse(payload, status=status_code)
 
 
@@ -39,3 +45,16 @@ def _check_cache() -> bool:
         return bool(cache.get(cache_key) == "ok")
     except Exception:
         return False
+
+
+def _tenant_pool() -> dict[str, object]:
+    try:
+        available = available_counts()
+    except Exception:
+        return {"target": settings.TENANT_POOL_SIZE, "available": None, "healthy": False}
+
+    return {
+        "target": settings.TENANT_POOL_SIZE,
+        "available": available,
+        "healthy": all(available.values()),
+    }
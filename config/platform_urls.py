@@ -20,6 +20,7 @@ from control_plane.views import (
     tenant_user_deactivate,
     tenant_user_edit,
     tenant_user_update,
+    tenant_users_bulk_status,
     tenant_users_list_partial,
     tenant_users_page,
     tenants_list_page,
@@ -66,6 +67,11 @@ urlpatterns = [
         tenant_users_list_partial,
         name="tenant-users-partial",
     ),
+    path(
+        "dashboard/clients/<int:tenant_pk>/users/bulk-status",
+        tenant_users_bulk_status,
+        name="tenant-users-bulk-status",
+    ),
     path(
         "dashboard/clients/<int:tenant_pk>/users/create",
         tenant_user_create_view,
@@ -69,6 +69,7 @@ if not DEBUG and not CORS_ALLOW_ALL_ORIGINS and not CORS_ALLOWED_ORIGINS:
 
 SHARED_APPS = (
     "jazzmin",
+    "django.contrib.postgres",
     "corsheaders",
     "django_ckeditor_5",
     "django_tenants",
@@ -97,19 +98,20 @@ INSTALLED_APPS = list(SHARED_APPS) + [app for app in TENANT_APPS if app not in S
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django_tenants.middleware.TenantMainMiddleware",
+    "tenants.middleware.CachedTenantMainMiddleware",
     "src.libs.middleware.RequestContextMiddleware",
     "src.libs.middleware.NoIndexMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "src.libs.middleware.TenantStatusMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "control_plane.middleware.PlatformUserJWTMiddleware",
+    "tenants.middleware.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "src.libs.middleware.TenantStatusMiddleware",
 ]
 
 if not DEBUG:
@@ -141,19 +143,106 @@ ASGI_APPLICATION = "config.asgi.application"
 
 DATABASES: dict[str, dict[str, Any]] = {
     "default": {
-        "ENGINE": "django_tenants.postgresql_backend",
+        "ENGINE": "tenants.postgresql_backend",
         "NAME": os.getenv("DB_NAME"),
         "USER": os.getenv("DB_USER"),
         "PASSWORD": os.getenv("DB_PASSWORD"),
         "HOST": os.getenv("DB_HOST"),
         "PORT": os.getenv("DB_PORT", "5432"),
+        # Persistent connections let the backend skip SET search_path when
+        # consecutive requests hit the same schema.
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", default=60)),
+        "CONN_HEALTH_CHECKS": True,
+        # "transaction" applies the tenant schema with SET LOCAL, for PgBouncer
+        # transaction pooling; "session" keeps a session-level search_path.
+        "SEARCH_PATH_MODE": os.getenv("DB_SEARCH_PATH_MODE", "session"),
     }
 }
+DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = (
+    DATABASES["default"]["SEARCH_PATH_MODE"] == "transaction"
+)
+
+# Read replicas: one alias per host, same credentials as the primary
+DATABASE_REPLICAS = []
+for _index, _host in enumerate(_csv_env("DB_REPLICA_HOSTS")):
+    DATABASES[f"replica_{_index}"] = {
+        **DATABASES["default"],
+        "HOST": _host,
+        "ATOMIC_REQUESTS": False,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica_{_index}")
+
+# "replica" serves GET/HEAD views from replicas unless a view opts out
+DATABASE_REPLICA_READS = os.getenv("DB_REPLICA_READS", "replica")
+# Seconds a client stays on the primary after a write (read-your-writes)
+DATABASE_REPLICA_PIN_SECONDS = int(os.getenv("DB_REPLICA_PIN_SECONDS", default=5))
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
 
+# Tenant placement: extra Postgres clusters for tenant schemas ("name=host,...")
+TENANT_DATABASES = ["default"]
+for _cluster in _csv_env("DB_TENANT_CLUSTERS"):
+    _name, _, _host = _cluster.partition("=")
+    # Views only need a request transaction on the default alias; tenant
+    # writes on a cluster open their own atomic(using=alias).
+    DATABASES[_name] = {**DATABASES["default"], "HOST": _host, "ATOMIC_REQUESTS": False}
+    TENANT_DATABASES.append(_name)
+
 TENANT_MODEL = "tenants.Tenant"
 TENANT_DOMAIN_MODEL = "tenants.Domain"
-DATABASE_ROUTERS = ("django_tenants.routers.TenantSyncRouter",)
+# migrate_schemas runs each tenant schema on the cluster it is placed on
+GET_EXECUTOR_FUNCTION = "tenants.migration_executors.get_executor"
+DATABASE_ROUTERS = (
+    "tenants.routers.TenantPlacementRouter",
+    "tenants.routers.ReplicaRouter",
+    "django_tenants.routers.TenantSyncRouter",
+)
+
+# Per-process hostname -> tenant cache used by the tenant middleware
+TENANT_RESOLUTION_CACHE_SIZE = int(os.getenv("TENANT_RESOLUTION_CACHE_SIZE", default=1024))
+TENANT_RESOLUTION_CACHE_TTL = int(os.getenv("TENANT_RESOLUTION_CACHE_TTL", default=60))
+
+# Cluster-wide host -> schema/status table, invalidated over Redis pub/sub
+TENANT_ROUTING_ENABLED = _as_bool(os.getenv("TENANT_ROUTING_ENABLED", "True"))
+TENANT_ROUTING_CACHE_ALIAS = "default"
+# Routing entries older than this are re-read from Postgres, which bounds how
+# long a missed invalidation publish can serve a stale route.
+TENANT_ROUTING_TTL = int(os.getenv("TENANT_ROUTING_TTL", default=3600))
+
+# Control-plane tenant counts, kept as a Redis rollup and reconciled by Celery beat
+TENANT_STATS_CACHE_ALIAS = "default"
+TENANT_STATS_RECONCILE_SECONDS = int(os.getenv("TENANT_STATS_RECONCILE_SECONDS", default=900))
+# Per-tenant user counts, snapshotted into the public schema by Celery beat
+TENANT_USER_STATS_COLLECT_SECONDS = int(
+    os.getenv("TENANT_USER_STATS_COLLECT_SECONDS", default=3600)
+)
+# "migrate" replays tenant migrations for each new schema; "clone" copies the
+# pre-migrated TENANT_TEMPLATE_SCHEMA (rebuild it with rebuild_tenant_template)
+TENANT_PROVISIONING_MODE = os.getenv("TENANT_PROVISIONING_MODE", "migrate")
+TENANT_TEMPLATE_SCHEMA = os.getenv("TENANT_TEMPLATE_SCHEMA", "tenant_template")
+# Worker processes used by migrate_tenants_parallel
+TENANT_MIGRATION_PROCESSES = int(os.getenv("TENANT_MIGRATION_PROCESSES", default=4))
+# Fleet executor (tenants.fleet): worker threads, per-schema statement timeout
+# in seconds and schemas per UNION ALL statement
+TENANT_FLEET_MAX_WORKERS = int(os.getenv("TENANT_FLEET_MAX_WORKERS", default=8))
+TENANT_FLEET_TIMEOUT = float(os.getenv("TENANT_FLEET_TIMEOUT", default=30))
+TENANT_FLEET_UNION_BATCH_SIZE = int(os.getenv("TENANT_FLEET_UNION_BATCH_SIZE", default=200))
+# Password-hashing processes used by the bulk tenant user import
+TENANT_USER_IMPORT_PROCESSES = int(
+    os.getenv("TENANT_USER_IMPORT_PROCESSES", default=os.cpu_count() or 2)
+)
+# Hashing processes kept by each web worker for uploads (per worker, not per host)
+TENANT_USER_IMPORT_WEB_PROCESSES = int(os.getenv("TENANT_USER_IMPORT_WEB_PROCESSES", default=2))
+# Warm pool of pre-provisioned schemas per cluster (tenants.pool); 0 disables it.
+TENANT_POOL_SIZE = int(os.getenv("TENANT_POOL_SIZE", default=0))
+TENANT_POOL_REFILL_BATCH = int(os.getenv("TENANT_POOL_REFILL_BATCH", default=5))
+TENANT_POOL_REFILL_SECONDS = int(os.getenv("TENANT_POOL_REFILL_SECONDS", default=300))
+# Fixtures loaded into every new tenant schema by the provisioning pipeline
+TENANT_SEED_FIXTURES = tuple(
+    fixture.strip()
+    for fixture in os.getenv("TENANT_SEED_FIXTURES", "").split(",")
+    if fixture.strip()
+)
 
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "Asia/Kathmandu"
@@ -347,6 +436,20 @@ CELERY_RESULT_EXPIRES = 3600
 
 # Beat settings for periodic tasks
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+CELERY_BEAT_SCHEDULE = {
+    "reconcile-tenant-stats": {
+        "task": "tenants.tasks.reconcile_tenant_stats",
+        "schedule": TENANT_STATS_RECONCILE_SECONDS,
+    },
+    "collect-fleet-user-stats": {
+        "task": "tenants.tasks.collect_fleet_user_stats",
+        "schedule": TENANT_USER_STATS_COLLECT_SECONDS,
+    },
+    "refill-tenant-pool": {
+        "task": "tenants.tasks.refill_tenant_pool",
+        "schedule": TENANT_POOL_REFILL_SECONDS,
+    },
+}
 
 CELERY_TASK_DEFAULT_QUEUE = "default"
 
@@ -0,0 +1,88 @@
+from time import perf_counter
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django_tenants.utils import schema_context
+
+from control_plane.serializers import TenantUserCreateSerializer
+from control_plane.user_import import hasher_pool, import_users
+from tenants.models import Tenant
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare users/second of one TenantUserCreateSerializer save per user (the per-request "
+        "path, without HTTP) against the bulk import, with a cold hashing pool (start-up "
+        "included) and a warm one. Every user is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--schema", type=str, required=True)
+        parser.add_argument("--count", type=int, default=500)
+        parser.add_argument("--processes", type=int)
+
+    def _rows(self, count):
+        prefix = uuid4().hex[:8]
+        return [
+            {
+                "username": f"bench{prefix}{i}",
+                "email": f"bench{prefix}{i}@example.com",
+                "password": uuid4().hex,
+            }
+            for i in range(count)
+        ]
+
+    def _rolled_back(self, tenant, run, started=None):
+        started = perf_counter() if started is None else started
+        try:
+            with transaction.atomic(), transaction.atomic(using=tenant.database_alias):
+                run()
+                elapsed = perf_counter() - started
+                raise _Rollback
+        except _Rollback:
+            pass
+        return elapsed
+
+    def _per_request(self, tenant, rows):
+        with schema_context(tenant.schema_name):
+            for row in rows:
+                serializer = TenantUserCreateSerializer(data=row)
+                serializer.is_valid(raise_exception=True)
+                serializer.save()
+
+    def handle(self, *args, **options):
+        tenant = Tenant.objects.filter(schema_name=options["schema"]).first()
+        if tenant is None or not tenant.is_provisioned:
+            raise CommandError(f"No provisioned tenant '{options['schema']}'.")
+        count = options["count"]
+        processes = options["processes"] or settings.TENANT_USER_IMPORT_PROCESSES
+
+        per_request = self._rolled_back(
+            tenant, lambda: self._per_request(tenant, self._rows(count))
+        )
+
+        cold_rows = list(enumerate(self._rows(count), start=1))
+        warm_rows = list(enumerate(self._rows(count), start=1))
+        started = perf_counter()
+        with hasher_pool(processes) as pool:
+            # workers are spawned (and run django.setup()) on the first batch
+            cold = self._rolled_back(
+                tenant, lambda: import_users(tenant, cold_rows, pool), started=started
+            )
+            warm = self._rolled_back(tenant, lambda: import_users(tenant, warm_rows, pool))
+
+        alias = tenant.database_alias
+        where = "" if alias == DEFAULT_DB_ALIAS else f" on {alias}"
+        self.stdout.write(f"{count} users in {tenant.schema_name}{where}")
+        self.stdout.write(f"  per-request: {per_request:.2f}s ({count / per_request:.0f} users/s)")
+        for label, elapsed in (("cold pool", cold), ("warm pool", warm)):
+            self.stdout.write(
+                f"  bulk import, {label}: {elapsed:.2f}s ({count / elapsed:.0f} users/s, "
+                f"{per_request / elapsed:.1f}x, {processes} processes)"
+            )
@@ -0,0 +1,46 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from control_plane.user_import import (
+    BATCH_SIZE,
+    IMPORT_FORMATS,
+    detect_format,
+    hasher_pool,
+    import_users,
+    read_rows,
+)
+from tenants.models import Tenant
+
+
+class Command(BaseCommand):
+    help = "Bulk-create a tenant's users from a CSV (with header) or NDJSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("schema", type=str)
+        parser.add_argument("path", type=str)
+        parser.add_argument("--file-format", choices=IMPORT_FORMATS)
+        parser.add_argument(
+            "--processes",
+            type=int,
+            help="Hashing processes (default: TENANT_USER_IMPORT_PROCESSES)",
+        )
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        tenant = Tenant.objects.filter(schema_name=options["schema"]).first()
+        if tenant is None or not tenant.is_provisioned:
+            raise CommandError(f"No provisioned tenant '{options['schema']}'.")
+
+        file_format = options["file_format"] or detect_format(options["path"])
+        with open(options["path"], "rb") as stream, hasher_pool(options["processes"]) as pool:
+            result = import_users(
+                tenant, read_rows(stream, file_format), pool, batch_size=options["batch_size"]
+            )
+
+        for error in result["errors"]:
+            self.stderr.write(json.dumps(error))
+        summary = f"Created {result['created']} user(s), {result['failed']} row(s) failed"
+        self.stdout.write(
+            self.style.ERROR(summary) if result["failed"] else self.style.SUCCESS(summary)
+        )
@@ -4,7 +4,11 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
-from tenants.models import Domain, Tenant
+from src.libs.export import EXPORT_COMPRESSIONS, EXPORT_FORMATS
+from tenants import pool
+from tenants.models import Tenant, TenantUserStats, UserDirectoryEntry
+from tenants.placement import least_loaded_database
+from tenants.resolution import invalidate_tenant
 from tenants.validators import RESERVED_SUBDOMAINS, subdomain_validator
 
 User = get_user_model()
@@ -18,6 +22,8 @@ class TenantListSerializer(serializers.ModelSerializer):
             "name",
             "subdomain",
             "is_active",
+            "database_alias",
+            "provisioning_status",
             "created_at",
             "activated_at",
             "suspended_at",
@@ -32,6 +38,8 @@ class TenantRetrieveSerializer(serializers.ModelSerializer):
             "name",
             "subdomain",
             "is_active",
+            "database_alias",
+            "provisioning_status",
             "created_at",
             "activated_at",
             "suspended_at",
@@ -60,16 +68,16 @@ class TenantCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         subdomain = validated_data["subdomain"]
 
+        # Only the public row is written here; the schema comes from the warm
+        # pool when one is available, otherwise the provisioning pipeline
+        # creates the schema, migrations, domain and seed data.
         tenant = Tenant.objects.create(
             **validated_data,
             schema_name=subdomain,
+            database_alias=least_loaded_database(),
+            provisioning_status=Tenant.ProvisioningStatus.PENDING,
         )
-
-        Domain.objects.create(
-            tenant=tenant,
-            domain=f"{subdomain}.{settings.PRIMARY_DOMAIN_SUFFIX}",
-            is_primary=True,
-        )
+        pool.assign(tenant)
 
         if tenant.is_active:
             tenant.activate()
@@ -88,9 +96,11 @@ class TenantPatchSerializer(serializers.ModelSerializer):
         new_subdomain = validated_data.get("subdomain")
 
         if new_subdomain and new_subdomain != instance.subdomain:
-            domain = instance.domains.get(is_primary=True)
-            domain.domain = f"{new_subdomain}.{settings.PRIMARY_DOMAIN_SUFFIX}"
-            domain.save()
+            # Tenants still provisioning get their domain from the pipeline.
+            domain = instance.domains.filter(is_primary=True).first()
+            if domain is not None:
+                domain.domain = f"{new_subdomain}.{settings.PRIMARY_DOMAIN_SUFFIX}"
+                domain.save()
 
             instance.subdomain = new_subdomain
 
@@ -106,9 +116,105 @@ class TenantPatchSerializer(serializers.ModelSerializer):
             else:
                 instance.suspend()
 
+        invalidate_tenant(instance)
         return instance
 
 
+class TenantProvisioningSerializer(serializers.ModelSerializer):
+    status = serializers.CharField(source="provisioning_status", read_only=True)
+    error = serializers.CharField(source="provisioning_error", read_only=True)
+    updated_at = serializers.DateTimeField(source="provisioning_updated_at", read_only=True)
+
+    class Meta:
+        model = Tenant
+        fields: ClassVar[tuple[str, ...]] = (
+            "id",
+            "name",
+            "subdomain",
+            "status",
+            "error",
+            "updated_at",
+        )
+
+
+class TenantMoveSerializer(serializers.Serializer):
+    database = serializers.CharField(max_length=63)
+
+    def validate_database(self, value):
+        if value not in settings.TENANT_DATABASES:
+            raise serializers.ValidationError("Unknown tenant database.")
+        if value == self.context["tenant"].database_alias:
+            raise serializers.ValidationError("Tenant is already on this database.")
+        return value
+
+
+class BulkSelectionSerializer(serializers.Serializer):
+    """Rows selected by explicit `ids`, or by the list filters (`q`, `status`)."""
+
+    subject = "rows"
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False
+    )
+    q = serializers.CharField(required=False, allow_blank=True)
+
+    def validate(self, attrs):
+        if not (attrs.get("ids") or attrs.get("q", "").strip() or attrs.get("status")):
+            raise serializers.ValidationError(
+                f"Select {self.subject} by ids or by a q/status filter."
+            )
+        return attrs
+
+
+class TenantBulkLifecycleSerializer(BulkSelectionSerializer):
+    subject = "clients"
+
+    action = serializers.ChoiceField(choices=("activate", "suspend"))
+    status = serializers.ChoiceField(choices=("active", "suspended"), required=False)
+
+
+class ExportQuerySerializer(serializers.Serializer):
+    file_format = serializers.ChoiceField(choices=EXPORT_FORMATS, default="csv")
+    compression = serializers.ChoiceField(choices=EXPORT_COMPRESSIONS, required=False)
+
+
+class TenantUserStatsSerializer(serializers.ModelSerializer):
+    tenant_id = serializers.IntegerField(read_only=True)
+    tenant_name = serializers.CharField(source="tenant.name", read_only=True)
+
+    class Meta:
+        model = TenantUserStats
+        fields: ClassVar[tuple[str, ...]] = (
+            "tenant_id",
+            "tenant_name",
+            "total",
+            "active",
+            "staff",
+            "admins",
+            "collected_at",
+        )
+
+
+class UserDirectoryEntrySerializer(serializers.ModelSerializer):
+    tenant_id = serializers.IntegerField(read_only=True)
+    tenant_name = serializers.CharField(source="tenant.name", read_only=True)
+    tenant_subdomain = serializers.CharField(source="tenant.subdomain", read_only=True)
+
+    class Meta:
+        model = UserDirectoryEntry
+        fields: ClassVar[tuple[str, ...]] = (
+            "tenant_id",
+            "tenant_name",
+            "tenant_subdomain",
+            "user_id",
+            "username",
+            "email",
+            "is_active",
+            "is_staff",
+            "updated_at",
+        )
+
+
 class TenantUserListSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -174,13 +280,29 @@ class TenantUserCreateSerializer(serializers.ModelSerializer):
         validated_data["is_staff"] = validated_data.get("is_staff", True) or validated_data.get(
             "is_superuser", False
         )
-        user = User.objects.create(**validated_data)
+        # One INSERT: the post_save directory sync then runs once per user.
+        user = User(**validated_data)
         user.set_password(password)
-
         user.save()
         return user
 
 
+USER_IMPORT_FORMATS = ("csv", "ndjson")
+
+
+class TenantUserImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    # default: from the file extension (.csv, .ndjson / .jsonl)
+    file_format = serializers.ChoiceField(choices=USER_IMPORT_FORMATS, required=False)
+
+
+class TenantUserBulkStatusSerializer(BulkSelectionSerializer):
+    subject = "users"
+
+    action = serializers.ChoiceField(choices=("activate", "deactivate"))
+    status = serializers.ChoiceField(choices=("active", "disabled"), required=False)
+
+
 class TenantUserPatchSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, required=False, allow_blank=False)
 
@@ -5,6 +5,7 @@ from control_plane.views import (
     LoginAPIView,
     TenantUserViewset,
     TenantViewset,
+    UserDirectoryViewset,
 )
 
 app_name = "control_plane"
@@ -12,6 +13,7 @@ app_name = "control_plane"
 router = DefaultRouter(trailing_slash=False)
 
 router.register("clients", TenantViewset)
+router.register("user-directory", UserDirectoryViewset)
 
 urlpatterns = [
     path(
@@ -19,6 +21,21 @@ urlpatterns = [
         TenantUserViewset.as_view({"get": "list", "post": "create"}),
         name="tenant-user-list",
     ),
+    path(
+        "clients/<int:client_id>/users/import",
+        TenantUserViewset.as_view({"post": "bulk_import"}),
+        name="tenant-user-import",
+    ),
+    path(
+        "clients/<int:client_id>/users/export",
+        TenantUserViewset.as_view({"get": "export"}),
+        name="tenant-user-export",
+    ),
+    path(
+        "clients/<int:client_id>/users/bulk-status",
+        TenantUserViewset.as_view({"post": "bulk_status"}),
+        name="tenant-user-bulk-status",
+    ),
     path(
         "clients/<int:client_id>/users/<int:pk>",
         TenantUserViewset.as_view(
@@ -0,0 +1,217 @@
+import atexit
+import csv
+import io
+import json
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from itertools import batched
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import DatabaseError, transaction
+from django_tenants.utils import schema_context
+
+from control_plane.serializers import USER_IMPORT_FORMATS, TenantUserCreateSerializer
+from tenants import directory, user_stats
+
+# Bulk tenant user import: rows are validated in batches, passwords are hashed
+# in a process pool (Argon2 is CPU-bound and deliberately slow) and users are
+# inserted with bulk_create. bulk_create sends no post_save, so the user
+# directory and user stats are updated here instead of by signals.
+
+IMPORT_FORMATS = USER_IMPORT_FORMATS
+BATCH_SIZE = 500
+
+
+def detect_format(filename, default="csv"):
+    suffix = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if suffix in ("ndjson", "jsonl"):
+        return "ndjson"
+    if suffix == "csv":
+        return "csv"
+    return default
+
+
+def read_rows(stream, file_format):
+    """Yield (row number, dict) from a binary CSV (with header) or NDJSON stream."""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if file_format == "csv":
+        for number, row in enumerate(csv.DictReader(text), start=2):
+            # empty cells mean "use the default", not an empty value
+            yield number, {key: value for key, value in row.items() if key and value != ""}
+        return
+
+    for number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield number, exc
+            continue
+        yield number, row if isinstance(row, dict) else ValueError("Expected a JSON object.")
+
+
+# Unique user fields, with the filter matching the model's uniqueness rule
+# (emails only need to be unique among non-archived users).
+UNIQUE_FIELDS = {"username": {}, "email": {"is_archived": False}}
+
+
+def _validate(batch, seen):
+    """
+    Split `batch` into (valid rows, errors). `seen` maps each unique field to
+    the values already accepted from earlier batches of the same file.
+    """
+    valid, errors = [], []
+    for number, row in batch:
+        if isinstance(row, Exception):
+            errors.append({"row": number, "errors": {"non_field_errors": [str(row)]}})
+            continue
+
+        serializer = TenantUserCreateSerializer(data=row)
+        if not serializer.is_valid():
+            errors.append({"row": number, "errors": serializer.errors})
+            continue
+
+        data = serializer.validated_data
+        duplicates = {
+            field: [f"Duplicate {field} in this file."]
+            for field in UNIQUE_FIELDS
+            if data[field] in seen[field]
+        }
+        if duplicates:
+            errors.append({"row": number, "errors": duplicates})
+            continue
+        for field in UNIQUE_FIELDS:
+            seen[field].add(data[field])
+        valid.append((number, data))
+
+    taken = {
+        field: set(
+            get_user_model()
+            .objects.filter(**{f"{field}__in": [data[field] for _, data in valid]}, **conditions)
+            .values_list(field, flat=True)
+        )
+        for field, conditions in UNIQUE_FIELDS.items()
+    }
+    accepted = []
+    for number, data in valid:
+        conflicts = {
+            field: [f"A user with that {field} already exists."]
+            for field in UNIQUE_FIELDS
+            if data[field] in taken[field]
+        }
+        if conflicts:
+            errors.append({"row": number, "errors": conflicts})
+        else:
+            accepted.append((number, data))
+    return accepted, errors
+
+
+def _build_user(data, password_hash):
+    data = dict(data)
+    data.pop("password")
+    # same default as TenantUserCreateSerializer.create
+    data["is_staff"] = data.get("is_staff", True) or data.get("is_superuser", False)
+    return get_user_model()(**data, password=password_hash)
+
+
+def hasher_pool(processes=None):
+    """Process pool for `make_password`; spawned workers only need settings."""
+    return ProcessPoolExecutor(
+        max_workers=processes or settings.TENANT_USER_IMPORT_PROCESSES,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=django.setup,
+    )
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def _discard_shared_pool(pool):
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is pool:
+            _shared_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@contextmanager
+def shared_hasher_pool():
+    """
+    This process's long-lived `hasher_pool()`, started by the first import.
+    Each spawned worker runs django.setup(), which costs more than hashing a
+    typical upload, so web workers reuse one pool instead of starting their
+    own per request. Every web worker holds its own pool, so it is capped at
+    TENANT_USER_IMPORT_WEB_PROCESSES. A pool that broke (a worker died) is
+    replaced next time.
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = hasher_pool(settings.TENANT_USER_IMPORT_WEB_PROCESSES)
+        pool = _shared_pool
+    try:
+        yield pool
+    except BrokenProcessPool:
+        _discard_shared_pool(pool)
+        raise
+
+
+@atexit.register
+def shutdown_shared_hasher_pool():
+    """Stop this process's shared pool; also usable from gunicorn's `worker_exit`."""
+    pool = _shared_pool
+    if pool is not None:
+        _discard_shared_pool(pool)
+
+
+def import_users(tenant, rows, pool=None, batch_size=BATCH_SIZE):
+    """
+    Create `tenant`'s users from `rows` ((row number, dict) pairs, see
+    `read_rows`). Each batch is validated, hashed in `pool` (a
+    `hasher_pool()`; hashed inline when None) and inserted in its own
+    transaction. Returns {"created": n, "failed": n, "errors": [...]}.
+    """
+    created, errors = 0, []
+    seen = {field: set() for field in UNIQUE_FIELDS}
+    flags = []
+    with schema_context(tenant.schema_name):
+        for batch in batched(rows, batch_size):
+            valid, batch_errors = _validate(batch, seen)
+            errors.extend(batch_errors)
+            if not valid:
+                continue
+
+            passwords = [data["password"] for _, data in valid]
+            hashes = (
+                pool.map(make_password, passwords, chunksize=16)
+                if pool is not None
+                else map(make_password, passwords)
+            )
+            users = [
+                _build_user(data, hashed) for (_, data), hashed in zip(valid, hashes, strict=True)
+            ]
+            try:
+                with transaction.atomic(using=tenant.database_alias):
+                    users = get_user_model().objects.bulk_create(users)
+            except DatabaseError as exc:
+                errors.extend(
+                    {"row": number, "errors": {"non_field_errors": [str(exc)]}}
+                    for number, _ in valid
+                )
+                continue
+
+            directory.sync_users(tenant.pk, users, using=tenant.database_alias)
+            flags.extend(user_stats.user_flags(user) for user in users)
+            created += len(users)
+
+    user_stats.apply_user_deltas(tenant.pk, user_stats.creation_deltas(flags))
+    errors.sort(key=lambda error: error["row"])
+    return {"created": created, "failed": len(errors), "errors": errors}
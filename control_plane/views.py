@@ -1,46 +1,99 @@
 import json
-from datetime import timedelta
 from functools import wraps
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.paginator import Paginator
 from django.db import transaction
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseBadRequest
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.loader import render_to_string
 from django.urls import reverse
-from django.utils import timezone
+from django.utils.functional import cached_property
 from django.views.decorators.http import require_POST
 from django_tenants.utils import schema_context
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.generics import CreateAPIView
+from rest_framework.mixins import ListModelMixin
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
-from rest_framework.viewsets import ModelViewSet
+from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
 from control_plane.auth import PLATFORM_JWT_COOKIE, PlatformJWTAuthentication, login_user
 from control_plane.forms import TenantForm, TenantUserForm
 from control_plane.permissions import IsPlatformUser
 from control_plane.serializers import (
+    ExportQuerySerializer,
     LoginSerializer,
+    TenantBulkLifecycleSerializer,
     TenantCreateSerializer,
     TenantListSerializer,
+    TenantMoveSerializer,
     TenantPatchSerializer,
+    TenantProvisioningSerializer,
     TenantRetrieveSerializer,
+    TenantUserBulkStatusSerializer,
     TenantUserCreateSerializer,
+    TenantUserImportSerializer,
     TenantUserListSerializer,
     TenantUserPatchSerializer,
     TenantUserRetrieveSerializer,
+    TenantUserStatsSerializer,
+    UserDirectoryEntrySerializer,
 )
 from control_plane.throttling import PlatformAdminThrottle
+from control_plane.user_import import detect_format, import_users, read_rows, shared_hasher_pool
+from src.libs.export import stream_export
+from src.libs.pagination import CursorOrOffsetPagination, StreamingListMixin, keyset_page
+from src.libs.search import trigram_search
 from src.user.throttling import LoginThrottle
-from tenants.models import Domain, Tenant
+from tenants import directory, lifecycle, provisioning, user_stats
+from tenants import stats as tenant_stats
+from tenants.models import Domain, Tenant, TenantUserStats, UserDirectoryEntry
+from tenants.resolution import invalidate_tenant
+from tenants.tasks import move_tenant_task, provision_tenant, refill_tenant_pool
 
 User = get_user_model()
 
+TENANT_ORDERING = ("is_active", "-created_at", "id")
+TENANT_USER_ORDERING = ("-is_superuser", "-is_staff", "-is_active", "username")
+TENANT_USER_ROW_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "phone_no",
+    "is_staff",
+    "is_superuser",
+    "is_active",
+)
+TENANT_USER_EXPORT_FIELDS = (*TENANT_USER_ROW_FIELDS, "date_joined", "last_login")
+TENANT_EXPORT_FIELDS = (
+    "id",
+    "name",
+    "subdomain",
+    "schema_name",
+    "database_alias",
+    "is_active",
+    "provisioning_status",
+    "created_at",
+    "activated_at",
+    "suspended_at",
+)
+TENANT_USER_PAGE_SIZE = 50
+TENANT_SEARCH_FIELDS = ("name", "subdomain")
+TENANT_USER_SEARCH_FIELDS = ("username", "email")
+
+
+def _provisioning_url(request, tenant):
+    return request.build_absolute_uri(
+        reverse("control_plane:tenant-provisioning", args=[tenant.pk])
+    )
+
 
 def _tenant_domain_name(subdomain):
     return f"{subdomain}.{settings.PRIMARY_DOMAIN_SUFFIX}"
@@ -57,17 +110,18 @@ def _tenant_queryset(request):
     queryset = (
         Tenant.objects.exclude(schema_name="public")
         .prefetch_related("domains")
-        .order_by(
-            "is_active",
-            "-created_at",
-        )
+        .order_by(*TENANT_ORDERING)
     )
 
-    query = request.GET.get("q", "").strip()
-    status_filter = request.GET.get("status", "").strip()
+    return _filter_tenants(queryset, request.GET.get("q", ""), request.GET.get("status", ""))
+
+
+def _filter_tenants(queryset, query, status_filter):
+    query = query.strip()
+    status_filter = status_filter.strip()
 
     if query:
-        queryset = queryset.filter(name__icontains=query)
+        queryset = trigram_search(queryset, query, TENANT_SEARCH_FIELDS)
 
     if status_filter == "active":
         queryset = queryset.filter(is_active=True)
@@ -77,15 +131,48 @@ def _tenant_queryset(request):
     return queryset
 
 
-def _tenant_stats(tenant_queryset):
-    return {
-        "total": tenant_queryset.count(),
-        "active": tenant_queryset.filter(is_active=True).count(),
-        "suspended": tenant_queryset.filter(is_active=False).count(),
-        "recent": tenant_queryset.filter(
-            created_at__gte=timezone.now() - timedelta(days=30)
-        ).count(),
-    }
+EXPORT_PARAMETERS = [
+    OpenApiParameter("file_format", str, enum=["csv", "ndjson"], description="Default: csv"),
+    OpenApiParameter("compression", str, enum=["gzip"], description="Gzip the download"),
+    OpenApiParameter("q", str),
+    OpenApiParameter("status", str),
+]
+
+
+def _export_response(request, queryset, fields, filename):
+    params = ExportQuerySerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    return stream_export(
+        queryset,
+        fields,
+        params.validated_data["file_format"],
+        filename,
+        compression=params.validated_data.get("compression"),
+    )
+
+
+def _tenant_filters_applied(request):
+    return bool(request.GET.get("q", "").strip() or request.GET.get("status", "").strip())
+
+
+def _tenant_stats(request, tenant_queryset):
+    # Unfiltered pages read the cached fleet rollup; filtered ones need a
+    # single conditional aggregate over the filtered queryset.
+    if _tenant_filters_applied(request):
+        return tenant_stats.compute_stats(tenant_queryset)
+    return tenant_stats.get_stats()
+
+
+class KnownCountPaginator(Paginator):
+    """Paginator that trusts a count computed elsewhere instead of running COUNT(*)."""
+
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self._known_count = count
+
+    @cached_property
+    def count(self):
+        return self._known_count
 
 
 def _tenant_querystring(request):
@@ -95,27 +182,74 @@ def _tenant_querystring(request):
     return f"?{querystring}" if querystring else ""
 
 
-def _tenant_user_queryset(tenant):
+def _tenant_user_page(tenant, cursor=None):
+    # Plain dict rows keyed on the directory ordering: memory and latency
+    # stay flat however many users the schema holds.
     with schema_context(tenant.schema_name):
-        return list(
-            User.objects.all().order_by(
-                "-is_superuser",
-                "-is_staff",
-                "-is_active",
-                "username",
-            )
+        return keyset_page(
+            User.objects.values(*TENANT_USER_ROW_FIELDS),
+            TENANT_USER_ORDERING,
+            cursor=cursor,
+            page_size=TENANT_USER_PAGE_SIZE,
         )
 
 
 def _tenant_user_stats(tenant):
-    with schema_context(tenant.schema_name):
-        queryset = User.objects.all()
-        return {
-            "total": queryset.count(),
-            "active": queryset.filter(is_active=True).count(),
-            "staff": queryset.filter(is_staff=True).count(),
-            "admins": queryset.filter(is_superuser=True).count(),
-        }
+    if not tenant.is_provisioned:
+        # no schema to count yet
+        return dict.fromkeys(user_stats.USER_STATS_FIELDS, 0)
+    return user_stats.get_user_stats(tenant)
+
+
+def _record_user_change(tenant, before, user):
+    after = user_stats.user_flags(user) if user is not None else None
+    user_stats.apply_user_deltas(tenant.pk, user_stats.user_deltas(before, after))
+
+
+def _filter_tenant_users(queryset, query, status_filter):
+    query = query.strip()
+    status_filter = status_filter.strip()
+
+    if query:
+        queryset = trigram_search(queryset, query, TENANT_USER_SEARCH_FIELDS)
+
+    if status_filter == "active":
+        queryset = queryset.filter(is_active=True)
+    elif status_filter == "disabled":
+        queryset = queryset.filter(is_active=False)
+
+    return queryset
+
+
+def _bulk_user_queryset(queryset, data):
+    queryset = _filter_tenant_users(queryset, data.get("q", ""), data.get("status", ""))
+    if data.get("ids"):
+        queryset = queryset.filter(pk__in=data["ids"])
+    return queryset
+
+
+def _set_users_active(tenant, queryset, is_active):
+    """
+    Activate (or deactivate) every user of `queryset` in the tenant's schema
+    with one UPDATE. Returns the matched user ids and the changed users
+    (loaded with the user row fields).
+    """
+    with schema_context(tenant.schema_name), transaction.atomic(using=tenant.database_alias):
+        rows = list(queryset.order_by("id").select_for_update().values_list("id", "is_active"))
+        matched = [user_id for user_id, _ in rows]
+        changed_ids = [user_id for user_id, active in rows if active != is_active]
+        if not changed_ids:
+            return matched, []
+
+        changed = User.objects.filter(pk__in=changed_ids)
+        changed.update(is_active=is_active)
+        users = list(changed.only(*TENANT_USER_ROW_FIELDS).order_by(*TENANT_USER_ORDERING))
+        # update() skips post_save, so mirror the change explicitly.
+        directory.sync_users(tenant.pk, users, using=tenant.database_alias)
+
+    delta = len(users) if is_active else -len(users)
+    user_stats.apply_user_deltas(tenant.pk, {"active": delta})
+    return matched, users
 
 
 def _render_tenant_form(request, form, api_url, api_method, success_message):
@@ -190,13 +324,21 @@ def _modal_form_error_response(request, template_name, context):
     return response
 
 
-class TenantViewset(ModelViewSet):
+class TenantViewset(StreamingListMixin, ModelViewSet):
     permission_classes = (IsPlatformUser,)
     authentication_classes = (PlatformJWTAuthentication,)
     throttle_classes = (PlatformAdminThrottle,)
     serializer_class = TenantListSerializer
     queryset = Tenant.objects.exclude(schema_name="public")
     http_method_names = ("head", "options", "get", "post", "patch")
+    pagination_class = CursorOrOffsetPagination
+    count_strategy = "cached"
+
+    @property
+    def cursor_ordering(self):
+        if getattr(self, "action", None) == "user_stats_snapshot":
+            return ("tenant_id",)
+        return TENANT_ORDERING
 
     def get_serializer_class(self):
         if self.request.method == "GET":
@@ -211,31 +353,17 @@ class TenantViewset(ModelViewSet):
         return super().get_serializer_class()
 
     def get_queryset(self):
-        raise ValueError("Hey bibek")
         queryset = (
             Tenant.objects.exclude(schema_name="public")
             .prefetch_related("domains")
-            .order_by(
-                "is_active",
-                "-created_at",
-            )
+            .order_by(*TENANT_ORDERING)
         )
 
         if getattr(self, "action", None) != "list":
             return queryset
 
-        query = self.request.query_params.get("q", "").strip()
-        status_filter = self.request.query_params.get("status", "").strip()
-
-        if query:
-            queryset = queryset.filter(name__icontains=query)
-
-        if status_filter == "active":
-            queryset = queryset.filter(is_active=True)
-        elif status_filter == "suspended":
-            queryset = queryset.filter(is_active=False)
-
-        return queryset
+        params = self.request.query_params
+        return _filter_tenants(queryset, params.get("q", ""), params.get("status", ""))
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -243,10 +371,18 @@ class TenantViewset(ModelViewSet):
 
         with transaction.atomic():
             tenant = serializer.save()
-
-        out_serializer = TenantRetrieveSerializer(tenant, context={"request": request})
-        headers = self.get_success_headers(out_serializer.data)
-        return Response(out_serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+            if tenant.is_provisioned:
+                # Claimed from the warm pool; top it back up.
+                transaction.on_commit(refill_tenant_pool.delay)
+            else:
+                transaction.on_commit(lambda: provision_tenant(tenant.pk))
+
+        out_serializer = TenantProvisioningSerializer(tenant, context={"request": request})
+        headers = {"Location": _provisioning_url(request, tenant)}
+        response_status = (
+            status.HTTP_201_CREATED if tenant.is_provisioned else status.HTTP_202_ACCEPTED
+        )
+        return Response(out_serializer.data, status=response_status, headers=headers)
 
     @transaction.atomic
     def update(self, request, *args, **kwargs):
@@ -266,13 +402,104 @@ class TenantViewset(ModelViewSet):
         tenant.suspend()
         return Response({"message": "Account deactivated successfully."}, status=status.HTTP_200_OK)
 
+    @extend_schema(request=TenantBulkLifecycleSerializer)
+    @action(detail=False, methods=["post"], url_path="bulk-lifecycle")
+    def bulk_lifecycle(self, request):
+        serializer = TenantBulkLifecycleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        queryset = _filter_tenants(
+            Tenant.objects.exclude(schema_name="public"), data.get("q", ""), data.get("status", "")
+        )
+        if data.get("ids"):
+            queryset = queryset.filter(pk__in=data["ids"])
+
+        result = lifecycle.set_active(queryset, is_active=data["action"] == "activate")
+        summary = {
+            "action": data["action"],
+            "matched": len(result.matched),
+            "updated": len(result.updated),
+            "unchanged": len(result.matched) - len(result.updated),
+        }
+        if data.get("ids"):
+            summary["not_found"] = sorted(set(data["ids"]) - set(result.matched))
+        return Response(summary, status=status.HTTP_200_OK)
+
+    @extend_schema(parameters=EXPORT_PARAMETERS, responses=OpenApiTypes.BINARY)
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        params = request.query_params
+        queryset = _filter_tenants(
+            Tenant.objects.exclude(schema_name="public").order_by(*TENANT_ORDERING),
+            params.get("q", ""),
+            params.get("status", ""),
+        )
+        return _export_response(request, queryset, TENANT_EXPORT_FIELDS, "clients")
+
+    @extend_schema(responses=TenantUserStatsSerializer(many=True))
+    @action(detail=False, methods=["get"], url_path="user-stats")
+    def user_stats_snapshot(self, request):
+        queryset = (
+            TenantUserStats.objects.select_related("tenant")
+            .exclude(tenant__schema_name="public")
+            .order_by("tenant_id")
+        )
+        page = self.paginate_queryset(queryset)
+        serializer = TenantUserStatsSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @extend_schema(responses=TenantProvisioningSerializer)
+    @action(detail=True, methods=["get"])
+    def provisioning(self, request, pk=None):
+        tenant = self.get_object()
+        return Response(TenantProvisioningSerializer(tenant).data)
+
+    @extend_schema(request=None, responses=TenantProvisioningSerializer)
+    @provisioning.mapping.post
+    def retry_provisioning(self, request, pk=None):
+        tenant = self.get_object()
+        if tenant.provisioning_status != Tenant.ProvisioningStatus.FAILED:
+            return Response(
+                {"error": "Only failed provisioning can be retried."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        # Like create: the status flips with this request's transaction and the
+        # pipeline is only queued once that has committed.
+        provisioning.set_status(tenant.pk, Tenant.ProvisioningStatus.PENDING)
+        transaction.on_commit(lambda: provision_tenant(tenant.pk))
+        tenant.refresh_from_db()
+        return Response(
+            TenantProvisioningSerializer(tenant).data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Location": _provisioning_url(request, tenant)},
+        )
+
+    @extend_schema(request=TenantMoveSerializer)
+    @action(detail=True, methods=["post"])
+    def move(self, request, pk=None):
+        tenant = self.get_object()
+        serializer = TenantMoveSerializer(data=request.data, context={"tenant": tenant})
+        serializer.is_valid(raise_exception=True)
 
-class TenantUserViewset(ModelViewSet):
+        database = serializer.validated_data["database"]
+        move_tenant_task.delay(tenant.pk, database)
+        return Response(
+            {"message": f"Moving tenant to '{database}'. It is suspended until the copy finishes."},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class TenantUserViewset(StreamingListMixin, ModelViewSet):
     permission_classes = (IsPlatformUser,)
     authentication_classes = (PlatformJWTAuthentication,)
     throttle_classes = (PlatformAdminThrottle,)
     http_method_names = ("get", "post", "patch", "head", "options")
     serializer_class = TenantUserListSerializer
+    pagination_class = CursorOrOffsetPagination
+    cursor_ordering = TENANT_USER_ORDERING
+    count_strategy = "estimated"
 
     def get_tenant(self):
         if not hasattr(self, "_tenant"):
@@ -286,28 +513,13 @@ class TenantUserViewset(ModelViewSet):
         if getattr(self, "swagger_fake_view", False):
             return User.objects.none()
 
-        queryset = User.objects.filter(is_staff=True).order_by(
-            "-is_superuser",
-            "-is_staff",
-            "-is_active",
-            "username",
-        )
+        queryset = User.objects.filter(is_staff=True).order_by(*TENANT_USER_ORDERING)
 
         if self.action != "list":
             return queryset
 
-        query = self.request.query_params.get("q", "").strip()
-        status_filter = self.request.query_params.get("status", "").strip()
-
-        if query:
-            queryset = queryset.filter(username__icontains=query)
-
-        if status_filter == "active":
-            queryset = queryset.filter(is_active=True)
-        elif status_filter == "disabled":
-            queryset = queryset.filter(is_active=False)
-
-        return queryset
+        params = self.request.query_params
+        return _filter_tenant_users(queryset, params.get("q", ""), params.get("status", ""))
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -323,12 +535,15 @@ class TenantUserViewset(ModelViewSet):
     def perform_create(self, serializer):
         tenant = self.get_tenant()
         with schema_context(tenant.schema_name):
-            serializer.save()
+            user = serializer.save()
+        _record_user_change(tenant, None, user)
 
     def perform_update(self, serializer):
         tenant = self.get_tenant()
+        before = user_stats.user_flags(serializer.instance)
         with schema_context(tenant.schema_name):
-            serializer.save()
+            user = serializer.save()
+        _record_user_change(tenant, before, user)
 
     def list(self, request, *args, **kwargs):
         tenant = self.get_tenant()
@@ -360,6 +575,86 @@ class TenantUserViewset(ModelViewSet):
         with schema_context(tenant.schema_name):
             return super().destroy(request, *args, **kwargs)
 
+    @extend_schema(request={"multipart/form-data": TenantUserImportSerializer})
+    def bulk_import(self, request, *args, **kwargs):
+        tenant = self.get_tenant()
+        if not tenant.is_provisioned:
+            return Response(
+                {"error": "Client is still being provisioned."}, status=status.HTTP_409_CONFLICT
+            )
+
+        serializer = TenantUserImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data["file"]
+        file_format = serializer.validated_data.get("file_format") or detect_format(upload.name)
+
+        with shared_hasher_pool() as pool:
+            result = import_users(tenant, read_rows(upload.file, file_format), pool)
+
+        response_status = (
+            status.HTTP_201_CREATED if result["created"] else status.HTTP_400_BAD_REQUEST
+        )
+        return Response(result, status=response_status)
+
+    @extend_schema(parameters=EXPORT_PARAMETERS, responses=OpenApiTypes.BINARY)
+    def export(self, request, *args, **kwargs):
+        tenant = self.get_tenant()
+        params = request.query_params
+        with schema_context(tenant.schema_name):
+            queryset = _filter_tenant_users(
+                User.objects.filter(is_staff=True).order_by(*TENANT_USER_ORDERING),
+                params.get("q", ""),
+                params.get("status", ""),
+            )
+            return _export_response(
+                request, queryset, TENANT_USER_EXPORT_FIELDS, f"{tenant.schema_name}-users"
+            )
+
+    @extend_schema(request=TenantUserBulkStatusSerializer)
+    def bulk_status(self, request, *args, **kwargs):
+        tenant = self.get_tenant()
+        serializer = TenantUserBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        matched, users = _set_users_active(
+            tenant,
+            _bulk_user_queryset(User.objects.filter(is_staff=True), data),
+            is_active=data["action"] == "activate",
+        )
+        summary = {
+            "action": data["action"],
+            "matched": len(matched),
+            "updated": len(users),
+            "unchanged": len(matched) - len(users),
+        }
+        if data.get("ids"):
+            summary["not_found"] = sorted(set(data["ids"]) - set(matched))
+        return Response(summary, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter("q", str, description="Username or email (prefix or fuzzy)"),
+        OpenApiParameter("client", int, description="Only this client's users"),
+    ]
+)
+class UserDirectoryViewset(ListModelMixin, GenericViewSet):
+    """Cross-client user lookup, served from the public user directory."""
+
+    permission_classes = (IsPlatformUser,)
+    authentication_classes = (PlatformJWTAuthentication,)
+    throttle_classes = (PlatformAdminThrottle,)
+    serializer_class = UserDirectoryEntrySerializer
+    queryset = UserDirectoryEntry.objects.all()
+
+    def get_queryset(self):
+        queryset = UserDirectoryEntry.objects.select_related("tenant")
+        client_id = self.request.query_params.get("client", "").strip()
+        if client_id.isdigit():
+            queryset = queryset.filter(tenant_id=client_id)
+        return directory.search(self.request.query_params.get("q", ""), queryset)
+
 
 class LoginAPIView(CreateAPIView):
     authentication_classes = ()
@@ -422,7 +717,8 @@ def accounts_logout(request):
 @platform_admin_required
 def tenants_list_page(request):
     tenants_queryset = _tenant_queryset(request)
-    paginator = Paginator(tenants_queryset, 10)
+    stats = _tenant_stats(request, tenants_queryset)
+    paginator = KnownCountPaginator(tenants_queryset, 10, count=stats["total"])
     page_number = request.GET.get("page", 1)
     page_obj = paginator.get_page(page_number)
     total_clients = paginator.count
@@ -438,7 +734,7 @@ def tenants_list_page(request):
         {
             "tenants": page_obj.object_list,
             "form": TenantForm(),
-            "stats": _tenant_stats(tenants_queryset),
+            "stats": stats,
             "query": request.GET.get("q", "").strip(),
             "status_filter": request.GET.get("status", "").strip(),
             "page_obj": page_obj,
@@ -455,7 +751,8 @@ def dashboard_page(request):
         request,
         "control_plane/dashboard.html",
         {
-            "stats": _tenant_stats(tenants),
+            "stats": _tenant_stats(request, tenants),
+            "user_totals": user_stats.fleet_totals(),
         },
     )
 
@@ -484,7 +781,7 @@ def tenant_create(request):
         form,
         reverse("control_plane:tenant-list"),
         "POST",
-        "Client created successfully.",
+        "Client created. Provisioning has started.",
     )
 
 
@@ -527,6 +824,8 @@ def tenant_update(request, pk):
                 else:
                     tenant.suspend()
 
+            invalidate_tenant(tenant)
+
         return redirect(reverse("tenants-list"))
 
     return _render_tenant_form(
@@ -623,13 +922,15 @@ def tenant_action_confirm(request, pk, action):
 @platform_admin_required
 def tenant_users_page(request, tenant_pk):
     tenant = get_object_or_404(Tenant, pk=tenant_pk)
+    users, next_cursor = _tenant_user_page(tenant)
     return render(
         request,
         "control_plane/users_list.html",
         {
             "tenant": tenant,
             "form": TenantUserForm(),
-            "users": _tenant_user_queryset(tenant),
+            "users": users,
+            "next_cursor": next_cursor,
             "stats": _tenant_user_stats(tenant),
         },
     )
@@ -638,12 +939,24 @@ def tenant_users_page(request, tenant_pk):
 @platform_admin_required
 def tenant_users_list_partial(request, tenant_pk):
     tenant = get_object_or_404(Tenant, pk=tenant_pk)
-    users = _tenant_user_queryset(tenant)
+    cursor = request.GET.get("cursor")
+    try:
+        users, next_cursor = _tenant_user_page(tenant, cursor)
+    except ValueError:
+        return HttpResponseBadRequest("Invalid cursor.")
+
+    # "Load more" requests only need the next rows, not the whole table.
+    template_name = (
+        "control_plane/partials/user_rows.html"
+        if cursor
+        else "control_plane/partials/users_table.html"
+    )
     return render(
         request,
-        "control_plane/partials/users_table.html",
+        template_name,
         {
             "users": users,
+            "next_cursor": next_cursor,
             "tenant": tenant,
         },
     )
@@ -657,7 +970,8 @@ def tenant_user_create_view(request, tenant_pk):
         form = TenantUserForm(request.POST)
         if form.is_valid():
             with schema_context(tenant.schema_name):
-                form.save(commit=True)
+                user = form.save(commit=True)
+            _record_user_change(tenant, None, user)
             return redirect(reverse("tenant-users", args=[tenant_pk]))
 
     form = TenantUserForm()
@@ -696,11 +1010,13 @@ def tenant_user_update(request, tenant_pk, pk):
     with schema_context(tenant.schema_name):
         user = get_object_or_404(User, pk=pk)
 
+    before = user_stats.user_flags(user)
     form = TenantUserForm(request.POST, instance=user)
 
     if form.is_valid():
         with schema_context(tenant.schema_name):
             user = form.save(commit=True)
+        _record_user_change(tenant, before, user)
 
         if request.headers.get("HX-Request"):
             return _htmx_success_response(
@@ -773,14 +1089,44 @@ def tenant_user_action_confirm(request, tenant_pk, pk, action):
     )
 
 
+@platform_admin_required
+@require_POST
+def tenant_users_bulk_status(request, tenant_pk):
+    tenant = get_object_or_404(Tenant, pk=tenant_pk)
+    serializer = TenantUserBulkStatusSerializer(data=request.POST)
+    if not serializer.is_valid():
+        return HttpResponseBadRequest("Select at least one user.")
+
+    data = serializer.validated_data
+    is_active = data["action"] == "activate"
+    _, users = _set_users_active(tenant, _bulk_user_queryset(User.objects.all(), data), is_active)
+
+    if request.headers.get("HX-Request"):
+        # Out-of-band rows: each replaces the row with the same id in place.
+        body = "".join(
+            render_to_string(
+                "control_plane/partials/user_row.html",
+                {"user": user, "tenant": tenant, "swap_oob": True},
+                request=request,
+            )
+            for user in users
+        )
+        verb = "activated" if is_active else "disabled"
+        message = f"{len(users)} user(s) {verb}." if users else "No users needed changes."
+        return _htmx_success_response(body, message=message)
+    return redirect(reverse("tenant-users", args=[tenant_pk]))
+
+
 @platform_admin_required
 @require_POST
 def tenant_user_activate(request, tenant_pk, pk):
     tenant = get_object_or_404(Tenant, pk=tenant_pk)
     with schema_context(tenant.schema_name):
         user = get_object_or_404(User, pk=pk)
+        before = user_stats.user_flags(user)
         user.is_active = True
         user.save()
+    _record_user_change(tenant, before, user)
 
     if request.headers.get("HX-Request"):
         return _htmx_success_response(
@@ -800,8 +1146,10 @@ def tenant_user_deactivate(request, tenant_pk, pk):
     tenant = get_object_or_404(Tenant, pk=tenant_pk)
     with schema_context(tenant.schema_name):
         user = get_object_or_404(User, pk=pk)
+        before = user_stats.user_flags(user)
         user.is_active = False
         user.save()
+    _record_user_change(tenant, before, user)
 
     if request.headers.get("HX-Request"):
         return _htmx_success_response(
@@ -100,6 +100,10 @@ class NoIndexMiddleware:
 class TenantStatusMiddleware:
     """
     Blocks suspended tenants globally.
+
+    Sits right after tenant resolution (and CORS), before sessions, CSRF and
+    authentication, so a suspended tenant is answered from the cached tenant
+    status without any database or cache round-trip.
     """
 
     def __init__(self, get_response):
@@ -1,4 +1,188 @@
-from rest_framework.pagination import LimitOffsetPagination, PageNumberPagination, _positive_int
+import base64
+import binascii
+import hashlib
+import json
+from datetime import datetime
+from itertools import batched
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, connections, transaction
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.utils.dateparse import parse_datetime
+from django_tenants.utils import schema_context
+from djangorestframework_camel_case.settings import api_settings as camel_settings
+from djangorestframework_camel_case.util import camelize
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    LimitOffsetPagination,
+    PageNumberPagination,
+    _positive_int,
+)
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+from rest_framework.utils.urls import replace_query_param
+
+# Datetimes travel as {"$datetime": isoformat} so they come back as
+# datetimes with their microseconds: DjangoJSONEncoder cuts them to
+# milliseconds, and a keyset filter on the shortened value skips rows.
+_DATETIME_KEY = "$datetime"
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        if isinstance(o, datetime):
+            return {_DATETIME_KEY: o.isoformat()}
+        return super().default(o)
+
+
+def _decode_cursor_object(obj):
+    if obj.keys() != {_DATETIME_KEY}:
+        return obj
+    raw = obj[_DATETIME_KEY]
+    value = parse_datetime(raw) if isinstance(raw, str) else None
+    if value is None:
+        raise ValueError("Invalid cursor datetime.")
+    return value
+
+
+def encode_cursor(values):
+    """Opaque, URL-safe token for a list of keyset values."""
+    payload = json.dumps(values, cls=_CursorEncoder, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Inverse of `encode_cursor`; raises ValueError for a tampered token."""
+    try:
+        values = json.loads(
+            base64.urlsafe_b64decode(cursor.encode()), object_hook=_decode_cursor_object
+        )
+    except (binascii.Error, ValueError) as exc:
+        # ValueError covers JSONDecodeError, UnicodeError and bad datetimes
+        raise ValueError("Invalid cursor.") from exc
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor.")
+    return values
+
+
+def keyset_filter(ordering, values):
+    """
+    Q matching rows strictly after `values` in `ordering`, e.g.
+    ("-is_superuser", "username") -> is_superuser < a OR
+    (is_superuser = a AND username > b). The last field must be unique.
+    """
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, values, strict=True):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= equal & Q(**{f"{name}__{lookup}": value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def _row_value(row, field):
+    name = field.lstrip("-")
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def keyset_page(queryset, ordering, cursor=None, page_size=50):
+    """
+    One page of `queryset` in `ordering`, starting after `cursor`.
+
+    Returns `(rows, next_cursor)`; `next_cursor` is None on the last page.
+    Cost per page is constant: an index range scan of `page_size + 1` rows
+    instead of OFFSET scanning and COUNT(*).
+    """
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        queryset = queryset.filter(keyset_filter(ordering, decode_cursor(cursor)))
+
+    rows = list(queryset[: page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    return rows, encode_cursor([_row_value(rows[-1], field) for field in ordering])
+
+
+def snapshot_batches(queryset, chunk_size=2000):
+    """
+    Generator of `chunk_size` row batches from `queryset`.
+
+    Rows are read through `iterator(chunk_size)` (a server-side cursor unless
+    DISABLE_SERVER_SIDE_CURSORS), so memory stays flat however many rows there
+    are. Streaming generators run after the view returns, so the tenant schema
+    and database alias are captured here.
+    """
+    schema_name = connection.schema_name
+    queryset = queryset.using(queryset.db)
+
+    def _batches():
+        # One transaction: a consistent snapshot, and the cursor (and SET LOCAL
+        # search_path) survive PgBouncer transaction pooling.
+        with schema_context(schema_name), transaction.atomic(using=queryset.db):
+            yield from batched(queryset.iterator(chunk_size=chunk_size), chunk_size)
+
+    return _batches()
+
+
+def stream_json_array(queryset, serialize, chunk_size=2000):
+    """
+    StreamingHttpResponse emitting `queryset` as a camelCased JSON array,
+    serialized one row at a time (see `snapshot_batches`).
+    """
+    ensure_ascii = not api_settings.UNICODE_JSON
+
+    def _encode(obj):
+        data = camelize(serialize(obj), **camel_settings.JSON_UNDERSCOREIZE)
+        return json.dumps(data, cls=encoders.JSONEncoder, ensure_ascii=ensure_ascii)
+
+    def _chunks(batches):
+        separator = "["
+        for rows in batches:
+            yield separator + ",".join(_encode(obj) for obj in rows)
+            separator = ","
+        yield "[]" if separator == "[" else "]"
+
+    return StreamingHttpResponse(
+        _chunks(snapshot_batches(queryset, chunk_size)), content_type="application/json"
+    )
+
+
+COUNT_STRATEGIES = ("exact", "estimated", "cached", "none")
+COUNT_CACHE_KEY = "pagination-count:{digest}"
+
+
+def estimate_count(queryset):
+    """Planner row estimate for `queryset` (EXPLAIN; reltuples-based)."""
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def cached_count(queryset, timeout):
+    """
+    Exact COUNT(*) for `queryset`, cached for `timeout` seconds per tenant
+    schema and filter signature (the compiled SQL and its parameters).
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    signature = f"{connection.schema_name}:{queryset.db}:{sql}:{params!r}"
+    key = COUNT_CACHE_KEY.format(digest=hashlib.sha256(signature.encode()).hexdigest())
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout=timeout)
+    return count
 
 
 class CustomLimitOffsetPagination(LimitOffsetPagination):
@@ -8,20 +192,71 @@ class CustomLimitOffsetPagination(LimitOffsetPagination):
     Overrides the `paginate_queryset` method to return the full queryset
     when the limit query parameter is set to 0. This behavior differs from
     the default LimitOffsetPagination which returns an empty list for limit=0.
+    Views using `StreamingListMixin` stream `limit=0` as a bare JSON array
+    instead of building the whole page in memory.
+
+    Views pick how `count` is computed with `count_strategy`:
+        "exact": COUNT(*) on every request (default).
+        "estimated": the planner estimate when it exceeds
+            `count_estimate_threshold`, an exact count below it.
+        "cached": an exact count cached for `count_cache_timeout` seconds.
+        "none": no count; the page is probed for a next row instead.
+    Responses carry `count_exact` so clients know when `count` is approximate.
 
     Methods:
         paginate_queryset(queryset, request, view=None): Paginates the given queryset
             based on the request parameters, returning the full queryset if limit=0.
+        get_streaming_response(queryset, serialize): Streams the full queryset.
     """
 
+    stream_chunk_size = 2000
+    count_strategy = "exact"
+    count_estimate_threshold = 10_000
+    count_cache_timeout = 30
+
+    def wants_stream(self, request, view=None):
+        return request.query_params.get(self.limit_query_param) == "0"
+
+    def get_streaming_response(self, queryset, serialize):
+        return stream_json_array(queryset, serialize, chunk_size=self.stream_chunk_size)
+
+    def get_count_strategy(self, request, view):
+        if self.wants_stream(request, view):
+            # limit=0 outside a streaming view: the count is the page size
+            return "exact"
+        strategy = getattr(view, "count_strategy", None) or self.count_strategy
+        assert strategy in COUNT_STRATEGIES, f"Unknown count strategy {strategy!r}."
+        return strategy
+
+    def get_counted(self, queryset, strategy):
+        """`(count, count_exact)` for `queryset` under `strategy`."""
+        if strategy == "none":
+            return None, False
+        if strategy == "cached":
+            return cached_count(queryset, self.count_cache_timeout), True
+        if strategy == "estimated":
+            estimate = estimate_count(queryset)
+            if estimate > self.count_estimate_threshold:
+                return estimate, False
+        return self.get_count(queryset), True
+
     def paginate_queryset(self, queryset, request, view=None):
-        self.count = self.get_count(queryset)
+        strategy = self.get_count_strategy(request, view)
+        self.count, self.count_exact = self.get_counted(queryset, strategy)
         self.limit = self.get_limit(request, self.count)
         if self.limit is None:
             return None
 
         self.offset = self.get_offset(request)
         self.request = request
+
+        if strategy != "exact":
+            # Cached or estimated counts can drift; probe for the next row.
+            rows = list(queryset[self.offset : self.offset + self.limit + 1])
+            self.has_next = len(rows) > self.limit
+            return rows[: self.limit]
+
+        self.has_next = self.offset + self.limit < self.count
         if self.count > self.limit and self.template is not None:
             self.display_page_controls = True
 
@@ -29,6 +264,34 @@ class CustomLimitOffsetPagination(LimitOffsetPagination):
             return []
         return list(queryset[self.offset : self.offset + self.limit])
 
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.count,
+                "count_exact": self.count_exact,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"]["nullable"] = True
+        response_schema["properties"]["count_exact"] = {
+            "type": "boolean",
+            "description": "False when `count` is a planner estimate or omitted.",
+        }
+        return response_schema
+
     def get_limit(self, request, count):
         if self.limit_query_param:
             try:
@@ -47,3 +310,173 @@ class CustomLimitOffsetPagination(LimitOffsetPagination):
 
 class CustomPageNumberPagination(PageNumberPagination):
     page_size = 1000
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Opaque-cursor pagination over the view's `cursor_ordering`.
+
+    The ordering must end in a unique field, e.g. ("is_active", "-created_at",
+    "id"). Responses carry `next` and `results` only: there is no COUNT(*),
+    and page 10,000 costs the same index range scan as page 1.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "limit"
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = 1000
+    ordering = None
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_ordering(self, view):
+        ordering = getattr(view, "cursor_ordering", None) or self.ordering
+        assert ordering, (
+            f"{view.__class__.__name__} must set `cursor_ordering` to use {self.__class__.__name__}."
+        )
+        return ordering
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        try:
+            rows, self.next_cursor = keyset_page(
+                queryset,
+                self.get_ordering(view),
+                cursor=request.query_params.get(self.cursor_query_param),
+                page_size=self.get_page_size(request),
+            )
+        except (ValueError, DjangoValidationError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+        return rows
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque cursor from the previous page's `next` link.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class CursorOrOffsetPagination(BasePagination):
+    """
+    Limit/offset pagination, or `KeysetCursorPagination` when the request asks
+    for it with `?pagination=cursor` (or carries a `cursor`). Views opt into
+    cursor mode by default with `pagination_mode = "cursor"`.
+    """
+
+    mode_query_param = "pagination"
+    offset_class = CustomLimitOffsetPagination
+    cursor_class = KeysetCursorPagination
+
+    def __init__(self):
+        self.offset_paginator = self.offset_class()
+        self.cursor_paginator = self.cursor_class()
+        self.active = self.offset_paginator
+
+    def get_mode(self, request, view):
+        mode = request.query_params.get(self.mode_query_param)
+        if mode in ("cursor", "offset"):
+            return mode
+        if self.cursor_paginator.cursor_query_param in request.query_params:
+            return "cursor"
+        return getattr(view, "pagination_mode", "offset")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.get_mode(request, view) == "cursor":
+            self.active = self.cursor_paginator
+        else:
+            self.active = self.offset_paginator
+        return self.active.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.active.get_paginated_response(data)
+
+    def wants_stream(self, request, view=None):
+        if self.get_mode(request, view) != "offset":
+            return False
+        return self.offset_paginator.wants_stream(request, view)
+
+    def get_streaming_response(self, queryset, serialize):
+        return self.offset_paginator.get_streaming_response(queryset, serialize)
+
+    def get_paginated_response_schema(self, schema):
+        return self.offset_paginator.get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = [
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Pagination mode: `offset` (default) or `cursor`.",
+                "schema": {"type": "string", "enum": ["offset", "cursor"]},
+            },
+            *self.offset_paginator.get_schema_operation_parameters(view),
+        ]
+        names = {parameter["name"] for parameter in parameters}
+        parameters += [
+            parameter
+            for parameter in self.cursor_paginator.get_schema_operation_parameters(view)
+            if parameter["name"] not in names
+        ]
+        return parameters
+
+
+class StreamingListMixin:
+    """
+    `list()` that hands `?limit=0` to the paginator's streaming response
+    instead of serializing the whole queryset into one payload.
+    """
+
+    def list(self, request, *args, **kwargs):
+        paginator = self.paginator
+        wants_stream = getattr(paginator, "wants_stream", None)
+        if wants_stream is None or not wants_stream(request, self):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        return paginator.get_streaming_response(
+            queryset,
+            lambda obj: serializer_class(obj, context=context).data,
+        )
@@ -0,0 +1,36 @@
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import Q
+from django.db.models.functions import Greatest
+
+SEARCH_RANK = "search_rank"
+
+# pg_trgm cannot index a pattern shorter than one trigram.
+MIN_TRIGRAM_QUERY = 3
+
+
+def trigram_search(queryset, query, fields):
+    """
+    Rows of `queryset` matching `query` on any of `fields`, best match first.
+
+    A row matches when `query` is word-similar to a field (`%>`, at
+    pg_trgm.word_similarity_threshold), which the fields' `gin_trgm_ops`
+    indexes serve without a sequential scan. Queries too short for trigrams
+    fall back to a substring match. Results are annotated with `search_rank`
+    and ordered by it, then by the queryset's existing ordering.
+    """
+    query = query.strip()
+    if not query:
+        return queryset
+
+    lookup = "trigram_word_similar" if len(query) >= MIN_TRIGRAM_QUERY else "icontains"
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f"{field}__{lookup}": query})
+
+    similarities = [TrigramWordSimilarity(query, field) for field in fields]
+    rank = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+    return (
+        queryset.filter(condition)
+        .annotate(**{SEARCH_RANK: rank})
+        .order_by(f"-{SEARCH_RANK}", *queryset.query.order_by)
+    )
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 05:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('user', '0003_alter_permission_options_alter_user_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['-is_superuser', '-is_staff', '-is_active', 'username'], name='user_directory_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-18 05:17
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, so with
+    # DB_SEARCH_PATH_MODE=transaction it cannot be scoped to a schema either:
+    # run migrations in session mode (see docs/tenant-management.md).
+    atomic = False
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("user", "0004_user_user_directory_idx"),
+    ]
+
+    operations = [
+        # In public, so tenant schemas (search_path "<tenant>, public") see the
+        # operator classes on every cluster.
+        migrations.RunSQL(
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public",
+            migrations.RunSQL.noop,
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=GinIndex(fields=["username"], name="user_username_trgm", opclasses=["gin_trgm_ops"]),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=GinIndex(fields=["email"], name="user_email_trgm", opclasses=["gin_trgm_ops"]),
+        ),
+    ]
@@ -5,6 +5,7 @@ from django.conf import settings
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import PermissionsMixin
+from django.contrib.postgres.indexes import GinIndex
 
 # Django Imports
 from django.db import models
@@ -251,6 +252,16 @@ class User(AbstractBaseUser, PermissionsMixin):
                 name="unique_email_active_user",
             ),
         )
+        indexes = (
+            # user directory / cursor pagination order
+            models.Index(
+                fields=["-is_superuser", "-is_staff", "-is_active", "username"],
+                name="user_directory_idx",
+            ),
+            # control-plane search (src.libs.search)
+            GinIndex(fields=["username"], name="user_username_trgm", opclasses=["gin_trgm_ops"]),
+            GinIndex(fields=["email"], name="user_email_trgm", opclasses=["gin_trgm_ops"]),
+        )
 
     def clean(self):
         super().clean()
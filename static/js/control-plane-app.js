@@ -309,52 +309,54 @@
     });
   }
 
-  function bindActionMenus() {
-    function resetMenuPlacement(menu) {
-      const panel = menu.querySelector("[data-action-menu-panel]");
-      if (!panel) {
-        return;
-      }
-
-      panel.classList.remove("bottom-full", "mb-2", "top-auto", "mt-0");
-      panel.classList.add("top-full", "mt-2");
+  function resetMenuPlacement(menu) {
+    const panel = menu.querySelector("[data-action-menu-panel]");
+    if (!panel) {
+      return;
     }
 
-    function flipMenuIfNeeded(menu) {
-      const panel = menu.querySelector("[data-action-menu-panel]");
-      if (!panel) {
-        return;
-      }
+    panel.classList.remove("bottom-full", "mb-2", "top-auto", "mt-0");
+    panel.classList.add("top-full", "mt-2");
+  }
 
-      resetMenuPlacement(menu);
+  function flipMenuIfNeeded(menu) {
+    const panel = menu.querySelector("[data-action-menu-panel]");
+    if (!panel) {
+      return;
+    }
 
-      requestAnimationFrame(function () {
-        const bounds = panel.getBoundingClientRect();
-        const viewportHeight = window.innerHeight;
+    resetMenuPlacement(menu);
 
-        if (bounds.bottom > viewportHeight - 12 && bounds.top > bounds.height + 12) {
-          panel.classList.remove("top-full", "mt-2");
-          panel.classList.add("bottom-full", "mb-2", "top-auto", "mt-0");
-        }
-      });
-    }
+    requestAnimationFrame(function () {
+      const bounds = panel.getBoundingClientRect();
+      const viewportHeight = window.innerHeight;
 
-    document.querySelectorAll("details[data-action-menu]").forEach(function (menu) {
-      menu.addEventListener("toggle", function () {
-        if (menu.open) {
-          document.querySelectorAll("details[data-action-menu]").forEach(function (otherMenu) {
-            if (otherMenu !== menu) {
-              otherMenu.removeAttribute("open");
-              resetMenuPlacement(otherMenu);
-            }
-          });
+      if (bounds.bottom > viewportHeight - 12 && bounds.top > bounds.height + 12) {
+        panel.classList.remove("top-full", "mt-2");
+        panel.classList.add("bottom-full", "mb-2", "top-auto", "mt-0");
+      }
+    });
+  }
 
-          flipMenuIfNeeded(menu);
-        } else {
-          resetMenuPlacement(menu);
-        }
-      });
+  function bindActionMenu(menu) {
+    menu.addEventListener("toggle", function () {
+      if (menu.open) {
+        document.querySelectorAll("details[data-action-menu]").forEach(function (otherMenu) {
+          if (otherMenu !== menu) {
+            otherMenu.removeAttribute("open");
+            resetMenuPlacement(otherMenu);
+          }
+        });
+
+        flipMenuIfNeeded(menu);
+      } else {
+        resetMenuPlacement(menu);
+      }
     });
+  }
+
+  function bindActionMenus() {
+    document.querySelectorAll("details[data-action-menu]").forEach(bindActionMenu);
 
     document.addEventListener("click", function (event) {
       const activeMenu = event.target.closest("details[data-action-menu]");
@@ -367,6 +369,172 @@
     });
   }
 
+  function bindLoadMore() {
+    // Keyset "load more": the partial returns the next rows plus a fresh
+    // load-more row, which replace the clicked row in place.
+    document.addEventListener("click", function (event) {
+      const button = event.target.closest("[data-load-more-url]");
+      if (!button) {
+        return;
+      }
+
+      event.preventDefault();
+      const row = button.closest("[data-load-more-row]");
+      button.disabled = true;
+
+      fetch(button.dataset.loadMoreUrl, {
+        credentials: "same-origin",
+        headers: {
+          "HX-Request": "true",
+          "X-Requested-With": "XMLHttpRequest",
+        },
+      })
+        .then(function (response) {
+          if (!response.ok) {
+            throw new Error("Could not load more rows");
+          }
+          return response.text();
+        })
+        .then(function (html) {
+          const parent = row.parentElement;
+          const before = new Set(parent.querySelectorAll("details[data-action-menu]"));
+          row.insertAdjacentHTML("afterend", html);
+          row.remove();
+          parent.querySelectorAll("details[data-action-menu]").forEach(function (menu) {
+            if (!before.has(menu)) {
+              bindActionMenu(menu);
+            }
+          });
+        })
+        .catch(function () {
+          button.disabled = false;
+          showToast("More rows could not be loaded. Please try again.", "error");
+        });
+    });
+  }
+
+  function dispatchTriggers(response) {
+    // HX-Trigger: {"eventName": detail, ...} fired on <body>.
+    const header = response.headers.get("HX-Trigger");
+    if (!header) {
+      return;
+    }
+
+    Object.entries(JSON.parse(header)).forEach(function ([name, detail]) {
+      document.body.dispatchEvent(new CustomEvent(name, { detail: detail }));
+    });
+  }
+
+  function applyOutOfBandSwaps(html) {
+    // Elements marked hx-swap-oob replace the element with the same id.
+    const template = document.createElement("template");
+    template.innerHTML = html;
+    template.content.querySelectorAll("[hx-swap-oob]").forEach(function (element) {
+      const current = byId(element.id);
+      if (!current) {
+        return;
+      }
+
+      element.removeAttribute("hx-swap-oob");
+      current.replaceWith(element);
+      element.querySelectorAll("details[data-action-menu]").forEach(bindActionMenu);
+    });
+  }
+
+  function bindBulkUserStatus() {
+    const form = document.querySelector("form[data-bulk-status-form]");
+    if (!form) {
+      return;
+    }
+
+    document.addEventListener("change", function (event) {
+      const selectAll = event.target.closest("[data-select-all-users]");
+      if (!selectAll) {
+        return;
+      }
+
+      document.querySelectorAll("[data-user-select]").forEach(function (checkbox) {
+        checkbox.checked = selectAll.checked;
+      });
+    });
+
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      const body = new FormData(form, event.submitter);
+      if (!body.has("ids")) {
+        showToast("Select at least one user.", "error");
+        return;
+      }
+
+      const buttons = form.querySelectorAll('[type="submit"]');
+      buttons.forEach(function (button) {
+        button.disabled = true;
+      });
+
+      fetch(form.action, {
+        method: "POST",
+        credentials: "same-origin",
+        body: body,
+        headers: {
+          "HX-Request": "true",
+          "X-Requested-With": "XMLHttpRequest",
+        },
+      })
+        .then(function (response) {
+          if (!response.ok) {
+            throw new Error("Bulk status update failed");
+          }
+          return response.text().then(function (html) {
+            applyOutOfBandSwaps(html);
+            dispatchTriggers(response);
+          });
+        })
+        .catch(function () {
+          showToast("The selected users could not be updated. Please try again.", "error");
+        })
+        .finally(function () {
+          buttons.forEach(function (button) {
+            button.disabled = false;
+          });
+          const selectAll = document.querySelector("[data-select-all-users]");
+          if (selectAll) {
+            selectAll.checked = false;
+          }
+        });
+    });
+  }
+
+  function bindProvisioningStatus() {
+    // New clients are provisioned in the background; poll their status and
+    // reload once the pipeline finishes (or fails).
+    const badges = document.querySelectorAll("[data-provisioning-url]");
+    if (!badges.length) {
+      return;
+    }
+
+    function poll() {
+      Promise.all(
+        Array.from(badges).map(function (badge) {
+          return requestJson(badge.dataset.provisioningUrl, { method: "GET" }).then(function (result) {
+            return result.data.status;
+          });
+        })
+      )
+        .then(function (statuses) {
+          if (statuses.some(function (status) { return status === "ready" || status === "failed"; })) {
+            window.location.reload();
+            return;
+          }
+          window.setTimeout(poll, 2000);
+        })
+        .catch(function () {
+          window.setTimeout(poll, 5000);
+        });
+    }
+
+    window.setTimeout(poll, 2000);
+  }
+
   function bindToastTriggers() {
     document.body.addEventListener("showToast", function (event) {
       const detail = event.detail || {};
@@ -462,6 +630,9 @@
   document.addEventListener("DOMContentLoaded", function () {
     bindSidebar();
     bindActionMenus();
+    bindLoadMore();
+    bindBulkUserStatus();
+    bindProvisioningStatus();
     bindToastTriggers();
     bindModalTriggers();
     bindLoginForm();
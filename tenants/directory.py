@@ -0,0 +1,144 @@
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import DEFAULT_DB_ALIAS, connection, transaction
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest, Lower
+from django_tenants.utils import get_public_schema_name
+
+from src.libs.search import MIN_TRIGRAM_QUERY, SEARCH_RANK
+from tenants import fleet
+from tenants.models import Tenant, UserDirectoryEntry
+
+# Public-schema user directory: one row per tenant user, kept in sync from
+# User saves/deletes (tenants.signals) and rebuilt with rebuild_user_directory.
+
+DIRECTORY_FIELDS = ("username", "email", "is_active", "is_staff")
+
+
+def current_tenant_id():
+    """Id of the tenant whose schema is active, or None in the public schema."""
+    schema_name = connection.schema_name
+    if not schema_name or schema_name == get_public_schema_name():
+        return None
+
+    tenant_id = getattr(connection.tenant, "pk", None)
+    if tenant_id is None:
+        # FakeTenant from schema_context()
+        tenant_id = (
+            Tenant.objects.using(DEFAULT_DB_ALIAS)
+            .filter(schema_name=schema_name)
+            .values_list("id", flat=True)
+            .first()
+        )
+    return tenant_id
+
+
+def entry_values(user):
+    return {
+        "username": user.username,
+        "email": (user.email or "").lower(),
+        "is_active": user.is_active,
+        "is_staff": user.is_staff,
+    }
+
+
+def sync_user(tenant_id, user):
+    UserDirectoryEntry.objects.update_or_create(
+        tenant_id=tenant_id, user_id=user.pk, defaults=entry_values(user)
+    )
+
+
+def sync_users(tenant_id, users, using):
+    """Bulk `sync_user` for users written without post_save (bulk_create)."""
+    entries = [
+        UserDirectoryEntry(tenant_id=tenant_id, user_id=user.pk, **entry_values(user))
+        for user in users
+    ]
+
+    def _upsert():
+        UserDirectoryEntry.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=["tenant", "user_id"],
+            update_fields=[*DIRECTORY_FIELDS, "updated_at"],
+        )
+
+    transaction.on_commit(_upsert, using=using)
+
+
+def remove_user(tenant_id, user_id):
+    UserDirectoryEntry.objects.filter(tenant_id=tenant_id, user_id=user_id).delete()
+
+
+def schedule_sync(user, using, deleted=False):
+    """Mirror `user` into the directory once its own transaction commits."""
+    tenant_id = current_tenant_id()
+    if tenant_id is None:
+        return
+
+    if deleted:
+        user_id = user.pk
+        transaction.on_commit(lambda: remove_user(tenant_id, user_id), using=using)
+    else:
+        transaction.on_commit(lambda: sync_user(tenant_id, user), using=using)
+
+
+def search(query, queryset=None):
+    """
+    Directory entries matching `query`: username or email prefix matches
+    first, then (for 3+ characters) trigram word-similar ones, best first.
+    """
+    queryset = UserDirectoryEntry.objects.all() if queryset is None else queryset
+    query = query.strip().lower()
+    if not query:
+        return queryset.none()
+
+    prefix = Q(username_lower__startswith=query) | Q(email__startswith=query)
+    queryset = queryset.annotate(username_lower=Lower("username"))
+    if len(query) < MIN_TRIGRAM_QUERY:
+        return queryset.filter(prefix).order_by("username_lower", "tenant_id")
+
+    similar = Q(username__trigram_word_similar=query) | Q(email__trigram_word_similar=query)
+    return (
+        queryset.filter(prefix | similar)
+        .annotate(
+            prefix_match=Case(
+                When(prefix, then=Value(1)), default=Value(0), output_field=IntegerField()
+            ),
+            **{
+                SEARCH_RANK: Greatest(
+                    TrigramWordSimilarity(query, "username"),
+                    TrigramWordSimilarity(query, "email"),
+                )
+            },
+        )
+        .order_by("-prefix_match", f"-{SEARCH_RANK}", "username_lower", "tenant_id")
+    )
+
+
+def _directory_sql():
+    table = connection.ops.quote_name(get_user_model()._meta.db_table)
+    return f"SELECT id AS user_id, {', '.join(DIRECTORY_FIELDS)} FROM {{schema}}.{table}"
+
+
+def rebuild(tenants=None):
+    """
+    Re-read every tenant's users through the fleet executor and replace that
+    tenant's directory rows. Returns {"tenants": n, "users": n, "failed": [...]}.
+    """
+    synced_tenants = synced_users = 0
+    failed = []
+    for result in fleet.query_schemas(_directory_sql(), tenants=tenants):
+        if result.error:
+            failed.append(result.schema_name)
+            continue
+
+        for row in result.value:
+            row["email"] = (row["email"] or "").lower()
+        entries = [UserDirectoryEntry(tenant_id=result.tenant_id, **row) for row in result.value]
+        with transaction.atomic():
+            UserDirectoryEntry.objects.filter(tenant_id=result.tenant_id).delete()
+            UserDirectoryEntry.objects.bulk_create(entries, batch_size=1000)
+        synced_tenants += 1
+        synced_users += len(entries)
+    return {"tenants": synced_tenants, "users": synced_users, "failed": failed}
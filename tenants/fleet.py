@@ -0,0 +1,204 @@
+import queue
+import threading
+from itertools import batched
+from time import monotonic
+from typing import Any, NamedTuple
+
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django_tenants.postgresql_backend.base import _check_schema_name
+from django_tenants.utils import get_public_schema_name
+
+from tenants.models import Tenant
+
+# Fleet executor: run one callable or SQL template against many tenant
+# schemas at once. Work is spread over a bounded set of threads, each holding
+# its own connection per cluster. Results are streamed back as schemas finish,
+# and every schema runs under its own statement timeout.
+
+
+class TenantResult(NamedTuple):
+    tenant_id: int
+    schema_name: str
+    value: Any
+    error: str
+    seconds: float
+
+
+_DONE = object()
+
+
+def fleet_tenants(queryset=None):
+    """Provisioned tenants (optionally narrowed by `queryset`) with what the executor needs."""
+    queryset = Tenant.objects.all() if queryset is None else queryset
+    return (
+        queryset.exclude(schema_name=get_public_schema_name())
+        .filter(provisioning_status=Tenant.ProvisioningStatus.READY)
+        .only("id", "schema_name", "database_alias")
+        .order_by("id")
+    )
+
+
+def _set_timeout(alias, timeout):
+    if timeout:
+        with connections[alias].cursor() as cursor:
+            # set_config(..., true) is SET LOCAL with a bindable value
+            cursor.execute(
+                "SELECT set_config('statement_timeout', %s, true)", [f"{timeout * 1000:.0f}"]
+            )
+
+
+def _error(exc):
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _run_one(func, tenant, timeout):
+    started = monotonic()
+    alias = tenant.database_alias
+    try:
+        # The tenant router follows the default connection to the tenant's
+        # cluster; raw SQL on connections[alias] needs the schema set too.
+        connection.set_tenant(tenant)
+        connections[alias].set_tenant(tenant)
+        with transaction.atomic(using=alias):
+            _set_timeout(alias, timeout)
+            value = func(tenant)
+    except Exception as exc:
+        return TenantResult(tenant.pk, tenant.schema_name, None, _error(exc), monotonic() - started)
+    finally:
+        connection.set_schema_to_public()
+        connections[alias].set_schema_to_public()
+    return TenantResult(tenant.pk, tenant.schema_name, value, "", monotonic() - started)
+
+
+def _worker(jobs, results, stop, run):
+    try:
+        while not stop.is_set():
+            try:
+                job = jobs.get_nowait()
+            except queue.Empty:
+                return
+            results.put(run(job))
+    finally:
+        # Connections are per thread; close this worker's before it exits.
+        connections.close_all()
+        results.put(_DONE)
+
+
+def _execute(jobs, run, max_workers):
+    """Feed `jobs` to at most `max_workers` threads, yielding results as they finish."""
+    pending = queue.Queue()
+    for job in jobs:
+        pending.put(job)
+    workers = min(max_workers, pending.qsize())
+    if not workers:
+        return
+
+    results = queue.Queue()
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=_worker, args=(pending, results, stop, run), daemon=True)
+        for _ in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        finished = 0
+        while finished < workers:
+            result = results.get()
+            if result is _DONE:
+                finished += 1
+            elif isinstance(result, list):
+                yield from result
+            else:
+                yield result
+    finally:
+        # A consumer that stops early leaves the remaining schemas unstarted.
+        stop.set()
+
+
+def run_in_schemas(func, tenants=None, max_workers=None, timeout=None):
+    """
+    Call `func(tenant)` with each tenant's schema active and yield a
+    `TenantResult` per tenant in completion order. Exceptions and statement
+    timeouts are reported in `error` instead of stopping the run.
+    """
+    tenants = fleet_tenants() if tenants is None else tenants
+    max_workers = max_workers or settings.TENANT_FLEET_MAX_WORKERS
+    timeout = settings.TENANT_FLEET_TIMEOUT if timeout is None else timeout
+    yield from _execute(tenants, lambda tenant: _run_one(func, tenant, timeout), max_workers)
+
+
+def _rows(cursor):
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
+
+
+def _schema_sql(sql, schema_name):
+    _check_schema_name(schema_name)
+    return sql.format(schema=connection.ops.quote_name(schema_name))
+
+
+def query_schemas(
+    sql, params=(), tenants=None, max_workers=None, timeout=None, union=False, batch_size=None
+):
+    """
+    Run the SQL template `sql` (tables qualified as `{schema}.table`) in every
+    tenant schema and yield a `TenantResult` whose value is the list of rows
+    as dicts.
+
+    With `union`, the per-schema statements are combined into one UNION ALL
+    query per cluster and batch of `batch_size` schemas. This cuts round
+    trips for cheap, schema-agnostic statements, but an error or timeout
+    fails the whole batch and is reported for each of its tenants.
+    """
+    tenants = list(fleet_tenants() if tenants is None else tenants)
+    max_workers = max_workers or settings.TENANT_FLEET_MAX_WORKERS
+    timeout = settings.TENANT_FLEET_TIMEOUT if timeout is None else timeout
+
+    if not union:
+
+        def query(tenant):
+            with connections[tenant.database_alias].cursor() as cursor:
+                cursor.execute(_schema_sql(sql, tenant.schema_name), params)
+                return _rows(cursor)
+
+        yield from run_in_schemas(query, tenants, max_workers, timeout)
+        return
+
+    batch_size = batch_size or settings.TENANT_FLEET_UNION_BATCH_SIZE
+    by_alias = {}
+    for tenant in tenants:
+        by_alias.setdefault(tenant.database_alias, []).append(tenant)
+    batches = [
+        (alias, batch)
+        for alias, members in by_alias.items()
+        for batch in batched(members, batch_size)
+    ]
+    yield from _execute(batches, lambda job: _run_union(sql, params, *job, timeout), max_workers)
+
+
+def _run_union(sql, params, alias, tenants, timeout):
+    started = monotonic()
+    union_params = [value for tenant in tenants for value in (tenant.pk, *params)]
+    try:
+        union_sql = " UNION ALL ".join(
+            f"SELECT %s AS fleet_tenant_id, fleet_q.* "
+            f"FROM ({_schema_sql(sql, tenant.schema_name)}) AS fleet_q"
+            for tenant in tenants
+        )
+        with transaction.atomic(using=alias):
+            _set_timeout(alias, timeout)
+            with connections[alias].cursor() as cursor:
+                cursor.execute(union_sql, union_params)
+                rows = _rows(cursor)
+    except Exception as exc:
+        seconds = monotonic() - started
+        return [TenantResult(t.pk, t.schema_name, None, _error(exc), seconds) for t in tenants]
+
+    seconds = monotonic() - started
+    grouped = {tenant.pk: [] for tenant in tenants}
+    for row in rows:
+        grouped[row.pop("fleet_tenant_id")].append(row)
+    return [TenantResult(t.pk, t.schema_name, grouped[t.pk], "", seconds) for t in tenants]
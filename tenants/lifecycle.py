@@ -0,0 +1,42 @@
+from typing import NamedTuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from tenants import stats
+from tenants.models import Tenant
+from tenants.resolution import invalidate_tenants
+
+# Bulk counterpart of Tenant.activate()/suspend(): one UPDATE for the whole
+# selection, one stats delta and one batched cache invalidation.
+
+
+class LifecycleResult(NamedTuple):
+    matched: list
+    updated: list
+
+
+def set_active(queryset, is_active):
+    """
+    Activate (or suspend) every tenant in `queryset`. Tenants already in that
+    state keep their timestamps. Returns the matched and updated tenant ids.
+    """
+    timestamp_field = "activated_at" if is_active else "suspended_at"
+
+    with transaction.atomic():
+        # Lock in id order so overlapping bulk runs cannot deadlock, and so a
+        # concurrent single activate/suspend cannot be counted twice.
+        rows = list(
+            queryset.order_by("id").select_for_update(of=("self",)).values_list("id", "is_active")
+        )
+        matched = [tenant_id for tenant_id, _ in rows]
+        updated = [tenant_id for tenant_id, active in rows if active != is_active]
+        if not updated:
+            return LifecycleResult(matched, updated)
+
+        changed = Tenant.objects.filter(pk__in=updated)
+        changed.update(is_active=is_active, **{timestamp_field: timezone.now()})
+        stats.record_status_change(is_active, count=len(updated))
+        invalidate_tenants(changed.prefetch_related("domains"))
+
+    return LifecycleResult(matched, updated)
@@ -0,0 +1,127 @@
+from time import perf_counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Max
+from django_tenants.utils import get_public_schema_name, schema_context
+
+from control_plane.views import TENANT_ORDERING, TENANT_USER_ORDERING
+from src.libs.pagination import encode_cursor, keyset_page
+from tenants.models import Tenant
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Compare limit/offset and cursor pagination latency at page 1 and a deep page"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target", choices=("tenants", "users"), default="tenants")
+        parser.add_argument("--schema", type=str, help="Tenant schema for --target users")
+        parser.add_argument("--page", type=int, default=10_000)
+        parser.add_argument("--page-size", type=int, default=10)
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Insert this many temporary rows first (rolled back afterwards)",
+        )
+
+    def _queryset(self, target):
+        if target == "tenants":
+            return Tenant.objects.exclude(schema_name=get_public_schema_name()), TENANT_ORDERING
+        return get_user_model().objects.all(), TENANT_USER_ORDERING
+
+    def _seed(self, target, count):
+        if target == "tenants":
+            start = (Tenant.objects.aggregate(start=Max("id"))["start"] or 0) + 1
+            # bulk_create skips Tenant.save(): no schemas are created
+            rows = (
+                Tenant(name=f"bench {i}", subdomain=f"bench-{i}", schema_name=f"bench_{i}")
+                for i in range(start, start + count)
+            )
+            Tenant.objects.bulk_create(rows, batch_size=5000)
+        else:
+            user_model = get_user_model()
+            start = (user_model.objects.aggregate(start=Max("id"))["start"] or 0) + 1
+            rows = (
+                user_model(username=f"bench{i}", password="!", email=f"bench{i}@example.com")
+                for i in range(start, start + count)
+            )
+            user_model.objects.bulk_create(rows, batch_size=5000)
+        connection.cursor().execute(f"ANALYZE {self._queryset(target)[0].model._meta.db_table}")
+
+    def _measure(self, fetch, iterations):
+        fetch()
+        started = perf_counter()
+        for _ in range(iterations):
+            fetch()
+        return (perf_counter() - started) / iterations * 1000
+
+    def _run(self, options):
+        target = options["target"]
+        if options["seed"]:
+            self._seed(target, options["seed"])
+
+        queryset, ordering = self._queryset(target)
+        page_size = options["page_size"]
+        total = queryset.count()
+        last_page = max(1, -(-total // page_size))
+        page = min(options["page"], last_page)
+        if page < options["page"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Only {total} rows ({last_page} pages); measuring page {page}. "
+                    "Use --seed for a deeper table."
+                )
+            )
+
+        # The cursor a client holds after walking to `page`: the last row of the previous page.
+        offset = (page - 1) * page_size
+        cursor = None
+        if offset:
+            fields = [field.lstrip("-") for field in ordering]
+            row = queryset.order_by(*ordering).values_list(*fields)[offset - 1]
+            cursor = encode_cursor(list(row))
+
+        def offset_page(start):
+            def fetch():
+                queryset.count()
+                return list(queryset.order_by(*ordering)[start : start + page_size])
+
+            return fetch
+
+        def cursor_page(token):
+            return lambda: keyset_page(queryset, ordering, cursor=token, page_size=page_size)
+
+        cases = (
+            ("limit/offset", "page 1", offset_page(0)),
+            ("limit/offset", f"page {page}", offset_page(offset)),
+            ("cursor", "page 1", cursor_page(None)),
+            ("cursor", f"page {page}", cursor_page(cursor)),
+        )
+
+        self.stdout.write(f"{target}: {total} rows, page size {page_size}")
+        self.stdout.write(f"{'mode':<16}{'page':<16}{'ms/request':>12}")
+        for mode, label, fetch in cases:
+            elapsed = self._measure(fetch, options["iterations"])
+            self.stdout.write(f"{mode:<16}{label:<16}{elapsed:>12.2f}")
+
+    def handle(self, *args, **options):
+        schema = get_public_schema_name()
+        if options["target"] == "users":
+            schema = options["schema"]
+            if not schema:
+                raise CommandError("--schema is required for --target users.")
+
+        with schema_context(schema):
+            try:
+                with transaction.atomic():
+                    self._run(options)
+                    raise _Rollback
+            except _Rollback:
+                pass
@@ -0,0 +1,59 @@
+from statistics import median
+from time import perf_counter
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+from django.test.utils import override_settings
+
+from tenants import provisioning, template
+from tenants.models import Tenant
+
+
+class Command(BaseCommand):
+    help = "Compare time-to-ready of template cloning against auto_create_schema"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=3)
+
+    def _auto_create_schema(self, name):
+        # Stock django-tenants path: save() creates and migrates the schema inline.
+        return Tenant.objects.create(name=name, subdomain=name, schema_name=name)
+
+    def _clone(self, name):
+        tenant = Tenant.objects.create(
+            name=name,
+            subdomain=name,
+            schema_name=name,
+            provisioning_status=Tenant.ProvisioningStatus.PENDING,
+        )
+        with override_settings(TENANT_PROVISIONING_MODE="clone"):
+            for step in provisioning.STEPS:
+                provisioning.run_step(tenant.pk, step)
+        return tenant
+
+    def _measure(self, create, iterations):
+        timings = []
+        for _ in range(iterations):
+            name = f"bench-{uuid4().hex[:12]}"
+            started = perf_counter()
+            tenant = create(name)
+            timings.append(perf_counter() - started)
+            tenant.delete(force_drop=True)
+        return timings
+
+    def handle(self, *args, **options):
+        if not template.template_is_current(DEFAULT_DB_ALIAS):
+            raise CommandError("Template schema is missing or behind; run rebuild_tenant_template.")
+
+        iterations = options["iterations"]
+        cases = (
+            ("auto_create_schema", self._auto_create_schema),
+            ("template clone pipeline", self._clone),
+        )
+
+        self.stdout.write(f"Creating {iterations} throwaway tenant(s) per mode")
+        self.stdout.write(f"{'mode':<28}{'median s':>10}{'max s':>10}")
+        for label, create in cases:
+            timings = self._measure(create, iterations)
+            self.stdout.write(f"{label:<28}{median(timings):>10.2f}{max(timings):>10.2f}")
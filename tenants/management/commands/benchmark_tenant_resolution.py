@@ -0,0 +1,51 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django_tenants.middleware import TenantMainMiddleware
+from django_tenants.utils import get_public_schema_name, get_tenant_domain_model
+
+from tenants.resolution import load_tenant, resolve_tenant, tenant_resolution_cache
+
+
+class Command(BaseCommand):
+    help = "Compare per-request tenant resolution cost against the stock django-tenants lookup"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", type=str, help="Hostname to resolve (default: any domain)")
+        parser.add_argument("--iterations", type=int, default=1000)
+
+    def _measure(self, resolve, hostname, iterations):
+        with CaptureQueriesContext(connection) as queries:
+            started = perf_counter()
+            for _ in range(iterations):
+                resolve(hostname)
+            elapsed = perf_counter() - started
+        return elapsed / iterations * 1_000_000, len(queries) / iterations
+
+    def handle(self, *args, **options):
+        domain_model = get_tenant_domain_model()
+        hostname = options["host"]
+        if not hostname:
+            domain = domain_model.objects.exclude(tenant__schema_name=get_public_schema_name())
+            hostname = domain.values_list("domain", flat=True).first()
+        if not hostname:
+            raise CommandError("No tenant domain found; pass --host.")
+
+        iterations = options["iterations"]
+        stock = TenantMainMiddleware(get_response=lambda request: None)
+        tenant_resolution_cache.clear()
+        resolve_tenant(hostname)
+
+        cases = (
+            ("stock (Domain join)", lambda host: stock.get_tenant(domain_model, host)),
+            ("load_tenant (uncached)", load_tenant),
+            ("resolve_tenant (warm cache)", resolve_tenant),
+        )
+
+        self.stdout.write(f"Resolving {hostname!r} x {iterations}")
+        self.stdout.write(f"{'strategy':<30}{'us/request':>12}{'queries/request':>18}")
+        for label, resolve in cases:
+            per_request, queries = self._measure(resolve, hostname, iterations)
+            self.stdout.write(f"{label:<30}{per_request:>12.1f}{queries:>18.2f}")
@@ -0,0 +1,68 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from tenants import fleet
+from tenants.models import Tenant
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a SQL template against every tenant schema and print one JSON line per tenant. "
+        'Qualify tenant tables with {schema}, e.g. "SELECT count(*) FROM {schema}.user_user".'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("sql", type=str)
+        parser.add_argument(
+            "--param", action="append", dest="params", default=[], help="Query parameter (%%s)"
+        )
+        parser.add_argument(
+            "--schema", action="append", dest="schemas", help="Only these tenants (repeatable)"
+        )
+        parser.add_argument(
+            "--database", action="append", dest="databases", help="Only this cluster (repeatable)"
+        )
+        parser.add_argument("--workers", type=int, help="Default: TENANT_FLEET_MAX_WORKERS")
+        parser.add_argument(
+            "--timeout", type=float, help="Per-schema seconds (default: TENANT_FLEET_TIMEOUT)"
+        )
+        parser.add_argument(
+            "--union",
+            action="store_true",
+            help="Combine schemas into one UNION ALL query per cluster batch",
+        )
+
+    def handle(self, *args, **options):
+        if "{schema}" not in options["sql"]:
+            raise CommandError("The SQL template must reference tenant tables as {schema}.table.")
+
+        queryset = Tenant.objects.all()
+        if options["schemas"]:
+            queryset = queryset.filter(schema_name__in=options["schemas"])
+        if options["databases"]:
+            queryset = queryset.filter(database_alias__in=options["databases"])
+
+        results = fleet.query_schemas(
+            options["sql"],
+            options["params"],
+            tenants=fleet.fleet_tenants(queryset),
+            max_workers=options["workers"],
+            timeout=options["timeout"],
+            union=options["union"],
+        )
+        total = failed = 0
+        for result in results:
+            total += 1
+            line = {"tenant_id": result.tenant_id, "schema_name": result.schema_name}
+            if result.error:
+                failed += 1
+                line["error"] = result.error
+            else:
+                line["rows"] = result.value
+            line["seconds"] = round(result.seconds, 3)
+            self.stdout.write(json.dumps(line, cls=DjangoJSONEncoder))
+
+        summary = f"{total - failed} of {total} schema(s) succeeded"
+        self.stderr.write(self.style.ERROR(summary) if failed else self.style.SUCCESS(summary))
@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from tenants import migration_runner
+
+
+def _duration(seconds):
+    return "--" if seconds is None else str(timedelta(seconds=round(seconds)))
+
+
+class Command(BaseCommand):
+    help = (
+        "Migrate tenant schemas concurrently, skipping schemas already at head and "
+        "resuming after failures (run `migrate_schemas --shared` first)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=settings.TENANT_MIGRATION_PROCESSES,
+            help="Schemas migrated at once (default: TENANT_MIGRATION_PROCESSES)",
+        )
+        parser.add_argument(
+            "--database",
+            action="append",
+            dest="databases",
+            help="Only migrate tenants placed on this cluster alias (repeatable)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Migrate every schema, including those recorded as already at head",
+        )
+
+    def handle(self, *args, **options):
+        if options["processes"] < 1:
+            raise CommandError("--processes must be at least 1.")
+
+        tenants = list(migration_runner.pending_tenants(options["databases"], options["force"]))
+        if not tenants:
+            self.stdout.write(self.style.SUCCESS("All tenant schemas are at head."))
+            return
+
+        total = len(tenants)
+        self.stdout.write(f"Migrating {total} schema(s) with {options['processes']} process(es)")
+
+        progress = migration_runner.Progress(total)
+        failed = []
+        for schema_name, error, seconds in migration_runner.run(tenants, options["processes"]):
+            progress.advance()
+            prefix = f"[{progress.completed:>{len(str(total))}}/{total}]"
+            stats = f"{progress.rate:.1f} schemas/s, ETA {_duration(progress.eta)}"
+            if error:
+                failed.append(schema_name)
+                self.stdout.write(
+                    self.style.ERROR(f"{prefix} {schema_name} failed: {error.splitlines()[0]}")
+                )
+            else:
+                self.stdout.write(f"{prefix} {schema_name} ok ({seconds:.1f}s) · {stats}")
+
+        if failed:
+            raise CommandError(
+                f"{len(failed)} of {total} schema(s) failed: {', '.join(failed)}. "
+                "Re-run the command to resume."
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Migrated {total} schema(s) at {progress.rate:.1f} schemas/s")
+        )
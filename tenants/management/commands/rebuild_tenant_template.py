@@ -0,0 +1,43 @@
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from tenants import template
+
+
+class Command(BaseCommand):
+    help = "Migrate and seed the tenant template schema on every cluster (run after deploys)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            action="append",
+            dest="databases",
+            help="Cluster alias to rebuild (repeatable; default: every TENANT_DATABASES alias)",
+        )
+        parser.add_argument(
+            "--fresh",
+            action="store_true",
+            help="Drop the template and build it from scratch instead of migrating it in place",
+        )
+
+    def handle(self, *args, **options):
+        databases = options["databases"] or settings.TENANT_DATABASES
+        unknown = set(databases) - set(settings.TENANT_DATABASES)
+        if unknown:
+            raise CommandError(f"Unknown tenant database(s): {', '.join(sorted(unknown))}")
+
+        for alias in databases:
+            started = perf_counter()
+            template.rebuild_template(
+                alias,
+                fresh=options["fresh"],
+                verbosity=max(options["verbosity"] - 1, 0),
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{template.template_schema()} on {alias} is at head "
+                    f"({perf_counter() - started:.1f}s)"
+                )
+            )
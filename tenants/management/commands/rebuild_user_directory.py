@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tenants import directory, fleet
+from tenants.models import Tenant
+
+
+class Command(BaseCommand):
+    help = "Rebuild the public user directory from every tenant schema (backfill / repair)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--schema", action="append", dest="schemas", help="Only these tenants (repeatable)"
+        )
+
+    def handle(self, *args, **options):
+        queryset = Tenant.objects.all()
+        if options["schemas"]:
+            queryset = queryset.filter(schema_name__in=options["schemas"])
+
+        result = directory.rebuild(fleet.fleet_tenants(queryset))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {result['users']} user(s) from {result['tenants']} tenant(s)"
+            )
+        )
+        if result["failed"]:
+            raise CommandError(f"Could not read: {', '.join(sorted(result['failed']))}")
@@ -0,0 +1,69 @@
+from django.conf import settings
+from django_tenants.middleware import TenantMainMiddleware
+
+from tenants.resolution import resolve_tenant
+from tenants.routers import pick_replica, read_alias_context
+
+REPLICA_PIN_COOKIE = "db_primary_pin"
+REPLICA_READ_METHODS = ("GET", "HEAD")
+
+
+class CachedTenantMainMiddleware(TenantMainMiddleware):
+    """
+    `TenantMainMiddleware` that resolves tenants through the in-process
+    resolution cache instead of querying `Domain` on every request.
+    """
+
+    def get_tenant(self, domain_model, hostname):
+        return resolve_tenant(hostname)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve GET/HEAD views from a read replica.
+
+    Views opt out (or in) with `tenants.routers.database_reads`. After an
+    unsafe request the client gets a short-lived cookie that keeps its reads
+    on the primary, so it sees its own writes despite replication lag.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    @staticmethod
+    def _view_policy(view_func):
+        policy = getattr(view_func, "database_reads", None)
+        if policy is None:
+            policy = getattr(getattr(view_func, "cls", None), "database_reads", None)
+        return policy or settings.DATABASE_REPLICA_READS
+
+    def __call__(self, request):
+        try:
+            response = self.get_response(request)
+        finally:
+            token = getattr(request, "_read_alias_token", None)
+            if token is not None:
+                read_alias_context.reset(token)
+
+        if settings.DATABASE_REPLICAS and request.method not in REPLICA_READ_METHODS:
+            response.set_cookie(
+                REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.DATABASE_REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if (
+            not settings.DATABASE_REPLICAS
+            or request.method not in REPLICA_READ_METHODS
+            or REPLICA_PIN_COOKIE in request.COOKIES
+            or self._view_policy(view_func) != "replica"
+        ):
+            return None
+
+        request._read_alias_token = read_alias_context.set(pick_replica())
+        return None
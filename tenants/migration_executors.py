@@ -0,0 +1,49 @@
+from django.db import DEFAULT_DB_ALIAS
+from django_tenants.migration_executors.base import run_migrations
+from django_tenants.migration_executors.standard import StandardExecutor
+from django_tenants.utils import get_tenant_model
+
+
+class PlacementExecutor(StandardExecutor):
+    """
+    `migrate_schemas` executor that migrates each tenant schema on the database
+    alias it is placed on, so one `migrate_schemas` run covers every cluster.
+    With `--schema` (or an explicit non-default `--database`) the given
+    database is used as is; tenant creation and moves rely on that.
+    """
+
+    codename = "placement"
+
+    def _placements(self, tenants):
+        if (
+            self.options.get("schema_name")
+            or self.options.get("database", DEFAULT_DB_ALIAS) != DEFAULT_DB_ALIAS
+        ):
+            return {}
+        return dict(
+            get_tenant_model()
+            .objects.using(DEFAULT_DB_ALIAS)
+            .filter(schema_name__in=list(tenants))
+            .values_list("schema_name", "database_alias")
+        )
+
+    def run_migrations(self, tenants=None):
+        tenants = list(tenants or [])
+
+        if self.PUBLIC_SCHEMA_NAME in tenants:
+            run_migrations(self.args, self.options, self.codename, self.PUBLIC_SCHEMA_NAME)
+            tenants.remove(self.PUBLIC_SCHEMA_NAME)
+
+        placements = self._placements(tenants)
+        for idx, schema_name in enumerate(tenants):
+            options = self.options
+            alias = placements.get(schema_name)
+            if alias is not None:
+                options = {**options, "database": alias}
+            run_migrations(
+                self.args, options, self.codename, schema_name, idx=idx, count=len(tenants)
+            )
+
+
+def get_executor(codename=None):
+    return PlacementExecutor
@@ -0,0 +1,123 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import monotonic
+
+import django
+from django.core.management import call_command
+from django.db import connections
+from django.utils import timezone
+from django_tenants.utils import get_public_schema_name
+
+from tenants import template
+from tenants.models import Tenant, TenantMigrationRecord
+
+# Parallel tenant migrations for deploys: schemas are migrated in a bounded
+# process pool and their progress is kept in TenantMigrationRecord, so a
+# re-run only picks up schemas that failed, were interrupted or are behind.
+
+Status = TenantMigrationRecord.Status
+
+
+def pending_tenants(databases=None, force=False):
+    """(id, schema_name, database_alias) of provisioned tenants not yet at head."""
+    tenants = Tenant.objects.exclude(schema_name=get_public_schema_name()).filter(
+        provisioning_status=Tenant.ProvisioningStatus.READY
+    )
+    if databases:
+        tenants = tenants.filter(database_alias__in=databases)
+    if not force:
+        tenants = tenants.exclude(
+            migration_record__status=Status.DONE,
+            migration_record__migration_state=template.migration_state(),
+        )
+    return tenants.order_by("id").values_list("id", "schema_name", "database_alias")
+
+
+def mark_running(tenant_ids):
+    now = timezone.now()
+    TenantMigrationRecord.objects.bulk_create(
+        [
+            TenantMigrationRecord(tenant_id=tenant_id, status=Status.RUNNING, started_at=now)
+            for tenant_id in tenant_ids
+        ],
+        update_conflicts=True,
+        unique_fields=["tenant"],
+        update_fields=["status", "error", "started_at", "finished_at"],
+    )
+
+
+def record_result(tenant_id, error, state):
+    TenantMigrationRecord.objects.filter(pk=tenant_id).update(
+        status=Status.FAILED if error else Status.DONE,
+        migration_state="" if error else state,
+        error=error,
+        finished_at=timezone.now(),
+    )
+
+
+def migrate_one(schema_name, alias):
+    """Worker: migrate one schema on its cluster. Returns (error, seconds)."""
+    started = monotonic()
+    try:
+        call_command(
+            "migrate_schemas",
+            tenant=True,
+            schema_name=schema_name,
+            database=alias,
+            interactive=False,
+            verbosity=0,
+        )
+    except Exception as exc:
+        return f"{type(exc).__name__}: {exc}", monotonic() - started
+    finally:
+        connections.close_all()
+    return "", monotonic() - started
+
+
+def run(tenants, processes):
+    """
+    Migrate `tenants` ((id, schema_name, alias) tuples) with at most
+    `processes` workers, recording each outcome as it completes. Yields
+    (schema_name, error, seconds) in completion order.
+    """
+    state = template.migration_state()
+    mark_running([tenant_id for tenant_id, _, _ in tenants])
+
+    # Spawned workers share no database connections with this process. The
+    # initializer is django.setup itself: unpickling anything from this
+    # module would import models before the app registry is ready.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=context, initializer=django.setup
+    ) as executor:
+        futures = {
+            executor.submit(migrate_one, schema_name, alias): (tenant_id, schema_name)
+            for tenant_id, schema_name, alias in tenants
+        }
+        for future in as_completed(futures):
+            tenant_id, schema_name = futures[future]
+            error, seconds = future.result()
+            record_result(tenant_id, error, state)
+            yield schema_name, error, seconds
+
+
+class Progress:
+    """Throughput and ETA over the schemas completed so far."""
+
+    def __init__(self, total):
+        self.total = total
+        self.completed = 0
+        self.started = monotonic()
+
+    def advance(self):
+        self.completed += 1
+
+    @property
+    def rate(self):
+        elapsed = monotonic() - self.started
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self):
+        rate = self.rate
+        return (self.total - self.completed) / rate if rate else None
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenants", "0003_alter_tenant_options"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tenant",
+            name="database_alias",
+            field=models.CharField(default="default", max_length=63),
+        ),
+    ]
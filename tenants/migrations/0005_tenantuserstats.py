@@ -0,0 +1,39 @@
+# Generated by Django 5.2 on 2026-10-18 05:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenants", "0004_tenant_database_alias"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TenantUserStats",
+            fields=[
+                (
+                    "tenant",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="user_stats",
+                        serialize=False,
+                        to="tenants.tenant",
+                    ),
+                ),
+                ("total", models.IntegerField(default=0)),
+                ("active", models.IntegerField(default=0)),
+                ("staff", models.IntegerField(default=0)),
+                ("admins", models.IntegerField(default=0)),
+                ("collected_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Tenant user stats",
+                "verbose_name_plural": "Tenant user stats",
+            },
+        ),
+    ]
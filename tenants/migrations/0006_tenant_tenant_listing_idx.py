@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-18 05:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0005_tenantuserstats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['is_active', '-created_at', 'id'], name='tenant_listing_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-18 05:17
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, so with
+    # DB_SEARCH_PATH_MODE=transaction it cannot be scoped to a schema either:
+    # run migrations in session mode (see docs/tenant-management.md).
+    atomic = False
+
+    dependencies = [
+        ("tenants", "0006_tenant_tenant_listing_idx"),
+    ]
+
+    operations = [
+        # In public, so tenant schemas (search_path "<tenant>, public") see the
+        # operator classes on every cluster.
+        migrations.RunSQL(
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public",
+            migrations.RunSQL.noop,
+        ),
+        AddIndexConcurrently(
+            model_name="tenant",
+            index=GinIndex(fields=["name"], name="tenant_name_trgm", opclasses=["gin_trgm_ops"]),
+        ),
+        AddIndexConcurrently(
+            model_name="tenant",
+            index=GinIndex(fields=["subdomain"], name="tenant_subdomain_trgm", opclasses=["gin_trgm_ops"]),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-18 05:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0007_trigram_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tenant',
+            name='provisioning_error',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name='tenant',
+            name='provisioning_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('creating_schema', 'Creating schema'), ('migrating', 'Migrating'), ('creating_domain', 'Creating domain'), ('seeding', 'Seeding'), ('ready', 'Ready'), ('failed', 'Failed')], default='ready', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='tenant',
+            name='provisioning_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
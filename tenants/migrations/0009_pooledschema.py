@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-18 05:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0008_tenant_provisioning'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PooledSchema',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('schema_name', models.CharField(max_length=63, unique=True)),
+                ('database_alias', models.CharField(default='default', max_length=63)),
+                ('migration_state', models.CharField(max_length=16)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Pooled schema',
+                'verbose_name_plural': 'Pooled schemas',
+                'indexes': [models.Index(fields=['database_alias', 'migration_state', 'created_at'], name='pooled_schema_claim_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-18 05:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0009_pooledschema'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TenantMigrationRecord',
+            fields=[
+                ('tenant', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='migration_record', serialize=False, to='tenants.tenant')),
+                ('status', models.CharField(choices=[('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], max_length=10)),
+                ('migration_state', models.CharField(blank=True, max_length=16)),
+                ('error', models.TextField(blank=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Tenant migration record',
+                'verbose_name_plural': 'Tenant migration records',
+            },
+        ),
+    ]
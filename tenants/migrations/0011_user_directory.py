@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-18 05:30
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0010_tenantmigrationrecord'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserDirectoryEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user_id', models.BigIntegerField()),
+                ('username', models.CharField(max_length=150)),
+                ('email', models.CharField(blank=True, max_length=254)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_staff', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='directory_entries', to='tenants.tenant')),
+            ],
+            options={
+                'verbose_name': 'User directory entry',
+                'verbose_name_plural': 'User directory entries',
+                'indexes': [models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Lower('username'), name='text_pattern_ops'), name='user_directory_username_prefix'), models.Index(django.contrib.postgres.indexes.OpClass('email', name='varchar_pattern_ops'), name='user_directory_email_prefix'), django.contrib.postgres.indexes.GinIndex(fields=['username'], name='user_directory_username_trgm', opclasses=['gin_trgm_ops']), django.contrib.postgres.indexes.GinIndex(fields=['email'], name='user_directory_email_trgm', opclasses=['gin_trgm_ops'])],
+                'constraints': [models.UniqueConstraint(fields=('tenant', 'user_id'), name='user_directory_unique_user')],
+            },
+        ),
+    ]
@@ -1,41 +1,125 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import DEFAULT_DB_ALIAS, models
+from django.db.models.functions import Lower
 from django.utils import timezone
 from django_tenants.models import DomainMixin, TenantMixin
+from django_tenants.utils import get_public_schema_name
+
+from tenants import placement, stats
+from tenants.resolution import invalidate_tenant
 
 
 class Tenant(TenantMixin):
     """Core tenant isolation model."""
 
+    class ProvisioningStatus(models.TextChoices):
+        PENDING = "pending", "Pending"
+        CREATING_SCHEMA = "creating_schema", "Creating schema"
+        MIGRATING = "migrating", "Migrating"
+        CREATING_DOMAIN = "creating_domain", "Creating domain"
+        SEEDING = "seeding", "Seeding"
+        READY = "ready", "Ready"
+        FAILED = "failed", "Failed"
+
     name = models.CharField(max_length=200, unique=True)
     subdomain = models.SlugField(max_length=100, unique=True)
 
     is_active = models.BooleanField(default=True)
 
+    # placement: database alias (Postgres cluster) holding the schema
+    database_alias = models.CharField(max_length=63, default=DEFAULT_DB_ALIAS)
+
     # lifecycle
     created_at = models.DateTimeField(auto_now_add=True)
     activated_at = models.DateTimeField(null=True, blank=True)
     suspended_at = models.DateTimeField(null=True, blank=True)
 
-    # schema creation
-    auto_create_schema = True
+    # provisioning: tenants created through the control plane are set up by
+    # the Celery pipeline in tenants.provisioning
+    provisioning_status = models.CharField(
+        max_length=20,
+        choices=ProvisioningStatus.choices,
+        default=ProvisioningStatus.READY,
+    )
+    provisioning_error = models.TextField(blank=True)
+    provisioning_updated_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         verbose_name = "Tenant"
         verbose_name_plural = "Tenants"
         ordering = ("-created_at",)
+        indexes = (
+            # control-plane listing / cursor pagination order
+            models.Index(fields=["is_active", "-created_at", "id"], name="tenant_listing_idx"),
+            # control-plane search (src.libs.search)
+            GinIndex(fields=["name"], name="tenant_name_trgm", opclasses=["gin_trgm_ops"]),
+            GinIndex(
+                fields=["subdomain"], name="tenant_subdomain_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        )
 
     def __str__(self):
         return self.name
 
+    @property
+    def is_provisioned(self):
+        return self.provisioning_status == self.ProvisioningStatus.READY
+
+    @property
+    def auto_create_schema(self):
+        # Only provisioned tenants get django-tenants' synchronous schema
+        # creation on save(); the others are left to tenants.provisioning.
+        return self.is_provisioned
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Persisted status, so save() can tell a real activate/suspend apart.
+        instance._saved_is_active = instance.__dict__.get("is_active")
+        return instance
+
+    def save(self, *args, **kwargs):
+        is_new = self._state.adding
+        saved_is_active = getattr(self, "_saved_is_active", None)
+        update_fields = kwargs.get("update_fields")
+
+        super().save(*args, **kwargs)
+
+        if self.schema_name != get_public_schema_name():
+            if is_new:
+                stats.record_created(self)
+            elif (
+                saved_is_active is not None
+                and saved_is_active != self.is_active
+                and (update_fields is None or "is_active" in update_fields)
+            ):
+                stats.record_status_change(self.is_active)
+        self._saved_is_active = self.is_active
+
+    def create_schema(self, check_if_exists=False, sync_schema=True, verbosity=1):
+        if self.database_alias == DEFAULT_DB_ALIAS:
+            return super().create_schema(check_if_exists, sync_schema, verbosity)
+        return placement.create_schema(self, check_if_exists, sync_schema, verbosity)
+
+    def _drop_schema(self, force_drop=False):
+        if self.database_alias == DEFAULT_DB_ALIAS:
+            return super()._drop_schema(force_drop)
+        if self.auto_drop_schema or force_drop:
+            self.pre_drop()
+            placement.drop_schema(self.schema_name, self.database_alias)
+        return None
+
     def activate(self):
         self.is_active = True
         self.activated_at = timezone.now()
         self.save(update_fields=["is_active", "activated_at"])
+        invalidate_tenant(self)
 
     def suspend(self):
         self.is_active = False
         self.suspended_at = timezone.now()
         self.save(update_fields=["is_active", "suspended_at"])
+        invalidate_tenant(self)
 
 
 class Domain(DomainMixin):
@@ -44,3 +128,127 @@ class Domain(DomainMixin):
     class Meta:
         verbose_name = "Domain"
         verbose_name_plural = "Domains"
+
+
+class PooledSchema(models.Model):
+    """A migrated, seeded schema waiting to be claimed by a new tenant (tenants.pool)."""
+
+    schema_name = models.CharField(max_length=63, unique=True)
+    database_alias = models.CharField(max_length=63, default=DEFAULT_DB_ALIAS)
+    # digest of the tenant migration heads the schema was built at
+    migration_state = models.CharField(max_length=16)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Pooled schema"
+        verbose_name_plural = "Pooled schemas"
+        indexes = (
+            models.Index(
+                fields=["database_alias", "migration_state", "created_at"],
+                name="pooled_schema_claim_idx",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.schema_name} ({self.database_alias})"
+
+
+class TenantMigrationRecord(models.Model):
+    """Per-schema progress of `migrate_tenants_parallel` (tenants.migration_runner)."""
+
+    class Status(models.TextChoices):
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    tenant = models.OneToOneField(
+        Tenant,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="migration_record",
+    )
+    status = models.CharField(max_length=10, choices=Status.choices)
+    # digest of the tenant migration heads the schema was last migrated to
+    migration_state = models.CharField(max_length=16, blank=True)
+    error = models.TextField(blank=True)
+
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Tenant migration record"
+        verbose_name_plural = "Tenant migration records"
+
+    def __str__(self):
+        return f"{self.tenant_id}: {self.status}"
+
+
+class UserDirectoryEntry(models.Model):
+    """
+    Public-schema copy of every tenant user's identity, so a cross-tenant
+    lookup is one indexed query (tenants.directory).
+    """
+
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, related_name="directory_entries")
+    user_id = models.BigIntegerField()
+    username = models.CharField(max_length=150)
+    # stored lowercased
+    email = models.CharField(max_length=254, blank=True)
+    is_active = models.BooleanField(default=True)
+    is_staff = models.BooleanField(default=False)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "User directory entry"
+        verbose_name_plural = "User directory entries"
+        constraints = (
+            models.UniqueConstraint(
+                fields=["tenant", "user_id"], name="user_directory_unique_user"
+            ),
+        )
+        indexes = (
+            # case-insensitive prefix search: LOWER(username) LIKE 'q%' / email LIKE 'q%'
+            models.Index(
+                OpClass(Lower("username"), name="text_pattern_ops"),
+                name="user_directory_username_prefix",
+            ),
+            models.Index(
+                OpClass("email", name="varchar_pattern_ops"),
+                name="user_directory_email_prefix",
+            ),
+            GinIndex(
+                fields=["username"], name="user_directory_username_trgm", opclasses=["gin_trgm_ops"]
+            ),
+            GinIndex(
+                fields=["email"], name="user_directory_email_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.username} ({self.tenant_id})"
+
+
+class TenantUserStats(models.Model):
+    """Per-tenant user counts, collected in the background for the control plane."""
+
+    tenant = models.OneToOneField(
+        Tenant,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="user_stats",
+    )
+    total = models.IntegerField(default=0)
+    active = models.IntegerField(default=0)
+    staff = models.IntegerField(default=0)
+    admins = models.IntegerField(default=0)
+
+    collected_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Tenant user stats"
+        verbose_name_plural = "Tenant user stats"
+
+    def __str__(self):
+        return f"{self.tenant_id}: {self.total} users"
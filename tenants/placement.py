@@ -0,0 +1,249 @@
+import logging
+import tempfile
+import threading
+from functools import cache
+from time import monotonic
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Count
+from django_tenants.postgresql_backend.base import _check_schema_name
+from django_tenants.utils import get_public_schema_name, get_tenant_model, schema_exists
+
+from tenants.resolution import invalidate_tenant, routing_subscriber
+
+logger = logging.getLogger(__name__)
+
+# Per-table COPY data is buffered in memory up to this size, then on disk.
+COPY_SPOOL_BYTES = 64 * 1024 * 1024
+
+
+@cache
+def is_tenant_app(app_label):
+    app_config = apps.get_app_config(app_label)
+    full_name = f"{app_config.__module__}.{app_config.__class__.__name__}"
+    return app_config.name in settings.TENANT_APPS or full_name in settings.TENANT_APPS
+
+
+def tenant_models():
+    """Concrete models whose tables live in every tenant schema."""
+    return [
+        model
+        for model in apps.get_models(include_auto_created=True)
+        if is_tenant_app(model._meta.app_label) and model._meta.managed and not model._meta.proxy
+    ]
+
+
+class SchemaPlacementCache:
+    """
+    Per-process schema -> database alias map.
+
+    Only consulted when the connection carries a bare schema name
+    (`schema_context()`, `TenantTask`) instead of a `Tenant` instance.
+    """
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, schema_name):
+        with self._lock:
+            entry = self._entries.get(schema_name)
+            if entry is not None and entry[1] > monotonic():
+                return entry[0]
+
+        alias = (
+            get_tenant_model()
+            .objects.using(DEFAULT_DB_ALIAS)
+            .filter(schema_name=schema_name)
+            .values_list("database_alias", flat=True)
+            .first()
+        ) or DEFAULT_DB_ALIAS
+
+        with self._lock:
+            self._entries[schema_name] = (alias, monotonic() + self.ttl)
+        return alias
+
+    def invalidate(self, schema_name):
+        with self._lock:
+            self._entries.pop(schema_name, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def handle_change(self, payload):
+        schema_name = payload.get("schema_name")
+        if schema_name:
+            self.invalidate(schema_name)
+
+
+schema_placements = SchemaPlacementCache(ttl=settings.TENANT_RESOLUTION_CACHE_TTL)
+routing_subscriber.listeners.append(schema_placements.handle_change)
+
+
+def database_for_tenant(tenant):
+    """Return the database alias holding `tenant`'s schema."""
+    schema_name = getattr(tenant, "schema_name", None)
+    if not schema_name or schema_name == get_public_schema_name():
+        return DEFAULT_DB_ALIAS
+
+    alias = getattr(tenant, "database_alias", None)
+    if alias is None:
+        # FakeTenant from schema_context() / set_schema()
+        alias = schema_placements.get(schema_name)
+    return alias
+
+
+def _tenant_counts():
+    return dict(
+        get_tenant_model()
+        .objects.exclude(schema_name=get_public_schema_name())
+        .values_list("database_alias")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+
+
+def least_loaded_database():
+    """The configured tenant database currently holding the fewest schemas."""
+    counts = _tenant_counts()
+    return min(settings.TENANT_DATABASES, key=lambda alias: counts.get(alias, 0))
+
+
+def create_schema(tenant, check_if_exists=False, sync_schema=True, verbosity=1):
+    """Create and migrate `tenant`'s schema on `tenant.database_alias`."""
+    alias = tenant.database_alias
+    _check_schema_name(tenant.schema_name)
+
+    if check_if_exists and schema_exists(tenant.schema_name, alias):
+        return False
+
+    connection = connections[alias]
+    connection.set_schema_to_public()
+    with connection.cursor() as cursor:
+        cursor.execute(f'CREATE SCHEMA "{tenant.schema_name}"')
+
+    if sync_schema:
+        call_command(
+            "migrate_schemas",
+            tenant=True,
+            schema_name=tenant.schema_name,
+            database=alias,
+            interactive=False,
+            verbosity=verbosity,
+        )
+
+    connection.set_schema_to_public()
+    return True
+
+
+def drop_schema(schema_name, alias):
+    _check_schema_name(schema_name)
+    connection = connections[alias]
+    connection.set_schema_to_public()
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP SCHEMA IF EXISTS "{schema_name}" CASCADE')
+
+
+def _copy_table(model, schema_name, source_cursor, target_cursor, quote_name):
+    table = f"{quote_name(schema_name)}.{quote_name(model._meta.db_table)}"
+    columns = ", ".join(quote_name(field.column) for field in model._meta.local_concrete_fields)
+    with tempfile.SpooledTemporaryFile(max_size=COPY_SPOOL_BYTES) as buffer:
+        source_cursor.copy_expert(f"COPY {table} ({columns}) TO STDOUT", buffer)
+        buffer.seek(0)
+        target_cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN", buffer)
+
+
+def copy_schema_data(schema_name, source, target):
+    """
+    Copy every tenant table of `schema_name` from `source` to `target`.
+
+    The target schema must already be migrated. Rows created there by
+    post-migrate hooks (content types, permissions) are flushed first so the
+    copy keeps the source primary keys. Rows go through COPY, not the ORM,
+    so values (auto_now timestamps included) arrive exactly as stored.
+    Foreign keys are deferred until commit, so table order does not matter.
+    """
+    models = tenant_models()
+    source_connection = connections[source]
+    target_connection = connections[target]
+    source_connection.set_schema(schema_name)
+    target_connection.set_schema(schema_name)
+    quote_name = target_connection.ops.quote_name
+
+    try:
+        with (
+            transaction.atomic(using=source),
+            transaction.atomic(using=target),
+            source_connection.cursor() as source_cursor,
+            target_connection.cursor() as target_cursor,
+        ):
+            tables = [model._meta.db_table for model in models]
+            for sql in target_connection.ops.sql_flush(no_style(), tables, allow_cascade=True):
+                target_cursor.execute(sql)
+
+            for model in models:
+                _copy_table(model, schema_name, source_cursor, target_cursor, quote_name)
+
+            for sql in target_connection.ops.sequence_reset_sql(no_style(), models):
+                target_cursor.execute(sql)
+    finally:
+        source_connection.set_schema_to_public()
+        target_connection.set_schema_to_public()
+
+
+def _set_serving(tenant, is_active):
+    # Flip traffic without touching the lifecycle timestamps or the stats
+    # rollup: a move is not a suspend/activate.
+    type(tenant).objects.filter(pk=tenant.pk).update(is_active=is_active)
+    tenant.is_active = tenant._saved_is_active = is_active
+    invalidate_tenant(tenant)
+
+
+def move_tenant(tenant, target, keep_source=False):
+    """
+    Move `tenant`'s schema to the `target` database alias.
+
+    The tenant stops serving requests while its data is copied, the placement
+    is flipped once the copy has committed, and the source schema is dropped
+    unless `keep_source` is set. A failed copy leaves the tenant where it was.
+    """
+    if target not in settings.TENANT_DATABASES:
+        raise ValueError(f"Unknown tenant database '{target}'.")
+
+    source = tenant.database_alias
+    if target == source:
+        raise ValueError(f"Tenant '{tenant.schema_name}' is already on '{target}'.")
+
+    was_active = tenant.is_active
+    if was_active:
+        _set_serving(tenant, False)
+
+    try:
+        tenant.database_alias = target
+        create_schema(tenant, verbosity=0)
+        copy_schema_data(tenant.schema_name, source, target)
+    except Exception:
+        logger.exception("moving tenant %s to %s failed", tenant.schema_name, target)
+        tenant.database_alias = source
+        drop_schema(tenant.schema_name, target)
+        if was_active:
+            _set_serving(tenant, True)
+        raise
+
+    tenant.save(update_fields=["database_alias"])
+    schema_placements.invalidate(tenant.schema_name)
+    invalidate_tenant(tenant)
+
+    if not keep_source:
+        drop_schema(tenant.schema_name, source)
+
+    if was_active:
+        _set_serving(tenant, True)
+
+    return tenant
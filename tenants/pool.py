@@ -0,0 +1,163 @@
+import logging
+from functools import partial
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections, transaction
+from django.db.models import Count
+from django_tenants.postgresql_backend.base import _check_schema_name
+
+from tenants import provisioning, template
+from tenants.models import PooledSchema, Tenant
+from tenants.placement import drop_schema
+from tenants.resolution import invalidate_tenant
+
+logger = logging.getLogger(__name__)
+
+# Warm pool: TENANT_POOL_SIZE migrated, seeded and unassigned schemas per
+# cluster. A new tenant renames one of them instead of waiting for the
+# provisioning pipeline; refill() tops the pool back up in the background.
+
+POOL_SCHEMA_PREFIX = "pool_"
+REFILL_LOCK_KEY = "tenant-pool:refill"
+REFILL_LOCK_TIMEOUT = 3600
+
+
+def pool_size():
+    return settings.TENANT_POOL_SIZE
+
+
+def _available(alias=None):
+    queryset = PooledSchema.objects.filter(migration_state=template.migration_state())
+    if alias is not None:
+        queryset = queryset.filter(database_alias=alias)
+    return queryset
+
+
+def available_counts():
+    counts = dict(_available().values_list("database_alias").annotate(total=Count("id")).order_by())
+    return {alias: counts.get(alias, 0) for alias in settings.TENANT_DATABASES}
+
+
+def _rename_schema(alias, old_name, new_name):
+    connection = connections[alias]
+    connection.set_schema_to_public()
+    with connection.cursor() as cursor:
+        cursor.execute(f'ALTER SCHEMA "{old_name}" RENAME TO "{new_name}"')
+
+
+def claim(tenant):
+    """
+    Rename a pooled schema on `tenant`'s cluster to `tenant.schema_name`.
+
+    The pool row is locked with SKIP LOCKED so concurrent claims never wait
+    on each other, and it is only deleted once the rename has succeeded.
+    On another cluster the rename commits separately, so it is renamed back
+    if the default transaction (usually the request's) rolls back.
+    Returns False when the pool is empty (or disabled).
+    """
+    if not pool_size():
+        return False
+
+    _check_schema_name(tenant.schema_name)
+    alias = tenant.database_alias
+    try:
+        with transaction.atomic():
+            pooled = (
+                _available(alias).select_for_update(skip_locked=True).order_by("created_at").first()
+            )
+            if pooled is None:
+                return False
+
+            with transaction.atomic(using=alias):
+                _rename_schema(alias, pooled.schema_name, tenant.schema_name)
+            if alias != DEFAULT_DB_ALIAS:
+                connections[DEFAULT_DB_ALIAS].on_rollback(
+                    partial(_rename_schema, alias, tenant.schema_name, pooled.schema_name)
+                )
+            pooled.delete()
+    except DatabaseError:
+        logger.exception("claiming a pooled schema for %s failed", tenant.schema_name)
+        return False
+    return True
+
+
+def assign(tenant):
+    """
+    Provision `tenant` from the pool: claim a schema, create the primary
+    domain and mark the tenant ready. False means the pipeline has to run.
+    """
+    if not claim(tenant):
+        return False
+
+    provisioning.create_primary_domain(tenant)
+    provisioning.set_status(tenant.pk, Tenant.ProvisioningStatus.READY)
+    tenant.provisioning_status = Tenant.ProvisioningStatus.READY
+    invalidate_tenant(tenant)
+    return True
+
+
+def _seed(schema_name, alias):
+    connection = connections[alias]
+    connection.set_schema(schema_name)
+    try:
+        for fixture in settings.TENANT_SEED_FIXTURES:
+            call_command("loaddata", fixture, database=alias, verbosity=0)
+    finally:
+        connection.set_schema_to_public()
+
+
+def fill_one(alias):
+    """Build one pooled schema on `alias` (cloned from the template when enabled)."""
+    schema_name = f"{POOL_SCHEMA_PREFIX}{uuid4().hex[:16]}"
+    # Unsaved stand-in so the pipeline steps can build the schema.
+    placeholder = Tenant(schema_name=schema_name, database_alias=alias)
+    try:
+        provisioning.create_schema(placeholder)
+        provisioning.migrate_schema(placeholder)
+        _seed(schema_name, alias)
+    except Exception:
+        drop_schema(schema_name, alias)
+        raise
+
+    return PooledSchema.objects.create(
+        schema_name=schema_name,
+        database_alias=alias,
+        migration_state=template.migration_state(),
+    )
+
+
+def discard_stale():
+    """Drop pooled schemas built before the last deploy's migrations."""
+    stale = PooledSchema.objects.exclude(migration_state=template.migration_state())
+    discarded = 0
+    for pooled in stale.iterator():
+        drop_schema(pooled.schema_name, pooled.database_alias)
+        pooled.delete()
+        discarded += 1
+    return discarded
+
+
+def refill(batch_size=None):
+    """
+    Top every cluster's pool back up to `pool_size()`, building at most
+    `batch_size` schemas per cluster (TENANT_POOL_REFILL_BATCH by default).
+    """
+    batch_size = settings.TENANT_POOL_REFILL_BATCH if batch_size is None else batch_size
+    # Overlapping runs would both see the same deficit and overfill.
+    if not cache.add(REFILL_LOCK_KEY, 1, timeout=REFILL_LOCK_TIMEOUT):
+        return None
+
+    try:
+        discarded = discard_stale()
+        created = {}
+        for alias, available in available_counts().items():
+            missing = min(max(pool_size() - available, 0), batch_size)
+            for _ in range(missing):
+                fill_one(alias)
+            created[alias] = missing
+    finally:
+        cache.delete(REFILL_LOCK_KEY)
+    return {"created": created, "discarded": discarded}
@@ -0,0 +1,225 @@
+import logging
+import re
+
+import django.db.utils
+from django.core.exceptions import ImproperlyConfigured
+from django_tenants.postgresql_backend.base import DatabaseWrapper as TenantDatabaseWrapper
+from django_tenants.postgresql_backend.base import is_psycopg3, original_backend, psycopg
+
+logger = logging.getLogger(__name__)
+
+SESSION_MODE = "session"
+TRANSACTION_MODE = "transaction"
+
+# Statements Postgres refuses inside a transaction block, including the
+# implicit one around a multi-statement query.
+_NO_TRANSACTION_BLOCK = re.compile(
+    r"\s*(?:(?:CREATE|DROP)\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY|REINDEX\b.*\bCONCURRENTLY|VACUUM)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _search_path_sql(search_paths, local=False):
+    formatted_search_paths = ",".join(f"'{schema}'" for schema in search_paths)
+    scope = "LOCAL " if local else ""
+    return f"SET {scope}search_path = {formatted_search_paths}"
+
+
+class TransactionScopedCursor:
+    """
+    Cursor proxy used in transaction mode while the connection is in
+    autocommit: each statement carries its own `SET LOCAL search_path`.
+    """
+
+    def __init__(self, cursor, db, search_paths):
+        self.cursor = cursor
+        self.db = db
+        self.search_paths = search_paths
+
+    def __getattr__(self, attr):
+        return getattr(self.cursor, attr)
+
+    def __iter__(self):
+        return iter(self.cursor)
+
+    def _scoped(self, sql):
+        if self.db.autocommit:
+            if _NO_TRANSACTION_BLOCK.match(sql):
+                # Without the prefix the statement would run in whatever schema
+                # the pooled server connection has; there is no safe way to
+                # scope it here.
+                statement = " ".join(sql.split()[:3])
+                raise django.db.utils.NotSupportedError(
+                    f"{statement} cannot run in a transaction block, so it cannot be scoped "
+                    "with SEARCH_PATH_MODE 'transaction'. Run it with "
+                    "DB_SEARCH_PATH_MODE=session over a session-pooled or direct connection."
+                )
+            return f"{_search_path_sql(self.search_paths, local=True)}; {sql}"
+
+        # The connection left autocommit after this cursor was created.
+        self.db.set_transaction_search_path(self.cursor, self.search_paths)
+        return sql
+
+    def execute(self, sql, params=None):
+        return self.cursor.execute(self._scoped(sql), params)
+
+    def executemany(self, sql, param_list):
+        return self.cursor.executemany(self._scoped(sql), param_list)
+
+
+class DatabaseWrapper(TenantDatabaseWrapper):
+    """
+    django-tenants backend that remembers the search_path actually set on the
+    current session.
+
+    With persistent connections (CONN_MAX_AGE) the next request usually wants
+    the same schema the connection already has, so `SET search_path` is only
+    issued when the schema really changes. Transaction and savepoint rollbacks
+    revert a SET issued inside them, so both forget the remembered path.
+
+    With `SEARCH_PATH_MODE = "transaction"` (PgBouncer transaction pooling) the
+    schema is never set on the session. Inside a transaction it is applied
+    with `SET LOCAL` once per transaction and schema; in autocommit every
+    statement is prefixed with `SET LOCAL`, so the pair runs as one implicit
+    transaction on whichever server connection the pooler hands out.
+
+    `on_rollback()` is the counterpart of `on_commit()`, for undoing work done
+    outside the transaction (e.g. on another database) when it rolls back.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.run_on_rollback = []
+        self.session_search_paths = None
+        self.transaction_search_paths = None
+        self.search_path_switches = 0
+        self.search_path_reuses = 0
+        super().__init__(*args, **kwargs)
+
+    @property
+    def search_path_mode(self):
+        return self.settings_dict.get("SEARCH_PATH_MODE", SESSION_MODE)
+
+    def connect(self):
+        self.run_on_rollback = []
+        self.session_search_paths = None
+        self.transaction_search_paths = None
+        self.search_path_switches = 0
+        self.search_path_reuses = 0
+        super().connect()
+
+    def close(self):
+        self.session_search_paths = None
+        super().close()
+
+    def _commit(self):
+        self.transaction_search_paths = None
+        self.run_on_rollback = []
+        return super()._commit()
+
+    def _rollback(self):
+        self.session_search_paths = None
+        self.transaction_search_paths = None
+        result = super()._rollback()
+        callbacks, self.run_on_rollback = self.run_on_rollback, []
+        self._run_rollback_callbacks(callbacks)
+        return result
+
+    def _savepoint_rollback(self, sid):
+        super()._savepoint_rollback(sid)
+        self.session_search_paths = None
+        self.transaction_search_paths = None
+        # Only the callbacks registered while this savepoint was active.
+        callbacks = [entry for entry in self.run_on_rollback if sid in entry[0]]
+        self.run_on_rollback = [entry for entry in self.run_on_rollback if sid not in entry[0]]
+        self._run_rollback_callbacks(callbacks)
+
+    def on_rollback(self, func):
+        """
+        Call `func` if the current transaction, or the savepoint active when
+        it was registered, rolls back. Outside a transaction there is nothing
+        to roll back, so `func` is never called.
+        """
+        if self.in_atomic_block:
+            self.run_on_rollback.append((set(self.savepoint_ids), func))
+
+    def _run_rollback_callbacks(self, callbacks):
+        for _, func in reversed(callbacks):
+            try:
+                func()
+            except Exception:
+                # Raising here would mask the error that caused the rollback.
+                logger.exception("on_rollback callback %r failed", func)
+
+    def _set_autocommit(self, autocommit):
+        self.transaction_search_paths = None
+        super()._set_autocommit(autocommit)
+
+    def search_path_stats(self):
+        return {
+            "schema_name": self.schema_name,
+            "mode": self.search_path_mode,
+            "session_search_paths": self.session_search_paths,
+            "switches": self.search_path_switches,
+            "reuses": self.search_path_reuses,
+        }
+
+    def _cursor(self, name=None):
+        # Bypass django-tenants' _cursor, which re-issues SET search_path for
+        # every cursor unless TENANT_LIMIT_SET_CALLS is enabled.
+        cursor = original_backend.DatabaseWrapper._cursor(self, name=name)
+
+        if not self.schema_name:
+            raise ImproperlyConfigured(
+                "Database schema not set. Did you forget to call set_schema() or set_tenant()?"
+            )
+
+        search_paths = self._get_cursor_search_paths()
+        self.search_path_set_schemas = search_paths
+
+        if self.search_path_mode == TRANSACTION_MODE:
+            if self.autocommit:
+                return TransactionScopedCursor(cursor, self, search_paths)
+            if name:
+                with self.connection.cursor() as plain_cursor:
+                    self.set_transaction_search_path(plain_cursor, search_paths)
+            else:
+                self.set_transaction_search_path(cursor, search_paths)
+            return cursor
+
+        if search_paths == self.session_search_paths:
+            self.search_path_reuses += 1
+            return cursor
+
+        # Named cursors can only execute once, so SET goes through a plain one.
+        separate_cursor = bool(name or is_psycopg3)
+        cursor_for_search_path = self.connection.cursor() if separate_cursor else cursor
+
+        try:
+            cursor_for_search_path.execute(_search_path_sql(search_paths))
+        except (django.db.utils.DatabaseError, psycopg.InternalError):
+            # The transaction is already broken; the next statement fails
+            # anyway and the rollback resets the session.
+            self.session_search_paths = None
+            self.search_path_set_schemas = None
+        else:
+            self.session_search_paths = search_paths
+            self.search_path_switches += 1
+
+        if separate_cursor:
+            cursor_for_search_path.close()
+
+        return cursor
+
+    def set_transaction_search_path(self, cursor, search_paths):
+        """Apply `search_paths` to the current transaction only (SET LOCAL)."""
+        if search_paths == self.transaction_search_paths:
+            self.search_path_reuses += 1
+            return
+
+        try:
+            cursor.execute(_search_path_sql(search_paths, local=True))
+        except (django.db.utils.DatabaseError, psycopg.InternalError):
+            self.transaction_search_paths = None
+        else:
+            self.transaction_search_paths = search_paths
+            self.search_path_switches += 1
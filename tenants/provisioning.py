@@ -0,0 +1,102 @@
+import logging
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connections
+from django.utils import timezone
+from django_tenants.models import TenantMixin
+from django_tenants.postgresql_backend.base import _check_schema_name
+from django_tenants.signals import post_schema_sync
+from django_tenants.utils import schema_context, schema_exists
+
+from tenants import template
+from tenants.models import Domain, Tenant
+from tenants.resolution import invalidate_tenant
+
+logger = logging.getLogger(__name__)
+
+Status = Tenant.ProvisioningStatus
+
+
+def set_status(tenant_id, status, error=""):
+    # update(), not save(): a tenant without a schema must not reach
+    # TenantMixin.save() and its schema checks mid-pipeline.
+    Tenant.objects.filter(pk=tenant_id).update(
+        provisioning_status=status,
+        provisioning_error=error,
+        provisioning_updated_at=timezone.now(),
+    )
+
+
+def create_schema(tenant):
+    _check_schema_name(tenant.schema_name)
+    alias = tenant.database_alias
+    if template.cloning_enabled() and not schema_exists(tenant.schema_name, alias):
+        if template.template_is_current(alias):
+            template.clone_template(tenant.schema_name, alias)
+            return
+        logger.warning(
+            "tenant template on %s is missing or behind; migrating %s instead",
+            alias,
+            tenant.schema_name,
+        )
+
+    connection = connections[alias]
+    connection.set_schema_to_public()
+    with connection.cursor() as cursor:
+        cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{tenant.schema_name}"')
+
+
+def migrate_schema(tenant):
+    call_command(
+        "migrate_schemas",
+        tenant=True,
+        schema_name=tenant.schema_name,
+        database=tenant.database_alias,
+        interactive=False,
+        verbosity=0,
+    )
+    connections[tenant.database_alias].set_schema_to_public()
+    post_schema_sync.send(sender=TenantMixin, tenant=tenant.serializable_fields())
+
+
+def create_primary_domain(tenant):
+    Domain.objects.get_or_create(
+        tenant=tenant,
+        is_primary=True,
+        defaults={"domain": f"{tenant.subdomain}.{settings.PRIMARY_DOMAIN_SUFFIX}"},
+    )
+
+
+def seed_defaults(tenant):
+    # Roles and permissions ship as fixtures: UserRole rows need an owning
+    # user, so they cannot be created from code in an empty schema.
+    with schema_context(tenant.schema_name):
+        for fixture in settings.TENANT_SEED_FIXTURES:
+            call_command("loaddata", fixture, verbosity=0)
+
+
+# Pipeline order; every step is idempotent so a failed tenant can be re-run.
+STEPS = {
+    Status.CREATING_SCHEMA: create_schema,
+    Status.MIGRATING: migrate_schema,
+    Status.CREATING_DOMAIN: create_primary_domain,
+    Status.SEEDING: seed_defaults,
+}
+
+
+def run_step(tenant_id, step):
+    """Run one pipeline step, marking the tenant ready after the last one."""
+    tenant = Tenant.objects.get(pk=tenant_id)
+    set_status(tenant_id, step)
+    try:
+        STEPS[step](tenant)
+    except Exception as exc:
+        logger.exception("tenant provisioning failed", extra={"tenant_id": tenant_id})
+        set_status(tenant_id, Status.FAILED, f"{Status(step).label}: {exc}")
+        raise
+
+    if step == list(STEPS)[-1]:
+        set_status(tenant_id, Status.READY)
+        tenant.provisioning_status = Status.READY
+        invalidate_tenant(tenant)
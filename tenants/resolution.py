@@ -0,0 +1,193 @@
+import copy
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+from django.conf import settings
+from django.db import transaction
+from django_tenants.utils import get_tenant_domain_model, get_tenant_model
+
+from tenants import routing
+
+
+class TenantResolutionCache:
+    """
+    Bounded LRU + TTL cache of hostname -> Tenant.
+
+    Keeps per-process copies of resolved tenants so the tenant middleware does
+    not hit the public schema on every request. Entries are indexed by tenant
+    id as well, so a tenant change drops every hostname that points at it.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._hosts_by_tenant = {}
+        self._lock = threading.Lock()
+
+    def get(self, hostname):
+        with self._lock:
+            entry = self._entries.get(hostname)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            tenant, expires_at = entry
+            if expires_at <= monotonic():
+                self._discard(hostname)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(hostname)
+            self.hits += 1
+
+        # Hand out a copy so per-request attributes (domain_url, ...) never
+        # leak between requests sharing the cached instance.
+        return copy.copy(tenant)
+
+    def set(self, hostname, tenant):
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._discard(hostname)
+            self._entries[hostname] = (tenant, monotonic() + self.ttl)
+            self._hosts_by_tenant.setdefault(tenant.pk, set()).add(hostname)
+
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+
+    def invalidate_host(self, hostname):
+        with self._lock:
+            self._discard(hostname)
+
+    def invalidate_tenant(self, tenant_id):
+        with self._lock:
+            for hostname in self._hosts_by_tenant.pop(tenant_id, set()):
+                self._entries.pop(hostname, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hosts_by_tenant.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _discard(self, hostname):
+        entry = self._entries.pop(hostname, None)
+        if entry is None:
+            return
+
+        tenant_id = entry[0].pk
+        hostnames = self._hosts_by_tenant.get(tenant_id)
+        if hostnames is not None:
+            hostnames.discard(hostname)
+            if not hostnames:
+                del self._hosts_by_tenant[tenant_id]
+
+
+tenant_resolution_cache = TenantResolutionCache(
+    maxsize=settings.TENANT_RESOLUTION_CACHE_SIZE,
+    ttl=settings.TENANT_RESOLUTION_CACHE_TTL,
+)
+
+
+routing_subscriber = routing.RoutingSubscriber(tenant_resolution_cache)
+
+
+def subdomain_from_hostname(hostname):
+    """
+    Return the tenant subdomain of a primary domain
+    (`<subdomain>.<PRIMARY_DOMAIN_SUFFIX>`), or None for any other host.
+    """
+    hostname = hostname.lower()
+    suffix = f".{settings.PRIMARY_DOMAIN_SUFFIX}"
+    if not hostname.endswith(suffix):
+        return None
+
+    subdomain = hostname[: -len(suffix)]
+    if not subdomain or "." in subdomain:
+        return None
+    return subdomain
+
+
+def load_tenant(hostname):
+    """
+    Uncached lookup. Primary domains are resolved from `Tenant.subdomain`
+    (unique index, no join); only custom domains need the `Domain` table.
+    """
+    tenant_model = get_tenant_model()
+    # Tenants still being provisioned have no usable schema yet.
+    ready = tenant_model.ProvisioningStatus.READY
+    subdomain = subdomain_from_hostname(hostname)
+    if subdomain is not None:
+        tenant = tenant_model.objects.filter(subdomain=subdomain, provisioning_status=ready).first()
+        if tenant is not None:
+            return tenant
+
+    domains = get_tenant_domain_model().objects.select_related("tenant")
+    return domains.get(domain=hostname, tenant__provisioning_status=ready).tenant
+
+
+def resolve_tenant(hostname):
+    """
+    Return the tenant serving `hostname`, raising `Domain.DoesNotExist` when
+    no domain matches.
+
+    Lookup order is the local cache, the shared routing table and finally
+    Postgres (`load_tenant`), back-filling the faster layers on the way out.
+    """
+    tenant = tenant_resolution_cache.get(hostname)
+    if tenant is not None:
+        return tenant
+
+    if settings.TENANT_ROUTING_ENABLED:
+        routing_subscriber.ensure_started()
+        tenant = routing.load_route(hostname)
+
+    if tenant is None:
+        tenant = load_tenant(hostname)
+        if settings.TENANT_ROUTING_ENABLED:
+            routing.store_route(hostname, tenant)
+
+    tenant_resolution_cache.set(hostname, tenant)
+    return copy.copy(tenant)
+
+
+def invalidate_tenant(tenant):
+    """
+    Drop cached resolutions for `tenant` once the current transaction commits,
+    so concurrent requests cannot re-cache the pre-commit state. With the
+    routing table enabled the change is also published to every other process.
+    """
+
+    def _invalidate():
+        tenant_resolution_cache.invalidate_tenant(tenant.pk)
+        if settings.TENANT_ROUTING_ENABLED:
+            routing.publish_tenant_change(tenant)
+
+    transaction.on_commit(_invalidate)
+
+
+def invalidate_tenants(tenants):
+    """`invalidate_tenant` for many tenants, published in one batch."""
+    tenants = list(tenants)
+
+    def _invalidate():
+        for tenant in tenants:
+            tenant_resolution_cache.invalidate_tenant(tenant.pk)
+        if settings.TENANT_ROUTING_ENABLED:
+            routing.publish_tenant_changes(tenants)
+
+    transaction.on_commit(_invalidate)
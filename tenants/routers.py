@@ -0,0 +1,126 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django_tenants.utils import get_public_schema_name
+
+from tenants.placement import database_for_tenant, is_tenant_app
+
+read_alias_context = ContextVar("read_alias", default=None)
+
+
+def pick_replica():
+    replicas = settings.DATABASE_REPLICAS
+    return random.choice(replicas) if replicas else None
+
+
+@contextmanager
+def read_from_replica(alias=None):
+    """
+    Route ORM reads inside the block to a replica (a random one unless `alias`
+    is given). Falls back to the primary when no replicas are configured.
+    """
+    token = read_alias_context.set(alias or pick_replica())
+    try:
+        yield
+    finally:
+        read_alias_context.reset(token)
+
+
+@contextmanager
+def read_from_primary():
+    token = read_alias_context.set(None)
+    try:
+        yield
+    finally:
+        read_alias_context.reset(token)
+
+
+def database_reads(policy):
+    """
+    Per-view read routing: `@database_reads("primary")` keeps a safe-method
+    view on the primary, `@database_reads("replica")` sends it to a replica.
+    Class-based views can set a `database_reads` attribute instead.
+    """
+
+    def decorator(view):
+        view.database_reads = policy
+        return view
+
+    return decorator
+
+
+def _sync_tenant(alias):
+    # schema_context() and the tenant middleware only switch the default
+    # connection; mirror its schema onto the replica/cluster before querying.
+    other = connections[alias]
+    if other.schema_name != connection.schema_name:
+        other.set_tenant(connection.tenant, connection.include_public_schema)
+
+
+class TenantPlacementRouter:
+    """
+    Sends tenant-app queries to the database alias holding the current
+    tenant's schema (`Tenant.database_alias`). Shared apps and tenants placed
+    on `default` fall through to the next router.
+    """
+
+    def _placement(self, model):
+        if len(settings.TENANT_DATABASES) == 1 or not is_tenant_app(model._meta.app_label):
+            return None
+
+        alias = database_for_tenant(connection.tenant)
+        if alias == DEFAULT_DB_ALIAS:
+            return None
+
+        _sync_tenant(alias)
+        return alias
+
+    def db_for_read(self, model, **hints):
+        return self._placement(model)
+
+    def db_for_write(self, model, **hints):
+        return self._placement(model)
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == DEFAULT_DB_ALIAS or db not in settings.TENANT_DATABASES:
+            return None
+
+        # Extra clusters only hold tenant schemas.
+        if connections[db].schema_name == get_public_schema_name():
+            return False
+        return is_tenant_app(app_label)
+
+
+class ReplicaRouter:
+    """
+    Sends reads to the replica selected for the current request/block and
+    everything else to the primary. The first write pins the rest of the
+    request to the primary so it reads its own writes.
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = read_alias_context.get()
+        if alias is None:
+            return None
+
+        _sync_tenant(alias)
+        return alias
+
+    def db_for_write(self, model, **hints):
+        if read_alias_context.get() is not None:
+            read_alias_context.set(None)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
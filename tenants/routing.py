@@ -0,0 +1,202 @@
+import json
+import logging
+import os
+import threading
+from time import sleep, time
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from django_tenants.utils import get_tenant_model
+
+logger = logging.getLogger(__name__)
+
+ROUTING_TABLE_KEY = "tenant-routing:hosts"
+TENANT_HOSTS_KEY = "tenant-routing:tenant:{tenant_id}"
+INVALIDATION_CHANNEL = "tenant-routing:invalidate"
+
+ROUTE_FIELDS = (
+    "id",
+    "schema_name",
+    "name",
+    "subdomain",
+    "is_active",
+    "database_alias",
+    "provisioning_status",
+)
+
+
+def _redis():
+    return get_redis_connection(settings.TENANT_ROUTING_CACHE_ALIAS)
+
+
+def _routable(provisioning_status):
+    # Same rule as resolution.load_tenant(): tenants still being provisioned
+    # (or whose provisioning failed) have no usable schema.
+    return provisioning_status == get_tenant_model().ProvisioningStatus.READY
+
+
+def _route_entry(tenant):
+    # Hash fields cannot expire on their own, so each entry carries its own
+    # deadline: a missed publish leaves a stale route for at most the TTL.
+    entry = {field: getattr(tenant, field) for field in ROUTE_FIELDS}
+    entry["expires_at"] = time() + settings.TENANT_ROUTING_TTL
+    return json.dumps(entry)
+
+
+def load_route(hostname):
+    """
+    Return the tenant for `hostname` from the shared routing table, or None
+    when the host is not routed, its entry expired (or Redis is unavailable).
+    """
+    try:
+        raw = _redis().hget(ROUTING_TABLE_KEY, hostname)
+    except Exception:
+        logger.warning("tenant routing table unavailable", exc_info=True)
+        return None
+
+    if raw is None:
+        return None
+
+    entry = json.loads(raw)
+    if not all(field in entry for field in ROUTE_FIELDS):
+        # Written before a routing field was added; re-resolve from Postgres.
+        return None
+    if not _routable(entry["provisioning_status"]):
+        return None
+    if entry.get("expires_at", 0) < time():
+        # Re-resolved from Postgres and rewritten by store_route().
+        return None
+
+    # Only the routing fields are loaded; everything else is deferred and
+    # fetched lazily if a view ever touches it.
+    return get_tenant_model().from_db(
+        "default",
+        list(ROUTE_FIELDS),
+        [entry[field] for field in ROUTE_FIELDS],
+    )
+
+
+def store_route(hostname, tenant):
+    if not _routable(tenant.provisioning_status):
+        return
+    try:
+        pipe = _redis().pipeline()
+        pipe.hset(ROUTING_TABLE_KEY, hostname, _route_entry(tenant))
+        pipe.sadd(TENANT_HOSTS_KEY.format(tenant_id=tenant.pk), hostname)
+        pipe.execute()
+    except Exception:
+        logger.warning("could not store tenant route", exc_info=True)
+
+
+def publish_tenant_change(tenant):
+    """
+    Rewrite the routing entries for `tenant` and tell every process to drop
+    its local copy. Hostnames the tenant no longer owns are removed too, and
+    a tenant that is not ready keeps no entries at all.
+    """
+    publish_tenant_changes([tenant])
+
+
+def publish_tenant_changes(tenants):
+    """`publish_tenant_change` for many tenants in two Redis round trips."""
+    tenants = list(tenants)
+    if not tenants:
+        return
+
+    # domains.all() reuses a prefetch_related("domains") when there is one
+    hostnames = [
+        [domain.domain for domain in tenant.domains.all()]
+        if _routable(tenant.provisioning_status)
+        else []
+        for tenant in tenants
+    ]
+    hosts_keys = [TENANT_HOSTS_KEY.format(tenant_id=tenant.pk) for tenant in tenants]
+
+    try:
+        client = _redis()
+        pipe = client.pipeline()
+        for hosts_key in hosts_keys:
+            pipe.smembers(hosts_key)
+        previous_hosts = [{host.decode() for host in hosts} for hosts in pipe.execute()]
+
+        pipe = client.pipeline()
+        for tenant, current, previous, hosts_key in zip(
+            tenants, hostnames, previous_hosts, hosts_keys, strict=True
+        ):
+            stale = previous - set(current)
+            if stale:
+                pipe.hdel(ROUTING_TABLE_KEY, *stale)
+            pipe.delete(hosts_key)
+            if current:
+                entry = _route_entry(tenant)
+                pipe.hset(ROUTING_TABLE_KEY, mapping=dict.fromkeys(current, entry))
+                pipe.sadd(hosts_key, *current)
+            pipe.publish(
+                INVALIDATION_CHANNEL,
+                json.dumps(
+                    {
+                        "tenant_id": tenant.pk,
+                        "schema_name": tenant.schema_name,
+                        "hostnames": sorted(previous | set(current)),
+                    }
+                ),
+            )
+        pipe.execute()
+    except Exception:
+        logger.warning("could not publish tenant routing change", exc_info=True)
+
+
+class RoutingSubscriber:
+    """
+    Background listener that evicts local resolutions when another process
+    publishes a tenant change. One thread per process, restarted after fork.
+    `listeners` are called with every change payload.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.listeners = []
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            thread = threading.Thread(
+                target=self._run,
+                name="tenant-routing-subscriber",
+                daemon=True,
+            )
+            thread.start()
+
+    def handle_message(self, data):
+        payload = json.loads(data)
+        self.cache.invalidate_tenant(payload["tenant_id"])
+        for hostname in payload.get("hostnames", ()):
+            self.cache.invalidate_host(hostname)
+        for listener in self.listeners:
+            listener(payload)
+
+    def _run(self):
+        backoff = 1
+        while True:
+            try:
+                pubsub = _redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Anything published while we were disconnected is lost, so
+                # start from a clean slate on every (re)subscribe.
+                self.cache.clear()
+                backoff = 1
+                for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.handle_message(message["data"])
+            except Exception:
+                logger.warning("tenant routing subscriber disconnected", exc_info=True)
+                self.cache.clear()
+                sleep(backoff)
+                backoff = min(backoff * 2, 30)
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from tenants import directory
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def sync_directory_entry(sender, instance, using, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    # e.g. save(update_fields=["last_login"]) on every login
+    if update_fields is not None and not update_fields & set(directory.DIRECTORY_FIELDS):
+        return
+    directory.schedule_sync(instance, using)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def remove_directory_entry(sender, instance, using, **kwargs):
+    directory.schedule_sync(instance, using, deleted=True)
@@ -0,0 +1,128 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from django_redis import get_redis_connection
+from django_tenants.utils import get_public_schema_name, get_tenant_model
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_KEY = "tenant-stats:rollup"
+RECENT_DAYS = 30
+
+# Apply HINCRBY pairs only when the rollup exists; a missing rollup is
+# rebuilt from Postgres on the next read instead of starting from zero.
+_INCREMENT_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 0 then
+    return 0
+end
+for i = 1, #ARGV, 2 do
+    redis.call('hincrby', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+
+def _redis():
+    return get_redis_connection(settings.TENANT_STATS_CACHE_ALIAS)
+
+
+def _tenants():
+    return get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+
+
+def _day_field(day):
+    return f"created:{day.isoformat()}"
+
+
+def compute_stats(queryset=None):
+    """Tenant counts for `queryset` (all tenants by default) in one query."""
+    queryset = _tenants() if queryset is None else queryset
+    return queryset.aggregate(
+        total=Count("id"),
+        active=Count("id", filter=Q(is_active=True)),
+        suspended=Count("id", filter=Q(is_active=False)),
+        recent=Count("id", filter=Q(created_at__gte=timezone.now() - timedelta(days=RECENT_DAYS))),
+    )
+
+
+def rebuild():
+    """Recompute the rollup from Postgres and replace the cached copy."""
+    tenants = _tenants()
+    rollup = tenants.aggregate(
+        total=Count("id"),
+        active=Count("id", filter=Q(is_active=True)),
+        suspended=Count("id", filter=Q(is_active=False)),
+    )
+    since = timezone.localdate() - timedelta(days=RECENT_DAYS)
+    per_day = (
+        tenants.filter(created_at__date__gte=since)
+        .annotate(day=TruncDate("created_at"))
+        .values_list("day")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    rollup.update({_day_field(day): total for day, total in per_day})
+
+    pipe = _redis().pipeline()
+    pipe.delete(ROLLUP_KEY)
+    pipe.hset(ROLLUP_KEY, mapping=rollup)
+    pipe.execute()
+    return rollup
+
+
+def _summarise(rollup):
+    today = timezone.localdate()
+    recent = sum(
+        rollup.get(_day_field(today - timedelta(days=offset)), 0) for offset in range(RECENT_DAYS)
+    )
+    return {
+        "total": rollup.get("total", 0),
+        "active": rollup.get("active", 0),
+        "suspended": rollup.get("suspended", 0),
+        "recent": recent,
+    }
+
+
+def get_stats():
+    """
+    Fleet-wide tenant counts from the cached rollup. "recent" counts tenants
+    created in the last `RECENT_DAYS` calendar days.
+    """
+    try:
+        raw = _redis().hgetall(ROLLUP_KEY)
+        rollup = {key.decode(): int(value) for key, value in raw.items()} if raw else rebuild()
+    except Exception:
+        logger.warning("tenant stats rollup unavailable", exc_info=True)
+        return compute_stats()
+
+    return _summarise(rollup)
+
+
+def _increment(deltas):
+    args = [item for field, delta in deltas.items() for item in (field, delta)]
+
+    def _apply():
+        try:
+            _redis().eval(_INCREMENT_SCRIPT, 1, ROLLUP_KEY, *args)
+        except Exception:
+            logger.warning("could not update tenant stats rollup", exc_info=True)
+
+    transaction.on_commit(_apply)
+
+
+def record_created(tenant):
+    status = "active" if tenant.is_active else "suspended"
+    created_on = timezone.localdate(tenant.created_at)
+    _increment({"total": 1, status: 1, _day_field(created_on): 1})
+
+
+def record_status_change(is_active, count=1):
+    if is_active:
+        _increment({"active": count, "suspended": -count})
+    else:
+        _increment({"active": -count, "suspended": count})
@@ -0,0 +1,58 @@
+from celery import chain, shared_task
+from django.db import connection
+from django_tenants.utils import get_tenant_model
+
+from src.libs.tasks import TenantTask
+from tenants import pool, provisioning, stats, user_stats
+from tenants.placement import move_tenant
+
+
+@shared_task
+def move_tenant_task(tenant_id, database, keep_source=False):
+    tenant = get_tenant_model().objects.get(pk=tenant_id)
+    move_tenant(tenant, database, keep_source=keep_source)
+    return {"tenant_id": tenant_id, "database": database}
+
+
+@shared_task
+def provision_tenant_step(tenant_id, step):
+    provisioning.run_step(tenant_id, step)
+    return {"tenant_id": tenant_id, "step": step}
+
+
+def provision_tenant(tenant_id):
+    """Queue the provisioning pipeline for `tenant_id`; a failed step stops it."""
+    provisioning.set_status(tenant_id, provisioning.Status.PENDING)
+    return chain(*(provision_tenant_step.si(tenant_id, step) for step in provisioning.STEPS))()
+
+
+@shared_task
+def refill_tenant_pool():
+    return pool.refill()
+
+
+@shared_task
+def reconcile_tenant_stats():
+    return stats.rebuild()
+
+
+@shared_task(base=TenantTask)
+def collect_tenant_user_stats(tenant_id):
+    """Recount the schema named in the task's `schema_name` header."""
+    counts = user_stats.count_users()
+    user_stats.store_snapshot(tenant_id, counts)
+    return {"schema_name": connection.schema_name, **counts}
+
+
+def _queue_tenant_user_stats(tenant_id, schema_name):
+    collect_tenant_user_stats.apply_async(args=(tenant_id,), headers={"schema_name": schema_name})
+
+
+@shared_task
+def collect_fleet_user_stats():
+    """
+    Snapshot user counts for every provisioned tenant. A schema whose batch
+    failed (one broken schema fails its whole UNION ALL) is recounted on its
+    own by `collect_tenant_user_stats`.
+    """
+    return user_stats.collect_fleet(on_error=_queue_tenant_user_stats)
@@ -0,0 +1,99 @@
+import hashlib
+from functools import cache
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connections, transaction
+from django.db.migrations.loader import MigrationLoader
+from django_tenants.clone import CLONE_SCHEMA_FUNCTION
+from django_tenants.utils import schema_exists
+
+from tenants.placement import drop_schema, is_tenant_app
+
+# A fully migrated and seeded schema per cluster; with
+# TENANT_PROVISIONING_MODE = "clone" new tenants copy it instead of replaying
+# every migration.
+
+
+def template_schema():
+    return settings.TENANT_TEMPLATE_SCHEMA
+
+
+def cloning_enabled():
+    return settings.TENANT_PROVISIONING_MODE == "clone"
+
+
+@cache
+def migration_heads():
+    """Latest migration of every tenant app, read from disk once per process."""
+    graph = MigrationLoader(None, ignore_no_migrations=True).graph
+    return frozenset(node for node in graph.leaf_nodes() if is_tenant_app(node[0]))
+
+
+def migration_state():
+    """Short digest of the tenant migration heads, recorded next to migrated schemas."""
+    heads = ",".join(f"{app}.{name}" for app, name in sorted(migration_heads()))
+    return hashlib.sha256(heads.encode()).hexdigest()[:16]
+
+
+def applied_migrations(alias):
+    with connections[alias].cursor() as cursor:
+        cursor.execute(f'SELECT app, name FROM "{template_schema()}".django_migrations')
+        return set(cursor.fetchall())
+
+
+def template_is_current(alias):
+    """True when the template on `alias` exists and is at every migration head."""
+    if not schema_exists(template_schema(), alias):
+        return False
+    return migration_heads() <= applied_migrations(alias)
+
+
+def install_clone_function(alias):
+    db_user = settings.DATABASES[alias].get("USER") or "postgres"
+    connection = connections[alias]
+    connection.set_schema_to_public()
+    with connection.cursor() as cursor:
+        cursor.execute(CLONE_SCHEMA_FUNCTION.format(db_user=db_user))
+
+
+def rebuild_template(alias, fresh=False, verbosity=0):
+    """
+    Bring the template on `alias` to head: migrate it in place (or from
+    scratch with `fresh`), load the seed fixtures and (re)install the
+    `clone_schema()` function.
+    """
+    schema_name = template_schema()
+    connection = connections[alias]
+    if fresh:
+        drop_schema(schema_name, alias)
+
+    connection.set_schema_to_public()
+    with connection.cursor() as cursor:
+        cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema_name}"')
+
+    call_command(
+        "migrate_schemas",
+        tenant=True,
+        schema_name=schema_name,
+        database=alias,
+        interactive=False,
+        verbosity=verbosity,
+    )
+
+    connection.set_schema(schema_name)
+    try:
+        for fixture in settings.TENANT_SEED_FIXTURES:
+            call_command("loaddata", fixture, database=alias, verbosity=verbosity)
+    finally:
+        connection.set_schema_to_public()
+
+    install_clone_function(alias)
+
+
+def clone_template(schema_name, alias):
+    """Create `schema_name` as a copy (DDL + data) of the template, in one transaction."""
+    connection = connections[alias]
+    connection.set_schema_to_public()
+    with transaction.atomic(using=alias), connection.cursor() as cursor:
+        cursor.execute("SELECT clone_schema(%s, %s, 'DATA')", [template_schema(), schema_name])
@@ -0,0 +1,137 @@
+import logging
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+from django_tenants.utils import schema_context
+
+from tenants import fleet
+from tenants.models import TenantUserStats
+
+logger = logging.getLogger(__name__)
+
+USER_STATS_FIELDS = ("total", "active", "staff", "admins")
+CACHE_KEY = "tenant-user-stats:{tenant_id}"
+
+
+def _cache_key(tenant_id):
+    return CACHE_KEY.format(tenant_id=tenant_id)
+
+
+def count_users():
+    """User counts for the current schema, in one query."""
+    return get_user_model().objects.aggregate(
+        total=Count("id"),
+        active=Count("id", filter=Q(is_active=True)),
+        staff=Count("id", filter=Q(is_staff=True)),
+        admins=Count("id", filter=Q(is_superuser=True)),
+    )
+
+
+def fleet_counts_sql():
+    """`count_users()` as a `tenants.fleet` SQL template."""
+    table = connection.ops.quote_name(get_user_model()._meta.db_table)
+    return (
+        "SELECT count(*) AS total, "
+        "count(*) FILTER (WHERE is_active) AS active, "
+        "count(*) FILTER (WHERE is_staff) AS staff, "
+        "count(*) FILTER (WHERE is_superuser) AS admins "
+        f"FROM {{schema}}.{table}"
+    )
+
+
+def collect_fleet(tenants=None, on_error=None):
+    """
+    Snapshot every tenant's user counts through the fleet executor: one
+    UNION ALL statement per cluster and batch of schemas. `on_error` is
+    called with (tenant_id, schema_name) for every schema that failed.
+    """
+    collected = failed = 0
+    for result in fleet.query_schemas(fleet_counts_sql(), tenants=tenants, union=True):
+        if result.error:
+            failed += 1
+            logger.warning(
+                "user stats collection failed for %s: %s", result.schema_name, result.error
+            )
+            if on_error is not None:
+                on_error(result.tenant_id, result.schema_name)
+            continue
+        store_snapshot(result.tenant_id, result.value[0])
+        collected += 1
+    return {"collected": collected, "failed": failed}
+
+
+def store_snapshot(tenant_id, counts):
+    TenantUserStats.objects.update_or_create(
+        tenant_id=tenant_id,
+        defaults={**counts, "collected_at": timezone.now()},
+    )
+    cache.set(_cache_key(tenant_id), counts, timeout=None)
+
+
+def get_user_stats(tenant):
+    """
+    User counts for `tenant`: cache, then the public snapshot table, then a
+    live count (stored as the first snapshot).
+    """
+    counts = cache.get(_cache_key(tenant.pk))
+    if counts is not None:
+        return counts
+
+    snapshot = (
+        TenantUserStats.objects.filter(tenant_id=tenant.pk).values(*USER_STATS_FIELDS).first()
+    )
+    if snapshot is not None:
+        cache.set(_cache_key(tenant.pk), snapshot, timeout=None)
+        return snapshot
+
+    with schema_context(tenant.schema_name):
+        counts = count_users()
+    store_snapshot(tenant.pk, counts)
+    return counts
+
+
+def fleet_totals():
+    """User counts summed over every tenant's latest snapshot."""
+    totals = TenantUserStats.objects.aggregate(**{field: Sum(field) for field in USER_STATS_FIELDS})
+    return {field: value or 0 for field, value in totals.items()}
+
+
+def user_flags(user):
+    return {"active": user.is_active, "staff": user.is_staff, "admins": user.is_superuser}
+
+
+def user_deltas(before, after):
+    """
+    Counter deltas for a user going from `before` to `after` (`user_flags()`
+    dicts; None for a user that did not / no longer exists).
+    """
+    deltas = {"total": (after is not None) - (before is not None)}
+    for field in ("active", "staff", "admins"):
+        deltas[field] = bool(after and after[field]) - bool(before and before[field])
+    return {field: delta for field, delta in deltas.items() if delta}
+
+
+def creation_deltas(created_flags):
+    """Summed `user_deltas()` for a batch of new users' `user_flags()`."""
+    totals = Counter()
+    for after in created_flags:
+        totals.update(user_deltas(None, after))
+    return dict(totals)
+
+
+def apply_user_deltas(tenant_id, deltas):
+    """Adjust the snapshot after commit instead of recounting the schema."""
+    if not deltas:
+        return
+
+    def _apply():
+        TenantUserStats.objects.filter(tenant_id=tenant_id).update(
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+        cache.delete(_cache_key(tenant_id))
+
+    transaction.on_commit(_apply)
@@ -0,0 +1,108 @@
+import gzip
+import json
+from datetime import UTC, datetime
+from unittest import mock
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from control_plane.views import TENANT_EXPORT_FIELDS, TenantUserViewset, TenantViewset
+from src.libs import export
+from tenants.models import Tenant
+
+JOINED = datetime(2026, 10, 18, 9, 30, tzinfo=UTC)
+
+
+def _request(path, params):
+    return Request(APIRequestFactory().get(path, params))
+
+
+class EncoderTests(SimpleTestCase):
+    def test_csv_emits_header_then_one_chunk_per_batch(self) -> None:
+        batches = [[(1, "jdoe", True, JOINED)], [(2, "=HYPERLINK()", False, None)]]
+
+        chunks = list(export.csv_chunks(["id", "username", "isActive", "dateJoined"], batches))
+
+        assert chunks == [
+            "id,username,isActive,dateJoined\r\n",
+            "1,jdoe,true,2026-10-18T09:30:00+00:00\r\n",
+            "2,'=HYPERLINK(),false,\r\n",
+        ]
+
+    def test_ndjson_emits_one_object_per_line(self) -> None:
+        chunks = list(export.ndjson_chunks(["id", "dateJoined"], [[(1, JOINED), (2, None)]]))
+
+        lines = "".join(chunks).splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"id": 1, "dateJoined": "2026-10-18T09:30:00Z"},
+            {"id": 2, "dateJoined": None},
+        ]
+
+
+class StreamExportTests(SimpleTestCase):
+    def _stream(self, *args, **kwargs):
+        queryset = mock.Mock()
+        with mock.patch.object(
+            export, "snapshot_batches", return_value=iter([[(1, "acme")]])
+        ) as batches:
+            response = export.stream_export(queryset, ("id", "schema_name"), *args, **kwargs)
+            body = b"".join(response.streaming_content)
+
+        queryset.values_list.assert_called_once_with("id", "schema_name")
+        assert batches.call_args.args[0] is queryset.values_list.return_value
+        return response, body
+
+    def test_csv_download(self) -> None:
+        response, body = self._stream("csv", "clients")
+
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        assert response["Content-Disposition"] == 'attachment; filename="clients.csv"'
+        assert body == b"id,schemaName\r\n1,acme\r\n"
+
+    def test_gzip_on_the_fly(self) -> None:
+        response, body = self._stream("ndjson", "clients", compression="gzip")
+
+        assert response["Content-Type"] == "application/gzip"
+        assert response["Content-Disposition"] == 'attachment; filename="clients.ndjson.gz"'
+        assert json.loads(gzip.decompress(body)) == {"id": 1, "schemaName": "acme"}
+
+
+class ExportViewTests(SimpleTestCase):
+    def test_tenant_export_applies_list_filters(self) -> None:
+        view = TenantViewset()
+
+        with mock.patch("control_plane.views.stream_export") as stream_export:
+            view.export(_request("/clients/export", {"status": "suspended"}))
+
+        queryset, fields, file_format, filename = stream_export.call_args.args
+        sql, params = queryset.query.sql_with_params()
+        assert '"tenants_tenant"."is_active"' in sql
+        assert "public" in params
+        assert (fields, file_format, filename) == (TENANT_EXPORT_FIELDS, "csv", "clients")
+        assert stream_export.call_args.kwargs == {"compression": None}
+
+    def test_user_export_runs_in_tenant_schema(self) -> None:
+        view = TenantUserViewset()
+        view._tenant = Tenant(id=3, schema_name="acme")
+        request = _request(
+            "/clients/3/users/export", {"file_format": "ndjson", "compression": "gzip"}
+        )
+
+        with (
+            mock.patch("control_plane.views.schema_context") as schema_context,
+            mock.patch("control_plane.views.stream_export") as stream_export,
+        ):
+            view.export(request)
+
+        schema_context.assert_called_once_with("acme")
+        queryset, fields, file_format, filename = stream_export.call_args.args
+        assert '"user_user"."is_staff"' in queryset.query.sql_with_params()[0]
+        assert "password" not in fields
+        assert (file_format, filename) == ("ndjson", "acme-users")
+        assert stream_export.call_args.kwargs == {"compression": "gzip"}
+
+    def test_unknown_format_is_rejected(self) -> None:
+        with self.assertRaises(ValidationError):
+            TenantViewset().export(_request("/clients/export", {"file_format": "xlsx"}))
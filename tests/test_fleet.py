@@ -0,0 +1,154 @@
+import json
+import threading
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+from tenants import fleet
+from tenants.models import Tenant
+
+
+def _tenants(*specs):
+    return [
+        Tenant(id=tenant_id, schema_name=schema_name, database_alias=alias)
+        for tenant_id, schema_name, alias in specs
+    ]
+
+
+class FleetTestCase(SimpleTestCase):
+    def setUp(self) -> None:
+        self.connection = self.enterContext(mock.patch("tenants.fleet.connection"))
+        self.connections = self.enterContext(mock.patch("tenants.fleet.connections"))
+        self.transaction = self.enterContext(mock.patch("tenants.fleet.transaction"))
+        self.connection.ops.quote_name.side_effect = lambda name: f'"{name}"'
+
+    def _cursor(self, alias="default"):
+        return self.connections[alias].cursor.return_value.__enter__.return_value
+
+
+class RunInSchemasTests(FleetTestCase):
+    def test_streams_results_and_errors_per_tenant(self) -> None:
+        tenants = _tenants((1, "acme", "default"), (2, "globex", "cluster_b"))
+
+        def count(tenant):
+            if tenant.schema_name == "globex":
+                raise RuntimeError("canceling statement due to statement timeout")
+            return 42
+
+        results = sorted(fleet.run_in_schemas(count, tenants, max_workers=2, timeout=5))
+
+        assert [(r.tenant_id, r.value, r.error) for r in results] == [
+            (1, 42, ""),
+            (2, None, "RuntimeError: canceling statement due to statement timeout"),
+        ]
+        self.transaction.atomic.assert_any_call(using="cluster_b")
+        self._cursor().execute.assert_called_with(
+            "SELECT set_config('statement_timeout', %s, true)", ["5000"]
+        )
+        self.connection.set_schema_to_public.assert_called()
+
+    def test_worker_threads_are_bounded(self) -> None:
+        threads = set()
+
+        def record(tenant):
+            threads.add(threading.current_thread().name)
+
+        tenants = _tenants(*((i, f"t{i}", "default") for i in range(1, 21)))
+
+        results = list(fleet.run_in_schemas(record, tenants, max_workers=3, timeout=0))
+
+        assert len(results) == 20
+        assert 1 <= len(threads) <= 3
+        # one close per worker thread, for its own connections
+        assert self.connections.close_all.call_count <= 3
+
+    def test_no_tenants_starts_no_workers(self) -> None:
+        assert list(fleet.run_in_schemas(mock.Mock(), [], max_workers=3)) == []
+        self.connections.close_all.assert_not_called()
+
+
+class QuerySchemasTests(FleetTestCase):
+    def test_per_schema_query_qualifies_tables(self) -> None:
+        cursor = self._cursor()
+        cursor.description = [("total",)]
+        cursor.fetchall.return_value = [(7,)]
+
+        (result,) = fleet.query_schemas(
+            "SELECT count(*) AS total FROM {schema}.user_user",
+            tenants=_tenants((1, "acme", "default")),
+            timeout=0,
+        )
+
+        cursor.execute.assert_called_with('SELECT count(*) AS total FROM "acme".user_user', ())
+        assert result.value == [{"total": 7}]
+
+    def test_union_combines_schemas_per_cluster(self) -> None:
+        cursor = self._cursor()
+        cursor.description = [("fleet_tenant_id",), ("total",)]
+        cursor.fetchall.return_value = [(1, 7), (2, 3)]
+        tenants = _tenants((1, "acme", "default"), (2, "globex", "default"))
+
+        results = list(
+            fleet.query_schemas(
+                "SELECT count(*) AS total FROM {schema}.user_user WHERE is_active = %s",
+                [True],
+                tenants=tenants,
+                timeout=0,
+                union=True,
+            )
+        )
+
+        sql, params = cursor.execute.call_args.args
+        assert sql.count("UNION ALL") == 1
+        assert 'FROM "acme".user_user' in sql
+        assert 'FROM "globex".user_user' in sql
+        assert params == [1, True, 2, True]
+        assert {r.tenant_id: r.value for r in results} == {1: [{"total": 7}], 2: [{"total": 3}]}
+
+    def test_union_failure_is_reported_for_the_whole_batch(self) -> None:
+        self._cursor().execute.side_effect = RuntimeError("relation does not exist")
+        tenants = _tenants((1, "acme", "default"), (2, "globex", "default"))
+
+        results = list(
+            fleet.query_schemas(
+                "SELECT 1 FROM {schema}.user_user", tenants=tenants, timeout=0, union=True
+            )
+        )
+
+        assert {r.error for r in results} == {"RuntimeError: relation does not exist"}
+        assert len(results) == 2
+
+
+class FleetQueryCommandTests(SimpleTestCase):
+    def test_prints_one_json_line_per_tenant(self) -> None:
+        results = [
+            fleet.TenantResult(1, "acme", [{"total": 7}], "", 0.01),
+            fleet.TenantResult(2, "globex", None, "RuntimeError: boom", 0.02),
+        ]
+        stdout, stderr = StringIO(), StringIO()
+
+        with mock.patch.object(fleet, "query_schemas", return_value=iter(results)) as query:
+            call_command(
+                "fleet_query",
+                "SELECT count(*) AS total FROM {schema}.user_user",
+                "--union",
+                stdout=stdout,
+                stderr=stderr,
+            )
+
+        lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert lines[0] == {
+            "tenant_id": 1,
+            "schema_name": "acme",
+            "rows": [{"total": 7}],
+            "seconds": 0.01,
+        }
+        assert lines[1]["error"] == "RuntimeError: boom"
+        assert "1 of 2 schema(s) succeeded" in stderr.getvalue()
+        assert query.call_args.kwargs["union"] is True
+
+    def test_requires_schema_placeholder(self) -> None:
+        with self.assertRaisesMessage(CommandError, "{schema}"):
+            call_command("fleet_query", "SELECT 1")
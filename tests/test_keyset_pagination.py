@@ -0,0 +1,227 @@
+import base64
+import operator
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from django.db.models import Q
+from django.test import RequestFactory, SimpleTestCase
+from django.urls import set_urlconf
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from control_plane.views import TENANT_USER_ORDERING, tenant_users_list_partial
+from src.libs.pagination import (
+    CursorOrOffsetPagination,
+    KeysetCursorPagination,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    keyset_page,
+)
+
+
+class FakeQuerySet:
+    def __init__(self, rows):
+        self.rows = rows
+        self.filters = []
+
+    def order_by(self, *ordering):
+        return self
+
+    def filter(self, condition):
+        self.filters.append(condition)
+        return self
+
+    def __getitem__(self, item):
+        return self.rows[item]
+
+
+LOOKUPS = {"": operator.eq, "lt": operator.lt, "gt": operator.gt}
+
+
+class FilteringQuerySet(FakeQuerySet):
+    """FakeQuerySet that really orders and applies keyset_filter() Qs."""
+
+    def order_by(self, *ordering):
+        rows = list(self.rows)
+        for field in reversed(ordering):
+            rows.sort(key=operator.itemgetter(field.lstrip("-")), reverse=field.startswith("-"))
+        return FilteringQuerySet(rows)
+
+    def _matches(self, row, condition):
+        results = []
+        for child in condition.children:
+            if isinstance(child, Q):
+                results.append(self._matches(row, child))
+            else:
+                name, _, lookup = child[0].partition("__")
+                results.append(LOOKUPS[lookup](row[name], child[1]))
+        return all(results) if condition.connector == Q.AND else any(results)
+
+    def filter(self, condition):
+        return FilteringQuerySet([row for row in self.rows if self._matches(row, condition)])
+
+
+class KeysetHelpersTests(SimpleTestCase):
+    def test_filter_walks_composite_ordering(self) -> None:
+        condition = keyset_filter(("-is_superuser", "-is_active", "username"), [True, False, "bob"])
+
+        assert condition == (
+            Q(is_superuser__lt=True)
+            | (Q(is_superuser=True) & Q(is_active__lt=False))
+            | (Q(is_superuser=True) & Q(is_active=False) & Q(username__gt="bob"))
+        )
+
+    def test_cursor_round_trip(self) -> None:
+        created_at = datetime(2026, 10, 18, 9, 30, tzinfo=UTC)
+
+        cursor = encode_cursor([False, created_at, 42])
+
+        assert decode_cursor(cursor) == [False, created_at, 42]
+
+    def test_pages_across_rows_differing_in_microseconds(self) -> None:
+        ordering = ("is_active", "-created_at", "id")
+        base = datetime(2026, 10, 18, 12, 0, 0, tzinfo=UTC)
+        rows = [
+            {"is_active": True, "created_at": base.replace(microsecond=micros), "id": pk}
+            for pk, micros in ((1, 123999), (2, 123789), (3, 123456), (4, 123456))
+        ]
+
+        seen: list[int] = []
+        cursor = None
+        while True:
+            page, cursor = keyset_page(FilteringQuerySet(rows), ordering, cursor, page_size=1)
+            seen.extend(row["id"] for row in page)
+            if cursor is None:
+                break
+
+        assert seen == [1, 2, 3, 4]
+
+    def test_tampered_cursor_is_rejected(self) -> None:
+        datetime_cursor = base64.urlsafe_b64encode(b'[{"$datetime":"yesterday"}]').decode()
+        for cursor in ("not-base64!", encode_cursor({"id": 1}), datetime_cursor):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+    def test_page_returns_cursor_of_last_row(self) -> None:
+        rows = [{"is_active": True, "username": f"user{index}"} for index in range(3)]
+        queryset = FakeQuerySet(rows)
+
+        page, next_cursor = keyset_page(queryset, ("-is_active", "username"), page_size=2)
+
+        assert page == rows[:2]
+        assert decode_cursor(next_cursor) == [True, "user1"]
+
+    def test_last_page_has_no_cursor(self) -> None:
+        queryset = FakeQuerySet([{"is_active": True, "username": "zed"}])
+        cursor = encode_cursor([True, "user1"])
+
+        page, next_cursor = keyset_page(queryset, ("-is_active", "username"), cursor, page_size=2)
+
+        assert len(page) == 1
+        assert next_cursor is None
+        assert queryset.filters == [keyset_filter(("-is_active", "username"), [True, "user1"])]
+
+
+def _api_request(params):
+    return Request(APIRequestFactory().get("/api/platform-mod/clients", params))
+
+
+class CursorPaginationTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.view = SimpleNamespace(cursor_ordering=("is_active", "-created_at", "id"))
+        self.rows = [
+            SimpleNamespace(is_active=False, created_at="2026-10-18T09:30:00Z", id=index)
+            for index in range(3)
+        ]
+
+    def test_next_link_carries_last_row_cursor(self) -> None:
+        paginator = KeysetCursorPagination()
+
+        page = paginator.paginate_queryset(
+            FakeQuerySet(self.rows), _api_request({"limit": 2}), self.view
+        )
+        response = paginator.get_paginated_response([row.id for row in page])
+
+        assert response.data["results"] == [0, 1]
+        assert "count" not in response.data
+        (cursor,) = parse_qs(urlsplit(response.data["next"]).query)["cursor"]
+        assert decode_cursor(cursor) == [False, "2026-10-18T09:30:00Z", 1]
+
+    def test_invalid_cursor_is_not_found(self) -> None:
+        with self.assertRaises(NotFound):
+            KeysetCursorPagination().paginate_queryset(
+                FakeQuerySet(self.rows), _api_request({"cursor": "%%%"}), self.view
+            )
+
+    def test_mode_is_picked_per_request(self) -> None:
+        paginator = CursorOrOffsetPagination()
+
+        for params, expected in (
+            ({}, "offset"),
+            ({"pagination": "cursor"}, "cursor"),
+            ({"cursor": "abc"}, "cursor"),
+        ):
+            assert paginator.get_mode(_api_request(params), self.view) == expected
+
+    def test_view_can_default_to_cursor_mode(self) -> None:
+        paginator = CursorOrOffsetPagination()
+        self.view.pagination_mode = "cursor"
+
+        assert paginator.get_mode(_api_request({}), self.view) == "cursor"
+        assert paginator.get_mode(_api_request({"pagination": "offset"}), self.view) == "offset"
+
+
+class TenantUsersLoadMoreTests(SimpleTestCase):
+    def setUp(self) -> None:
+        set_urlconf("config.platform_urls")
+        self.addCleanup(set_urlconf, None)
+        self.tenant = SimpleNamespace(id=3, pk=3, schema_name="acme")
+        for target, value in (
+            ("control_plane.views.get_object_or_404", mock.Mock(return_value=self.tenant)),
+            ("control_plane.views.schema_context", mock.MagicMock()),
+        ):
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _request(self, params):
+        request = RequestFactory().get("/dashboard/clients/3/users/partial", params)
+        request.platform_user = SimpleNamespace(is_active=True, is_platform_admin=True)
+        return request
+
+    def test_load_more_renders_rows_and_next_button(self) -> None:
+        users = [
+            {
+                "id": 7,
+                "username": "zed",
+                "email": "",
+                "first_name": "",
+                "last_name": "",
+                "phone_no": "",
+                "is_staff": True,
+                "is_superuser": False,
+                "is_active": True,
+            }
+        ]
+        cursor = encode_cursor([False, True, True, "bob"])
+
+        with mock.patch(
+            "control_plane.views.keyset_page", return_value=(users, "next-token")
+        ) as page:
+            response = tenant_users_list_partial(self._request({"cursor": cursor}), tenant_pk=3)
+
+        body = response.content.decode()
+        assert page.call_args.args[1] == TENANT_USER_ORDERING
+        assert page.call_args.kwargs["cursor"] == cursor
+        assert 'id="user-7"' in body
+        assert "cursor=next-token" in body
+        assert "<table" not in body
+
+    def test_invalid_cursor_is_rejected(self) -> None:
+        response = tenant_users_list_partial(self._request({"cursor": "%%%"}), tenant_pk=3)
+
+        assert response.status_code == 400
@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from src.libs import pagination
+from src.libs.pagination import CustomLimitOffsetPagination
+
+
+class FakeQuerySet:
+    db = "default"
+
+    def __init__(self, total):
+        self.rows = list(range(total))
+        self.count = mock.Mock(return_value=total)
+
+    def __getitem__(self, item):
+        return self.rows[item]
+
+
+def _paginate(strategy, total=25, params=None):
+    paginator = CustomLimitOffsetPagination()
+    request = Request(APIRequestFactory().get("/api/platform-mod/clients", params or {"limit": 10}))
+    queryset = FakeQuerySet(total)
+    page = paginator.paginate_queryset(queryset, request, SimpleNamespace(count_strategy=strategy))
+    return queryset, paginator.get_paginated_response(page).data
+
+
+class CountStrategyTests(SimpleTestCase):
+    def test_exact_counts_every_request(self) -> None:
+        queryset, data = _paginate("exact")
+
+        assert data["count"] == 25
+        assert data["count_exact"] is True
+        assert data["results"] == list(range(10))
+        queryset.count.assert_called_once_with()
+
+    def test_large_estimate_replaces_count(self) -> None:
+        with mock.patch("src.libs.pagination.estimate_count", return_value=250_000):
+            queryset, data = _paginate("estimated")
+
+        assert data["count"] == 250_000
+        assert data["count_exact"] is False
+        assert data["next"] is not None
+        queryset.count.assert_not_called()
+
+    def test_small_estimate_falls_back_to_exact(self) -> None:
+        with mock.patch("src.libs.pagination.estimate_count", return_value=30):
+            queryset, data = _paginate("estimated")
+
+        assert data["count"] == 25
+        assert data["count_exact"] is True
+        queryset.count.assert_called_once_with()
+
+    def test_none_probes_for_next_page(self) -> None:
+        queryset, data = _paginate("none", params={"limit": 10, "offset": 20})
+
+        assert data["count"] is None
+        assert data["count_exact"] is False
+        assert data["results"] == list(range(20, 25))
+        assert data["next"] is None
+        queryset.count.assert_not_called()
+
+    def test_limit_zero_always_counts(self) -> None:
+        _, data = _paginate("none", params={"limit": 0})
+
+        assert data["count"] == 25
+        assert len(data["results"]) == 25
+
+
+class CachedCountTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.queryset = mock.Mock(db="default")
+        self.queryset.order_by.return_value.query.sql_with_params.return_value = (
+            'SELECT * FROM "user" WHERE "is_active" = %s',
+            (True,),
+        )
+        self.queryset.count.return_value = 7
+
+    def test_counts_once_per_signature(self) -> None:
+        store: dict[str, int] = {}
+        with mock.patch("src.libs.pagination.cache") as cache:
+            cache.get.side_effect = store.get
+            cache.set.side_effect = lambda key, value, timeout: store.__setitem__(key, value)
+
+            assert pagination.cached_count(self.queryset, timeout=30) == 7
+            assert pagination.cached_count(self.queryset, timeout=30) == 7
+
+        self.queryset.count.assert_called_once_with()
+
+    def test_key_includes_tenant_schema(self) -> None:
+        keys = []
+        with mock.patch("src.libs.pagination.cache") as cache:
+            cache.get.side_effect = lambda key: keys.append(key)
+            for schema_name in ("acme", "globex"):
+                with mock.patch("src.libs.pagination.connection", schema_name=schema_name):
+                    pagination.cached_count(self.queryset, timeout=30)
+
+        assert keys[0] != keys[1]
@@ -0,0 +1,123 @@
+from concurrent.futures import Future
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+from tenants import migration_runner
+from tenants.models import TenantMigrationRecord
+
+Status = TenantMigrationRecord.Status
+
+
+class InlineExecutor:
+    """ProcessPoolExecutor stand-in running each call in the test process."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+class PendingTenantsTests(SimpleTestCase):
+    def test_skips_schemas_recorded_at_head(self) -> None:
+        with mock.patch("tenants.template.migration_state", return_value="abc123"):
+            queryset = migration_runner.pending_tenants(databases=["cluster_b"])
+
+        sql, params = queryset.query.sql_with_params()
+        assert "tenants_tenantmigrationrecord" in sql
+        assert {"abc123", Status.DONE, "cluster_b"} <= set(params)
+
+    def test_force_migrates_every_schema(self) -> None:
+        queryset = migration_runner.pending_tenants(force=True)
+
+        assert "tenants_tenantmigrationrecord" not in str(queryset.query)
+
+
+class RunTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.ProcessPoolExecutor = self.enterContext(
+            mock.patch("tenants.migration_runner.ProcessPoolExecutor")
+        )
+        self.call_command = self.enterContext(mock.patch("tenants.migration_runner.call_command"))
+        self.connections = self.enterContext(mock.patch("tenants.migration_runner.connections"))
+        self.mark_running = self.enterContext(mock.patch("tenants.migration_runner.mark_running"))
+        self.record_result = self.enterContext(mock.patch("tenants.migration_runner.record_result"))
+        self.migration_state = self.enterContext(mock.patch("tenants.template.migration_state"))
+        self.ProcessPoolExecutor.side_effect = InlineExecutor
+        self.migration_state.return_value = "abc123"
+
+    def test_migrates_each_schema_on_its_cluster(self) -> None:
+        self.call_command.side_effect = [None, RuntimeError("lock timeout")]
+        tenants = [(1, "acme", "default"), (2, "globex", "cluster_b")]
+
+        results = list(migration_runner.run(tenants, processes=2))
+
+        self.mark_running.assert_called_once_with([1, 2])
+        assert self.call_command.call_args_list[1] == mock.call(
+            "migrate_schemas",
+            tenant=True,
+            schema_name="globex",
+            database="cluster_b",
+            interactive=False,
+            verbosity=0,
+        )
+        # completion order
+        assert sorted((schema, error) for schema, error, _ in results) == [
+            ("acme", ""),
+            ("globex", "RuntimeError: lock timeout"),
+        ]
+        self.record_result.assert_has_calls(
+            [
+                mock.call(1, "", "abc123"),
+                mock.call(2, "RuntimeError: lock timeout", "abc123"),
+            ],
+            any_order=True,
+        )
+        assert self.ProcessPoolExecutor.call_args.kwargs["max_workers"] == 2
+
+
+class MigrateTenantsParallelCommandTests(SimpleTestCase):
+    def _call(self, results, pending=((1, "acme", "default"),)):
+        stdout = StringIO()
+        with (
+            mock.patch.object(migration_runner, "pending_tenants", return_value=list(pending)),
+            mock.patch.object(migration_runner, "run", return_value=iter(results)),
+        ):
+            call_command("migrate_tenants_parallel", processes=2, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_reports_progress_and_throughput(self) -> None:
+        output = self._call([("acme", "", 0.4)])
+
+        assert "Migrating 1 schema(s) with 2 process(es)" in output
+        assert "[1/1] acme ok (0.4s)" in output
+        assert "schemas/s" in output
+
+    def test_nothing_pending(self) -> None:
+        assert "All tenant schemas are at head." in self._call([], pending=())
+
+    def test_failures_fail_the_command(self) -> None:
+        with self.assertRaisesMessage(CommandError, "1 of 1 schema(s) failed: acme"):
+            self._call([("acme", "ProgrammingError: boom\ntraceback", 0.1)])
+
+
+class ProgressTests(SimpleTestCase):
+    def test_eta_from_observed_rate(self) -> None:
+        with mock.patch("tenants.migration_runner.monotonic", side_effect=[0.0, 10.0, 10.0]):
+            progress = migration_runner.Progress(total=30)
+            for _ in range(10):
+                progress.advance()
+
+            assert progress.rate == 1.0
+            assert progress.eta == 20.0
@@ -0,0 +1,201 @@
+import random
+from unittest import mock
+
+from django.db import connections
+from django.test import SimpleTestCase
+from django_tenants.postgresql_backend.base import original_backend
+
+
+def _parse_search_path(statement):
+    return statement.split("=", 1)[1].replace("'", "").replace(" ", "")
+
+
+class FakeServerConnection:
+    def __init__(self):
+        self.search_path = "public"
+
+
+class FakeTransactionPooler:
+    """
+    Stand-in for PgBouncer with `pool_mode = transaction`: a server connection
+    is lent to a client for one transaction only, so session-level state set
+    by one client is visible to whoever gets that server next.
+    """
+
+    def __init__(self, size):
+        self.servers = [FakeServerConnection() for _ in range(size)]
+        self.executed = []
+        self._next = 0
+
+    def acquire(self):
+        server = self.servers[self._next % len(self.servers)]
+        self._next += 1
+        return server
+
+
+class FakeClientConnection:
+    def __init__(self, pooler):
+        self.pooler = pooler
+        self.autocommit = True
+        self._server = None
+        self._local_search_path = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self._end_transaction()
+
+    def rollback(self):
+        self._end_transaction()
+
+    def run(self, sql):
+        if self._server is None:
+            self._server = self.pooler.acquire()
+
+        for statement in (part.strip() for part in sql.split(";")):
+            if statement.startswith("SET LOCAL search_path"):
+                self._local_search_path = _parse_search_path(statement)
+            elif statement.startswith("SET search_path"):
+                self._server.search_path = _parse_search_path(statement)
+            elif statement:
+                schema = self._local_search_path or self._server.search_path
+                self.pooler.executed.append((statement, schema))
+
+        if self.autocommit:
+            # A multi-statement query string is one implicit transaction.
+            self._end_transaction()
+
+    def _end_transaction(self):
+        self._server = None
+        self._local_search_path = None
+
+
+class FakeCursor:
+    def __init__(self, client):
+        self.client = client
+
+    def execute(self, sql, params=None):
+        self.client.run(sql)
+
+    def executemany(self, sql, param_list):
+        for _params in param_list:
+            self.client.run(sql)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class PgBouncerTransactionModeTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.pooler = FakeTransactionPooler(size=2)
+        patcher = mock.patch.object(
+            original_backend.DatabaseWrapper,
+            "_cursor",
+            autospec=True,
+            side_effect=lambda db, name=None: db.connection.cursor(),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # The fake client connection is always "connected".
+        patcher = mock.patch.object(original_backend.DatabaseWrapper, "ensure_connection")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _client(self):
+        db = connections.create_connection("default")
+        db.settings_dict = {**db.settings_dict, "SEARCH_PATH_MODE": "transaction"}
+        db.connection = FakeClientConnection(self.pooler)
+        db.autocommit = True
+        return db
+
+    def _query(self, db, sql):
+        db._cursor().execute(sql)
+
+    def test_autocommit_statements_carry_their_own_schema(self) -> None:
+        acme, globex = self._client(), self._client()
+        acme.set_schema("acme")
+        globex.set_schema("globex")
+
+        for _ in range(3):
+            self._query(acme, "SELECT 'acme'")
+            self._query(globex, "SELECT 'globex'")
+
+        assert (
+            self.pooler.executed
+            == [
+                ("SELECT 'acme'", "acme,public"),
+                ("SELECT 'globex'", "globex,public"),
+            ]
+            * 3
+        )
+        assert {server.search_path for server in self.pooler.servers} == {"public"}
+
+    def test_schema_context_inside_transaction(self) -> None:
+        db = self._client()
+        db.set_schema("acme")
+        db.set_autocommit(False)
+
+        self._query(db, "SELECT 'acme'")
+        db.set_schema("globex")
+        self._query(db, "SELECT 'globex'")
+        db.set_schema("acme")
+        self._query(db, "SELECT 'acme again'")
+        self._query(db, "SELECT 'acme reused'")
+        db.commit()
+        db.set_autocommit(True)
+
+        assert self.pooler.executed == [
+            ("SELECT 'acme'", "acme,public"),
+            ("SELECT 'globex'", "globex,public"),
+            ("SELECT 'acme again'", "acme,public"),
+            ("SELECT 'acme reused'", "acme,public"),
+        ]
+        assert db.search_path_stats()["switches"] == 3
+        assert db.search_path_stats()["reuses"] == 1
+        assert {server.search_path for server in self.pooler.servers} == {"public"}
+
+    def test_next_transaction_sets_schema_again(self) -> None:
+        db = self._client()
+        db.set_schema("acme")
+
+        for label in ("first", "second"):
+            db.set_autocommit(False)
+            self._query(db, f"SELECT '{label}'")
+            db.commit()
+            db.set_autocommit(True)
+
+        assert self.pooler.executed == [
+            ("SELECT 'first'", "acme,public"),
+            ("SELECT 'second'", "acme,public"),
+        ]
+
+    def test_many_clients_share_a_small_server_pool(self) -> None:
+        rng = random.Random(5)
+        clients = []
+        for index in range(500):
+            db = self._client()
+            db.set_schema(f"tenant{index % 50}")
+            clients.append(db)
+
+        expected = []
+        for _ in range(2000):
+            db = rng.choice(clients)
+            statement = f"SELECT '{db.schema_name}'"
+            if rng.random() < 0.5:
+                db.set_autocommit(False)
+                self._query(db, statement)
+                db.commit()
+                db.set_autocommit(True)
+            else:
+                self._query(db, statement)
+            expected.append((statement, f"{db.schema_name},public"))
+
+        assert self.pooler.executed == expected
+        assert {server.search_path for server in self.pooler.servers} == {"public"}
@@ -0,0 +1,89 @@
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from tenants.middleware import REPLICA_PIN_COOKIE, ReplicaRoutingMiddleware
+from tenants.routers import ReplicaRouter, database_reads, read_alias_context, read_from_replica
+
+REPLICA_SETTINGS = {
+    "DATABASE_REPLICAS": ["replica_0"],
+    "DATABASE_REPLICA_READS": "replica",
+    "DATABASE_REPLICA_PIN_SECONDS": 5,
+}
+
+
+@override_settings(**REPLICA_SETTINGS)
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.router = ReplicaRouter()
+        patcher = mock.patch("tenants.routers._sync_tenant")
+        self.sync_tenant = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reads_go_to_primary_outside_replica_block(self) -> None:
+        assert self.router.db_for_read(object) is None
+
+    def test_reads_go_to_replica_with_tenant_schema(self) -> None:
+        with read_from_replica():
+            assert self.router.db_for_read(object) == "replica_0"
+
+        self.sync_tenant.assert_called_once_with("replica_0")
+
+    def test_write_pins_remaining_reads_to_primary(self) -> None:
+        with read_from_replica():
+            assert self.router.db_for_write(object) == "default"
+            assert self.router.db_for_read(object) is None
+
+        assert read_alias_context.get() is None
+
+    def test_replicas_are_never_migrated(self) -> None:
+        assert self.router.allow_migrate("replica_0", "user") is False
+        assert self.router.allow_migrate("default", "user") is None
+
+
+@override_settings(**REPLICA_SETTINGS)
+class ReplicaRoutingMiddlewareTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+
+    def _run(self, request, view):
+        seen = {}
+
+        def get_response(incoming_request):
+            middleware.process_view(incoming_request, view, (), {})
+            seen["alias"] = read_alias_context.get()
+            return HttpResponse("ok")
+
+        middleware = ReplicaRoutingMiddleware(get_response)
+        response = middleware(request)
+        return seen["alias"], response
+
+    def test_safe_request_reads_from_replica(self) -> None:
+        alias, _response = self._run(self.factory.get("/dashboard"), lambda request: None)
+
+        assert alias == "replica_0"
+        assert read_alias_context.get() is None
+
+    def test_view_can_opt_out(self) -> None:
+        @database_reads("primary")
+        def view(request):
+            return None
+
+        alias, _response = self._run(self.factory.get("/dashboard"), view)
+
+        assert alias is None
+
+    def test_write_sets_read_your_writes_pin(self) -> None:
+        alias, response = self._run(self.factory.post("/dashboard"), lambda request: None)
+
+        assert alias is None
+        assert response.cookies[REPLICA_PIN_COOKIE]["max-age"] == 5
+
+    def test_pinned_client_reads_from_primary(self) -> None:
+        request = self.factory.get("/dashboard")
+        request.COOKIES[REPLICA_PIN_COOKIE] = "1"
+
+        alias, _response = self._run(request, lambda request: None)
+
+        assert alias is None
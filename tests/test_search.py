@@ -0,0 +1,43 @@
+from django.test import SimpleTestCase
+
+from control_plane.views import TENANT_SEARCH_FIELDS, TENANT_USER_SEARCH_FIELDS
+from src.libs.search import trigram_search
+from src.user.models import User
+from tenants.models import Tenant
+
+
+def _sql(queryset):
+    return queryset.query.sql_with_params()
+
+
+class TrigramSearchTests(SimpleTestCase):
+    def test_matches_every_field_through_trigram_operator(self) -> None:
+        queryset = trigram_search(Tenant.objects.order_by("id"), "acme", TENANT_SEARCH_FIELDS)
+
+        sql, params = _sql(queryset)
+
+        assert '"tenants_tenant"."name" %%> %s' in sql
+        assert '"tenants_tenant"."subdomain" %%> %s' in sql
+        assert "LIKE" not in sql
+        assert set(params) == {"acme"}
+
+    def test_orders_by_rank_then_existing_ordering(self) -> None:
+        queryset = trigram_search(
+            User.objects.order_by("username"), "jdoe", TENANT_USER_SEARCH_FIELDS
+        )
+
+        assert queryset.query.order_by == ("-search_rank", "username")
+        assert "GREATEST(WORD_SIMILARITY" in _sql(queryset)[0]
+
+    def test_short_query_uses_substring_match(self) -> None:
+        queryset = trigram_search(Tenant.objects.all(), "ac", TENANT_SEARCH_FIELDS)
+
+        sql, params = _sql(queryset)
+
+        assert "%%>" not in sql
+        assert "%ac%" in params
+
+    def test_blank_query_is_a_no_op(self) -> None:
+        queryset = Tenant.objects.all()
+
+        assert trigram_search(queryset, "  ", TENANT_SEARCH_FIELDS) is queryset
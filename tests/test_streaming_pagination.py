@@ -0,0 +1,124 @@
+import json
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest import mock
+
+from django.http import StreamingHttpResponse
+from django.test import SimpleTestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from src.libs.pagination import (
+    CursorOrOffsetPagination,
+    CustomLimitOffsetPagination,
+    StreamingListMixin,
+    stream_json_array,
+)
+
+
+class FakeQuerySet:
+    db = "replica"
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.chunk_sizes = []
+        self.aliases = []
+
+    def using(self, alias):
+        self.aliases.append(alias)
+        return self
+
+    def iterator(self, chunk_size):
+        self.chunk_sizes.append(chunk_size)
+        yield from self.rows
+
+
+def _api_request(params):
+    return Request(APIRequestFactory().get("/api/platform-mod/clients", params))
+
+
+class StreamJsonArrayTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.atomic = self.enterContext(
+            mock.patch(
+                "src.libs.pagination.transaction.atomic", mock.Mock(return_value=nullcontext())
+            )
+        )
+        self.schema_context = self.enterContext(
+            mock.patch("src.libs.pagination.schema_context", mock.Mock(return_value=nullcontext()))
+        )
+
+    def _stream(self, rows, chunk_size=2):
+        queryset = FakeQuerySet(rows)
+        response = stream_json_array(
+            queryset,
+            lambda row: {"schema_name": row.schema_name, "is_active": True},
+            chunk_size=chunk_size,
+        )
+        return queryset, response
+
+    def test_emits_camelized_json_array_in_chunks(self) -> None:
+        rows = [SimpleNamespace(schema_name=f"tenant_{index}") for index in range(5)]
+
+        queryset, response = self._stream(rows)
+        chunks = [chunk.decode() for chunk in response.streaming_content]
+
+        assert isinstance(response, StreamingHttpResponse)
+        assert len(chunks) == 4
+        assert json.loads("".join(chunks)) == [
+            {"schemaName": f"tenant_{index}", "isActive": True} for index in range(5)
+        ]
+        assert queryset.chunk_sizes == [2]
+        assert queryset.aliases == ["replica"]
+        self.atomic.assert_called_once_with(using="replica")
+
+    def test_empty_queryset_is_empty_array(self) -> None:
+        _, response = self._stream([])
+
+        assert b"".join(response.streaming_content) == b"[]"
+
+    def test_schema_is_captured_when_response_is_built(self) -> None:
+        with mock.patch("src.libs.pagination.connection", schema_name="acme"):
+            _, response = self._stream([SimpleNamespace(schema_name="acme")])
+
+        b"".join(response.streaming_content)
+
+        self.schema_context.assert_called_once_with("acme")
+
+
+class StreamingListMixinTests(SimpleTestCase):
+    def _view(self, paginator):
+        class BaseList:
+            def list(self, request, *args, **kwargs):
+                return "paged"
+
+        class View(StreamingListMixin, BaseList):
+            pass
+
+        view = View()
+        view.paginator = paginator
+        view.filter_queryset = lambda queryset: queryset
+        view.get_queryset = mock.Mock(return_value="queryset")
+        view.get_serializer_class = mock.Mock()
+        view.get_serializer_context = mock.Mock(return_value={})
+        return view
+
+    def test_limit_zero_streams(self) -> None:
+        paginator = CustomLimitOffsetPagination()
+
+        with mock.patch.object(paginator, "get_streaming_response", return_value="streamed"):
+            response = self._view(paginator).list(_api_request({"limit": "0"}))
+
+        assert response == "streamed"
+
+    def test_other_limits_paginate(self) -> None:
+        response = self._view(CustomLimitOffsetPagination()).list(_api_request({"limit": "5"}))
+
+        assert response == "paged"
+
+    def test_cursor_mode_never_streams(self) -> None:
+        paginator = CursorOrOffsetPagination()
+        request = _api_request({"limit": "0", "pagination": "cursor"})
+
+        assert not paginator.wants_stream(request, SimpleNamespace())
+        assert paginator.wants_stream(_api_request({"limit": "0"}), SimpleNamespace())
@@ -0,0 +1,139 @@
+from typing import cast
+from unittest import mock
+
+from django.db import DatabaseError, NotSupportedError, connections
+from django.test import SimpleTestCase
+from django_tenants.postgresql_backend.base import original_backend
+
+from tenants.postgresql_backend.base import DatabaseWrapper, TransactionScopedCursor
+
+
+class SearchPathReuseTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.db = cast(DatabaseWrapper, connections.create_connection("default"))
+        self.db.connection = mock.Mock()
+        self.driver_cursor = mock.Mock()
+        patcher = mock.patch.object(
+            original_backend.DatabaseWrapper, "_cursor", return_value=self.driver_cursor
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _set_statements(self):
+        return [
+            call.args[0]
+            for call in self.driver_cursor.execute.call_args_list
+            if call.args[0].startswith("SET search_path")
+        ]
+
+    def test_skips_set_when_schema_is_unchanged(self) -> None:
+        self.db.set_schema("acme")
+        self.db._cursor()
+        self.db.set_schema_to_public()
+        self.db.set_schema("acme")
+        self.db._cursor()
+
+        assert self._set_statements() == ["SET search_path = 'acme','public'"]
+        assert self.db.search_path_stats()["switches"] == 1
+        assert self.db.search_path_stats()["reuses"] == 1
+
+    def test_switches_when_schema_changes(self) -> None:
+        self.db.set_schema("acme")
+        self.db._cursor()
+        self.db.set_schema("globex")
+        self.db._cursor()
+
+        assert self._set_statements() == [
+            "SET search_path = 'acme','public'",
+            "SET search_path = 'globex','public'",
+        ]
+
+    def test_rollback_forgets_session_search_path(self) -> None:
+        self.db.set_schema("acme")
+        self.db._cursor()
+        self.db._rollback()
+        self.db._cursor()
+
+        assert len(self._set_statements()) == 2
+
+    def test_new_connection_resets_counters(self) -> None:
+        self.db.set_schema("acme")
+        self.db._cursor()
+
+        with mock.patch.object(original_backend.DatabaseWrapper, "connect"):
+            self.db.connect()
+
+        assert self.db.search_path_stats()["switches"] == 0
+        assert self.db.session_search_paths is None
+
+
+class OnRollbackTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.db = cast(DatabaseWrapper, connections.create_connection("default"))
+        self.db.connection = mock.Mock()
+        self.db.in_atomic_block = True
+        self.undo = mock.Mock()
+
+    def test_runs_on_rollback_only(self) -> None:
+        self.db.on_rollback(self.undo)
+        self.db._commit()
+        self.db._rollback()
+        self.undo.assert_not_called()
+
+        self.db.on_rollback(self.undo)
+        self.db._rollback()
+        self.undo.assert_called_once_with()
+
+    def test_savepoint_rollback_runs_only_its_callbacks(self) -> None:
+        outer = mock.Mock()
+        self.db.on_rollback(outer)
+        self.db.savepoint_ids = ["s1"]
+        self.db.on_rollback(self.undo)
+
+        with mock.patch.object(original_backend.DatabaseWrapper, "_savepoint_rollback"):
+            self.db._savepoint_rollback("s1")
+
+        self.undo.assert_called_once_with()
+        outer.assert_not_called()
+        assert [func for _, func in self.db.run_on_rollback] == [outer]
+
+    def test_failing_callback_does_not_mask_the_rollback(self) -> None:
+        self.db.on_rollback(self.undo)
+        self.db.on_rollback(mock.Mock(side_effect=DatabaseError("gone")))
+
+        with self.assertLogs("tenants.postgresql_backend.base", "ERROR"):
+            self.db._rollback()
+
+        self.undo.assert_called_once_with()
+
+    def test_ignored_outside_a_transaction(self) -> None:
+        self.db.in_atomic_block = False
+        self.db.on_rollback(self.undo)
+
+        assert self.db.run_on_rollback == []
+
+
+class TransactionScopedCursorTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.driver_cursor = mock.Mock()
+        self.cursor = TransactionScopedCursor(
+            self.driver_cursor, mock.Mock(autocommit=True), ["acme", "public"]
+        )
+
+    def test_prefixes_statements_in_autocommit(self) -> None:
+        self.cursor.execute("SELECT 1")
+
+        self.driver_cursor.execute.assert_called_once_with(
+            "SET LOCAL search_path = 'acme','public'; SELECT 1", None
+        )
+
+    def test_refuses_statements_that_cannot_run_in_a_transaction(self) -> None:
+        for sql in (
+            'CREATE INDEX CONCURRENTLY "user_username_trgm" ON "user_user" USING gin',
+            'DROP INDEX CONCURRENTLY IF EXISTS "user_username_trgm"',
+            "vacuum analyze user_user",
+        ):
+            with self.subTest(sql=sql), self.assertRaisesMessage(NotSupportedError, "session"):
+                self.cursor.execute(sql)
+
+        self.driver_cursor.execute.assert_not_called()
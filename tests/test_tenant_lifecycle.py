@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from control_plane.serializers import TenantBulkLifecycleSerializer
+from control_plane.views import TenantViewset
+from tenants import lifecycle, routing
+from tenants.models import Domain, Tenant
+from tenants.resolution import TenantResolutionCache, invalidate_tenants
+
+
+def _queryset(rows):
+    queryset = mock.Mock()
+    locked = queryset.order_by.return_value.select_for_update.return_value
+    locked.values_list.return_value = rows
+    return queryset
+
+
+class SetActiveTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.transaction = self.enterContext(mock.patch("tenants.lifecycle.transaction"))
+        self.stats = self.enterContext(mock.patch("tenants.lifecycle.stats"))
+        self.invalidate_tenants = self.enterContext(
+            mock.patch("tenants.lifecycle.invalidate_tenants")
+        )
+        patcher = mock.patch.object(Tenant.objects, "filter")
+        self.filter = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_suspends_only_active_tenants_in_one_update(self) -> None:
+        queryset = _queryset([(1, True), (2, False), (3, True)])
+
+        result = lifecycle.set_active(queryset, is_active=False)
+
+        assert result == lifecycle.LifecycleResult([1, 2, 3], [1, 3])
+        queryset.order_by.return_value.select_for_update.assert_called_once_with(of=("self",))
+        self.filter.assert_called_once_with(pk__in=[1, 3])
+        update_kwargs = self.filter.return_value.update.call_args.kwargs
+        assert update_kwargs["is_active"] is False
+        assert set(update_kwargs) == {"is_active", "suspended_at"}
+        self.stats.record_status_change.assert_called_once_with(False, count=2)
+        self.invalidate_tenants.assert_called_once_with(
+            self.filter.return_value.prefetch_related.return_value
+        )
+
+    def test_nothing_to_change_writes_nothing(self) -> None:
+        result = lifecycle.set_active(_queryset([(1, True)]), is_active=True)
+
+        assert result == lifecycle.LifecycleResult([1], [])
+        self.filter.assert_not_called()
+        self.stats.record_status_change.assert_not_called()
+        self.invalidate_tenants.assert_not_called()
+
+
+class BatchInvalidationTests(SimpleTestCase):
+    def _tenant(self, tenant_id, schema_name, *domains):
+        tenant = Tenant(id=tenant_id, schema_name=schema_name, name=schema_name)
+        # as loaded with prefetch_related("domains")
+        tenant._prefetched_objects_cache = {"domains": [Domain(domain=d) for d in domains]}
+        return tenant
+
+    @override_settings(TENANT_ROUTING_ENABLED=True)
+    def test_drops_local_entries_and_publishes_once(self) -> None:
+        cache = TenantResolutionCache(maxsize=4, ttl=60)
+        acme, globex = self._tenant(1, "acme"), self._tenant(2, "globex")
+        cache.set("acme.localhost", acme)
+        cache.set("globex.localhost", globex)
+
+        with (
+            mock.patch("tenants.resolution.tenant_resolution_cache", cache),
+            mock.patch("tenants.resolution.transaction.on_commit", side_effect=lambda fn: fn()),
+            mock.patch("tenants.routing.publish_tenant_changes") as publish,
+        ):
+            invalidate_tenants([acme, globex])
+
+        assert cache.stats()["size"] == 0
+        publish.assert_called_once_with([acme, globex])
+
+    def test_publish_uses_two_round_trips(self) -> None:
+        client = mock.Mock()
+        reads, writes = mock.Mock(), mock.Mock()
+        client.pipeline.side_effect = [reads, writes]
+        reads.execute.return_value = [{b"old.localhost"}, set()]
+        tenants = [
+            self._tenant(1, "acme", "acme.localhost"),
+            self._tenant(2, "globex", "globex.localhost"),
+        ]
+
+        with mock.patch("tenants.routing._redis", return_value=client):
+            routing.publish_tenant_changes(tenants)
+
+        assert reads.smembers.call_count == 2
+        writes.hdel.assert_called_once_with(routing.ROUTING_TABLE_KEY, "old.localhost")
+        assert writes.publish.call_count == 2
+        writes.execute.assert_called_once_with()
+
+
+class BulkLifecycleViewTests(SimpleTestCase):
+    def test_requires_ids_or_a_filter(self) -> None:
+        serializer = TenantBulkLifecycleSerializer(data={"action": "suspend", "q": " "})
+
+        assert not serializer.is_valid()
+        assert "non_field_errors" in serializer.errors
+
+    def test_filters_and_summarises(self) -> None:
+        result = lifecycle.LifecycleResult(matched=[1, 2], updated=[2])
+        request = SimpleNamespace(data={"action": "suspend", "ids": [1, 2, 9], "q": "acme"})
+
+        with mock.patch.object(lifecycle, "set_active", return_value=result) as set_active:
+            response = TenantViewset().bulk_lifecycle(request)
+
+        queryset = set_active.call_args.args[0]
+        sql, _ = queryset.query.sql_with_params()
+        assert '"tenants_tenant"."id" IN' in sql
+        assert "%%>" in sql
+        assert set_active.call_args.kwargs == {"is_active": False}
+        assert response.data == {
+            "action": "suspend",
+            "matched": 2,
+            "updated": 1,
+            "unchanged": 1,
+            "not_found": [9],
+        }
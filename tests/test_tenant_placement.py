@@ -0,0 +1,253 @@
+import importlib.util
+import os
+from typing import cast
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django_tenants.utils import get_public_schema_name
+
+from tenants import placement
+from tenants.migration_executors import PlacementExecutor
+from tenants.models import Tenant
+from tenants.postgresql_backend.base import DatabaseWrapper
+from tenants.routers import TenantPlacementRouter
+from tenants.routing import RoutingSubscriber
+
+User = get_user_model()
+
+CLUSTER_SETTINGS = {"TENANT_DATABASES": ["default", "cluster_b"]}
+
+
+def _load_settings(**environ):
+    """A fresh copy of config.settings.main evaluated with `environ`."""
+    spec = importlib.util.find_spec("config.settings.main")
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(os.environ, environ):
+        spec.loader.exec_module(module)
+    return module
+
+
+class _FakeTenant:
+    def __init__(self, schema_name):
+        self.schema_name = schema_name
+
+
+@override_settings(**CLUSTER_SETTINGS)
+class TenantPlacementRouterTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.router = TenantPlacementRouter()
+        patcher = mock.patch("tenants.routers._sync_tenant")
+        self.sync_tenant = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cast(DatabaseWrapper, connection).set_schema_to_public)
+
+    def _use(self, tenant):
+        patcher = mock.patch.object(connection, "tenant", tenant)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_tenant_models_follow_tenant_placement(self) -> None:
+        self._use(Tenant(schema_name="acme", database_alias="cluster_b"))
+
+        assert self.router.db_for_read(Tenant) is None
+        assert self.router.db_for_read(User) == "cluster_b"
+        assert self.router.db_for_write(User) == "cluster_b"
+        self.sync_tenant.assert_called_with("cluster_b")
+
+    def test_default_placement_falls_through(self) -> None:
+        self._use(Tenant(schema_name="acme", database_alias="default"))
+
+        assert self.router.db_for_read(User) is None
+
+    def test_schema_context_uses_placement_lookup(self) -> None:
+        self._use(_FakeTenant("acme"))
+
+        with mock.patch.object(placement.schema_placements, "get", return_value="cluster_b"):
+            assert self.router.db_for_write(User) == "cluster_b"
+
+    @override_settings(TENANT_DATABASES=["default"])
+    def test_single_cluster_skips_lookup(self) -> None:
+        self._use(_FakeTenant("acme"))
+
+        with mock.patch.object(placement.schema_placements, "get") as lookup:
+            assert self.router.db_for_read(User) is None
+
+        lookup.assert_not_called()
+
+    def test_clusters_only_migrate_tenant_apps_in_tenant_schemas(self) -> None:
+        cluster = mock.Mock(schema_name="acme")
+        with mock.patch("tenants.routers.connections", {"cluster_b": cluster}):
+            assert self.router.allow_migrate("cluster_b", "user") is True
+            assert self.router.allow_migrate("cluster_b", "tenants") is False
+
+            cluster.schema_name = get_public_schema_name()
+            assert self.router.allow_migrate("cluster_b", "user") is False
+
+        assert self.router.allow_migrate("default", "user") is None
+
+
+@override_settings(TENANT_DATABASES=["default", "cluster_b", "cluster_c"])
+class LeastLoadedDatabaseTests(SimpleTestCase):
+    def test_picks_emptiest_cluster(self) -> None:
+        counts = {"default": 40, "cluster_b": 12, "cluster_c": 30}
+        with mock.patch("tenants.placement._tenant_counts", return_value=counts):
+            assert placement.least_loaded_database() == "cluster_b"
+
+    def test_unused_cluster_counts_as_empty(self) -> None:
+        with mock.patch("tenants.placement._tenant_counts", return_value={"default": 3}):
+            assert placement.least_loaded_database() == "cluster_b"
+
+
+@override_settings(**CLUSTER_SETTINGS)
+class MoveTenantTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.tenant = Tenant(pk=7, schema_name="acme", is_active=True, database_alias="default")
+        self.calls: list[tuple] = []
+        for name in ("create_schema", "copy_schema_data", "drop_schema", "_set_serving"):
+            patcher = mock.patch(
+                f"tenants.placement.{name}",
+                side_effect=lambda *args, _name=name, **kwargs: self.calls.append(
+                    (_name, *args[1:])
+                ),
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch("tenants.placement.invalidate_tenant")
+        self.invalidate_tenant = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(Tenant, "save")
+        self.save = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_copies_then_flips_placement(self) -> None:
+        placement.move_tenant(self.tenant, "cluster_b")
+
+        assert self.calls == [
+            ("_set_serving", False),
+            ("create_schema",),
+            ("copy_schema_data", "default", "cluster_b"),
+            ("drop_schema", "default"),
+            ("_set_serving", True),
+        ]
+        assert self.tenant.database_alias == "cluster_b"
+        self.save.assert_called_once_with(update_fields=["database_alias"])
+        self.invalidate_tenant.assert_called_once_with(self.tenant)
+
+    def test_failed_copy_keeps_tenant_on_source(self) -> None:
+        with (
+            mock.patch("tenants.placement.copy_schema_data", side_effect=RuntimeError),
+            self.assertRaises(RuntimeError),
+        ):
+            placement.move_tenant(self.tenant, "cluster_b")
+
+        assert self.tenant.database_alias == "default"
+        assert ("drop_schema", "cluster_b") in self.calls
+        assert self.calls[-1] == ("_set_serving", True)
+        self.save.assert_not_called()
+
+    def test_rejects_unknown_database(self) -> None:
+        with self.assertRaises(ValueError):
+            placement.move_tenant(self.tenant, "cluster_z")
+
+        assert self.calls == []
+
+
+class CopySchemaDataTests(SimpleTestCase):
+    def _connection(self, cursor):
+        db = mock.Mock()
+        db.ops.quote_name = connection.ops.quote_name
+        db.ops.sql_flush.return_value = ["TRUNCATE"]
+        db.ops.sequence_reset_sql.return_value = ["SELECT setval"]
+        db.cursor.return_value.__enter__ = mock.Mock(return_value=cursor)
+        db.cursor.return_value.__exit__ = mock.Mock(return_value=False)
+        return db
+
+    def test_copies_rows_verbatim_through_copy(self) -> None:
+        source_cursor, target_cursor = mock.Mock(), mock.Mock()
+        received = []
+        source_cursor.copy_expert.side_effect = lambda sql, buffer: buffer.write(b"1\tjdoe\n")
+        target_cursor.copy_expert.side_effect = lambda sql, buffer: received.append(buffer.read())
+        databases = {
+            "default": self._connection(source_cursor),
+            "cluster_b": self._connection(target_cursor),
+        }
+
+        with (
+            mock.patch("tenants.placement.connections", databases),
+            mock.patch("tenants.placement.transaction"),
+            mock.patch("tenants.placement.tenant_models", return_value=[User]),
+            mock.patch.object(User.objects, "bulk_create") as bulk_create,
+        ):
+            placement.copy_schema_data("acme", "default", "cluster_b")
+
+        columns = ", ".join(f'"{field.column}"' for field in User._meta.local_concrete_fields)
+        source_cursor.copy_expert.assert_called_once_with(
+            f'COPY "acme"."user_user" ({columns}) TO STDOUT', mock.ANY
+        )
+        assert target_cursor.execute.call_args_list == [
+            mock.call("TRUNCATE"),
+            mock.call("SELECT setval"),
+        ]
+        assert target_cursor.copy_expert.call_args.args[0].endswith("FROM STDIN")
+        assert received == [b"1\tjdoe\n"]
+        bulk_create.assert_not_called()
+        databases["cluster_b"].set_schema_to_public.assert_called_once_with()
+
+
+class SetServingTests(SimpleTestCase):
+    def test_flips_flag_without_save_or_stats(self) -> None:
+        tenant = Tenant(id=7, schema_name="acme", is_active=True)
+
+        with (
+            mock.patch.object(Tenant.objects, "filter") as filter_,
+            mock.patch.object(Tenant, "save") as save,
+            mock.patch("tenants.placement.invalidate_tenant") as invalidate_tenant,
+        ):
+            placement._set_serving(tenant, False)
+
+        filter_.assert_called_once_with(pk=7)
+        filter_.return_value.update.assert_called_once_with(is_active=False)
+        save.assert_not_called()
+        assert tenant.is_active is False
+        assert tenant._saved_is_active is False
+        invalidate_tenant.assert_called_once_with(tenant)
+
+
+class PlacementExecutorTests(SimpleTestCase):
+    def test_each_schema_migrates_on_its_cluster(self) -> None:
+        placements = {"acme": "cluster_b", "globex": "default"}
+        executor = PlacementExecutor(args=(), options={"database": "default"})
+        with (
+            mock.patch.object(PlacementExecutor, "_placements", return_value=placements),
+            mock.patch("tenants.migration_executors.run_migrations") as run_migrations,
+        ):
+            executor.run_migrations(tenants=["acme", "globex"])
+
+        databases = {
+            call.args[3]: call.args[1]["database"] for call in run_migrations.call_args_list
+        }
+        assert databases == placements
+
+
+class PlacementInvalidationTests(SimpleTestCase):
+    def test_routing_message_evicts_schema_placement(self) -> None:
+        cache = placement.SchemaPlacementCache(ttl=60)
+        cache._entries["acme"] = ("default", float("inf"))
+        subscriber = RoutingSubscriber(mock.Mock())
+        subscriber.listeners.append(cache.handle_change)
+
+        subscriber.handle_message('{"tenant_id": 7, "schema_name": "acme", "hostnames": []}')
+
+        assert "acme" not in cache._entries
+
+
+class ClusterSettingsTests(SimpleTestCase):
+    def test_clusters_do_not_wrap_requests_in_transactions(self) -> None:
+        settings = _load_settings(DB_TENANT_CLUSTERS="cluster_b=db-b.internal")
+
+        assert settings.TENANT_DATABASES == ["default", "cluster_b"]
+        assert settings.DATABASES["cluster_b"]["HOST"] == "db-b.internal"
+        assert settings.DATABASES["cluster_b"]["ATOMIC_REQUESTS"] is False
+        assert settings.DATABASES["default"]["ATOMIC_REQUESTS"] is True
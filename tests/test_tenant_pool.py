@@ -0,0 +1,181 @@
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import set_urlconf
+from rest_framework.test import APIRequestFactory
+
+from config.health import readyz
+from control_plane.views import TenantViewset
+from tenants import pool
+from tenants.models import PooledSchema, Tenant
+
+Status = Tenant.ProvisioningStatus
+
+
+@override_settings(TENANT_POOL_SIZE=3)
+class PoolClaimTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.tenant = Tenant(id=3, schema_name="acme", subdomain="acme")
+        self._available = self.enterContext(mock.patch("tenants.pool._available"))
+        self.connections = self.enterContext(mock.patch("tenants.pool.connections"))
+        self.atomic = self.enterContext(mock.patch("tenants.pool.transaction.atomic"))
+
+    def _pooled(self, pooled):
+        locked = self._available.return_value.select_for_update.return_value
+        locked.order_by.return_value.first.return_value = pooled
+        return locked
+
+    def _cursor(self):
+        return self.connections["default"].cursor.return_value.__enter__.return_value
+
+    def test_claim_renames_oldest_unlocked_schema(self) -> None:
+        pooled = mock.Mock(spec=PooledSchema, schema_name="pool_0a1b")
+        locked = self._pooled(pooled)
+
+        assert pool.claim(self.tenant)
+
+        self._available.assert_called_once_with("default")
+        self._available.return_value.select_for_update.assert_called_once_with(skip_locked=True)
+        locked.order_by.assert_called_once_with("created_at")
+        self._cursor().execute.assert_called_once_with('ALTER SCHEMA "pool_0a1b" RENAME TO "acme"')
+        pooled.delete.assert_called_once_with()
+
+    def test_cluster_rename_is_undone_if_default_rolls_back(self) -> None:
+        self.tenant.database_alias = "cluster_b"
+        default, cluster = mock.MagicMock(), mock.MagicMock()
+        self.connections.__getitem__.side_effect = {"default": default, "cluster_b": cluster}.get
+        pooled = mock.Mock(spec=PooledSchema, schema_name="pool_0a1b")
+        self._pooled(pooled)
+
+        assert pool.claim(self.tenant)
+
+        self.atomic.assert_any_call(using="cluster_b")
+        execute = cluster.cursor.return_value.__enter__.return_value.execute
+        execute.assert_called_once_with('ALTER SCHEMA "pool_0a1b" RENAME TO "acme"')
+        pooled.delete.assert_called_once_with()
+
+        (undo,), _ = default.on_rollback.call_args
+        undo()
+        execute.assert_called_with('ALTER SCHEMA "acme" RENAME TO "pool_0a1b"')
+
+    def test_default_cluster_rename_rolls_back_with_the_pool_row(self) -> None:
+        self._pooled(mock.Mock(spec=PooledSchema, schema_name="pool_0a1b"))
+
+        assert pool.claim(self.tenant)
+
+        self.connections["default"].on_rollback.assert_not_called()
+
+    def test_empty_pool_falls_back_to_pipeline(self) -> None:
+        self._pooled(None)
+
+        assert not pool.claim(self.tenant)
+        self._cursor().execute.assert_not_called()
+
+    @override_settings(TENANT_POOL_SIZE=0)
+    def test_disabled_pool_skips_the_query(self) -> None:
+        assert not pool.claim(self.tenant)
+        self._available.assert_not_called()
+
+    def test_assign_marks_tenant_ready(self) -> None:
+        self._pooled(mock.Mock(spec=PooledSchema, schema_name="pool_0a1b"))
+        self.tenant.provisioning_status = Status.PENDING
+
+        with (
+            mock.patch("tenants.pool.provisioning") as provisioning,
+            mock.patch("tenants.pool.invalidate_tenant") as invalidate,
+        ):
+            assert pool.assign(self.tenant)
+
+        provisioning.create_primary_domain.assert_called_once_with(self.tenant)
+        provisioning.set_status.assert_called_once_with(3, Status.READY)
+        invalidate.assert_called_once_with(self.tenant)
+        assert self.tenant.is_provisioned
+
+
+@override_settings(TENANT_POOL_SIZE=3, TENANT_DATABASES=["default", "cluster_b"])
+class PoolRefillTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.discard_stale = self.enterContext(mock.patch("tenants.pool.discard_stale"))
+        self.available_counts = self.enterContext(mock.patch("tenants.pool.available_counts"))
+        self.fill_one = self.enterContext(mock.patch("tenants.pool.fill_one"))
+        self.cache = self.enterContext(mock.patch("tenants.pool.cache"))
+        self.discard_stale.return_value = 0
+        self.cache.add.return_value = True
+
+    def test_refill_tops_up_each_cluster_within_batch(self) -> None:
+        self.available_counts.return_value = {"default": 2, "cluster_b": 0}
+
+        result = pool.refill(batch_size=2)
+
+        assert result == {"created": {"default": 1, "cluster_b": 2}, "discarded": 0}
+        assert self.fill_one.call_args_list == [
+            mock.call("default"),
+            mock.call("cluster_b"),
+            mock.call("cluster_b"),
+        ]
+        self.cache.delete.assert_called_once_with(pool.REFILL_LOCK_KEY)
+
+    def test_concurrent_refill_is_skipped(self) -> None:
+        self.cache.add.return_value = False
+
+        assert pool.refill() is None
+        self.fill_one.assert_not_called()
+
+
+class PooledTenantCreateViewTests(SimpleTestCase):
+    def setUp(self) -> None:
+        set_urlconf("config.platform_urls")
+        self.addCleanup(set_urlconf, None)
+
+    def test_pooled_tenant_is_created_ready(self) -> None:
+        tenant = Tenant(id=3, name="Acme", subdomain="acme", provisioning_status=Status.READY)
+        view = TenantViewset(request=None, format_kwarg=None, action="create")
+        serializer = mock.Mock()
+        serializer.save.return_value = tenant
+        request = SimpleNamespace(
+            data={},
+            build_absolute_uri=APIRequestFactory().get("/").build_absolute_uri,
+        )
+
+        with (
+            mock.patch.object(view, "get_serializer", return_value=serializer),
+            mock.patch("control_plane.views.transaction") as transaction,
+            mock.patch("control_plane.views.provision_tenant") as provision,
+            mock.patch("control_plane.views.refill_tenant_pool") as refill,
+        ):
+            response = view.create(request)
+
+        assert response.status_code == 201
+        assert response.data["status"] == Status.READY
+        transaction.on_commit.assert_called_once_with(refill.delay)
+        provision.assert_not_called()
+
+
+class ReadyzPoolTests(SimpleTestCase):
+    def _readyz(self):
+        with (
+            mock.patch("config.health._check_database", return_value=True),
+            mock.patch("config.health._check_cache", return_value=True),
+        ):
+            response = readyz(RequestFactory().get("/readyz"))
+        return response.status_code, json.loads(response.content)
+
+    @override_settings(TENANT_POOL_SIZE=2)
+    def test_reports_pool_without_failing_readiness(self) -> None:
+        with mock.patch(
+            "config.health.available_counts", return_value={"default": 2, "cluster_b": 0}
+        ):
+            status_code, payload = self._readyz()
+
+        assert status_code == 200
+        assert payload["tenant_pool"] == {
+            "target": 2,
+            "available": {"default": 2, "cluster_b": 0},
+            "healthy": False,
+        }
+
+    @override_settings(TENANT_POOL_SIZE=0)
+    def test_disabled_pool_is_not_reported(self) -> None:
+        assert "tenant_pool" not in self._readyz()[1]
@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.urls import set_urlconf
+from rest_framework.test import APIRequestFactory
+
+from control_plane.views import TenantViewset
+from tenants import provisioning
+from tenants.models import Tenant
+from tenants.tasks import provision_tenant
+
+Status = Tenant.ProvisioningStatus
+
+
+class ProvisioningStepTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.tenant = Tenant(id=3, schema_name="acme", subdomain="acme")
+        self.objects = self.enterContext(mock.patch("tenants.provisioning.Tenant.objects"))
+        self.set_status = self.enterContext(mock.patch("tenants.provisioning.set_status"))
+        self.invalidate_tenant = self.enterContext(
+            mock.patch("tenants.provisioning.invalidate_tenant")
+        )
+        self.objects.get.return_value = self.tenant
+
+    def _steps(self, **overrides):
+        steps = {step: mock.Mock() for step in provisioning.STEPS}
+        steps.update(overrides)
+        return mock.patch.dict(provisioning.STEPS, steps)
+
+    def test_step_records_progress(self) -> None:
+        with self._steps() as steps:
+            provisioning.run_step(3, Status.MIGRATING)
+            steps[Status.MIGRATING].assert_called_once_with(self.tenant)
+
+        self.set_status.assert_called_once_with(3, Status.MIGRATING)
+        self.invalidate_tenant.assert_not_called()
+
+    def test_last_step_marks_tenant_ready(self) -> None:
+        with self._steps():
+            provisioning.run_step(3, Status.SEEDING)
+
+        assert self.set_status.call_args_list[-1] == mock.call(3, Status.READY)
+        self.invalidate_tenant.assert_called_once_with(self.tenant)
+
+    def test_failed_step_records_error(self) -> None:
+        failing = mock.Mock(side_effect=RuntimeError("relation exists"))
+
+        with self._steps(**{Status.MIGRATING: failing}), self.assertRaises(RuntimeError):
+            provisioning.run_step(3, Status.MIGRATING)
+
+        self.set_status.assert_called_with(3, Status.FAILED, "Migrating: relation exists")
+
+
+class ProvisioningPipelineTests(SimpleTestCase):
+    def test_pipeline_runs_steps_in_order(self) -> None:
+        with (
+            mock.patch("tenants.tasks.provisioning.set_status") as set_status,
+            mock.patch("tenants.tasks.chain") as chain,
+            mock.patch("tenants.tasks.provision_tenant_step.si", side_effect=lambda *a: a),
+        ):
+            provision_tenant(3)
+
+        set_status.assert_called_once_with(3, Status.PENDING)
+        assert chain.call_args.args == (
+            (3, Status.CREATING_SCHEMA),
+            (3, Status.MIGRATING),
+            (3, Status.CREATING_DOMAIN),
+            (3, Status.SEEDING),
+        )
+        chain.return_value.assert_called_once_with()
+
+    def test_pending_tenant_skips_synchronous_schema_creation(self) -> None:
+        assert Tenant(provisioning_status=Status.PENDING).auto_create_schema is False
+        assert Tenant().auto_create_schema is True
+
+
+class TenantCreateViewTests(SimpleTestCase):
+    def setUp(self) -> None:
+        set_urlconf("config.platform_urls")
+        self.addCleanup(set_urlconf, None)
+
+    def test_create_returns_provisioning_resource(self) -> None:
+        tenant = Tenant(id=3, name="Acme", subdomain="acme", provisioning_status=Status.PENDING)
+        view = TenantViewset(request=None, format_kwarg=None, action="create")
+        serializer = mock.Mock()
+        serializer.save.return_value = tenant
+        request = SimpleNamespace(
+            data={},
+            build_absolute_uri=APIRequestFactory().get("/").build_absolute_uri,
+        )
+
+        with (
+            mock.patch.object(view, "get_serializer", return_value=serializer),
+            mock.patch("control_plane.views.transaction") as transaction,
+            mock.patch("control_plane.views.provision_tenant") as provision,
+        ):
+            response = view.create(request)
+            transaction.on_commit.call_args.args[0]()
+
+        assert response.status_code == 202
+        assert response.data["status"] == Status.PENDING
+        assert response["Location"].endswith("/api/platform-mod/clients/3/provisioning")
+        provision.assert_called_once_with(3)
+
+    def test_retry_queues_pipeline_after_commit(self) -> None:
+        tenant = Tenant(id=3, name="Acme", subdomain="acme", provisioning_status=Status.FAILED)
+        view = TenantViewset(request=None, format_kwarg=None, action="retry_provisioning")
+        request = SimpleNamespace(
+            build_absolute_uri=APIRequestFactory().get("/").build_absolute_uri
+        )
+
+        with (
+            mock.patch.object(view, "get_object", return_value=tenant),
+            mock.patch.object(Tenant, "refresh_from_db"),
+            mock.patch("control_plane.views.provisioning.set_status") as set_status,
+            mock.patch("control_plane.views.transaction") as transaction,
+            mock.patch("control_plane.views.provision_tenant") as provision,
+        ):
+            response = view.retry_provisioning(request, pk=3)
+            provision.assert_not_called()
+            transaction.on_commit.call_args.args[0]()
+
+        assert response.status_code == 202
+        set_status.assert_called_once_with(3, Status.PENDING)
+        provision.assert_called_once_with(3)
@@ -0,0 +1,262 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from tenants import routing
+from tenants.models import Tenant
+from tenants.resolution import (
+    TenantResolutionCache,
+    invalidate_tenant,
+    resolve_tenant,
+    subdomain_from_hostname,
+)
+from tenants.routing import RoutingSubscriber
+
+
+def _tenant(pk, schema_name, is_active=True):
+    return Tenant(
+        pk=pk,
+        schema_name=schema_name,
+        name=schema_name.title(),
+        subdomain=schema_name,
+        is_active=is_active,
+    )
+
+
+class TenantResolutionCacheTests(SimpleTestCase):
+    def test_counts_hits_and_misses(self) -> None:
+        cache = TenantResolutionCache(maxsize=4, ttl=60)
+
+        assert cache.get("acme.localhost") is None
+        cache.set("acme.localhost", _tenant(1, "acme"))
+        cached = cache.get("acme.localhost")
+
+        assert cached.schema_name == "acme"
+        assert cache.stats() == {"size": 1, "maxsize": 4, "hits": 1, "misses": 1}
+
+    def test_returns_copies_of_cached_tenant(self) -> None:
+        cache = TenantResolutionCache(maxsize=4, ttl=60)
+        cache.set("acme.localhost", _tenant(1, "acme"))
+
+        first = cache.get("acme.localhost")
+        first.domain_url = "acme.localhost"
+
+        assert cache.get("acme.localhost").domain_url is None
+
+    def test_evicts_least_recently_used_host(self) -> None:
+        cache = TenantResolutionCache(maxsize=2, ttl=60)
+        cache.set("a.localhost", _tenant(1, "a"))
+        cache.set("b.localhost", _tenant(2, "b"))
+        cache.get("a.localhost")
+        cache.set("c.localhost", _tenant(3, "c"))
+
+        assert cache.get("b.localhost") is None
+        assert cache.get("a.localhost") is not None
+        assert cache.get("c.localhost") is not None
+
+    def test_expires_entries_after_ttl(self) -> None:
+        cache = TenantResolutionCache(maxsize=4, ttl=30)
+
+        with mock.patch("tenants.resolution.monotonic", return_value=100.0):
+            cache.set("acme.localhost", _tenant(1, "acme"))
+        with mock.patch("tenants.resolution.monotonic", return_value=131.0):
+            assert cache.get("acme.localhost") is None
+
+    def test_invalidate_tenant_drops_every_host(self) -> None:
+        cache = TenantResolutionCache(maxsize=4, ttl=60)
+        cache.set("acme.localhost", _tenant(1, "acme"))
+        cache.set("acme.example.com", _tenant(1, "acme"))
+        cache.set("other.localhost", _tenant(2, "other"))
+
+        cache.invalidate_tenant(1)
+
+        assert cache.get("acme.localhost") is None
+        assert cache.get("acme.example.com") is None
+        assert cache.get("other.localhost") is not None
+
+
+@override_settings(TENANT_ROUTING_ENABLED=False, PRIMARY_DOMAIN_SUFFIX="localhost")
+class ResolveTenantTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.cache = TenantResolutionCache(maxsize=4, ttl=60)
+        patcher = mock.patch("tenants.resolution.tenant_resolution_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_queries_domain_only_on_miss(self) -> None:
+        tenant = _tenant(1, "acme")
+        domain_model = mock.Mock()
+        domain_model.objects.select_related.return_value.get.return_value = mock.Mock(tenant=tenant)
+
+        with mock.patch("tenants.resolution.get_tenant_domain_model", return_value=domain_model):
+            resolve_tenant("acme.example.com")
+            resolved = resolve_tenant("acme.example.com")
+
+        assert resolved.schema_name == "acme"
+        assert domain_model.objects.select_related.return_value.get.call_count == 1
+        assert self.cache.stats()["hits"] == 1
+
+    def test_primary_domain_resolves_by_subdomain(self) -> None:
+        tenant_model = mock.Mock()
+        tenant_model.ProvisioningStatus.READY = "ready"
+        tenant_model.objects.filter.return_value.first.return_value = _tenant(1, "acme")
+
+        with (
+            mock.patch("tenants.resolution.get_tenant_model", return_value=tenant_model),
+            mock.patch("tenants.resolution.get_tenant_domain_model") as domain_model,
+        ):
+            resolved = resolve_tenant("ACME.localhost")
+
+        assert resolved.schema_name == "acme"
+        tenant_model.objects.filter.assert_called_once_with(
+            subdomain="acme", provisioning_status="ready"
+        )
+        domain_model.assert_not_called()
+
+    def test_unknown_subdomain_falls_back_to_domain(self) -> None:
+        tenant_model = mock.Mock()
+        tenant_model.ProvisioningStatus.READY = "ready"
+        tenant_model.objects.filter.return_value.first.return_value = None
+        domain_model = mock.Mock()
+        domain_model.objects.select_related.return_value.get.return_value = mock.Mock(
+            tenant=_tenant(1, "acme")
+        )
+
+        with (
+            mock.patch("tenants.resolution.get_tenant_model", return_value=tenant_model),
+            mock.patch("tenants.resolution.get_tenant_domain_model", return_value=domain_model),
+        ):
+            resolved = resolve_tenant("old-name.localhost")
+
+        assert resolved.schema_name == "acme"
+        domain_model.objects.select_related.return_value.get.assert_called_once_with(
+            domain="old-name.localhost", tenant__provisioning_status="ready"
+        )
+
+    def test_subdomain_parser_only_accepts_primary_domains(self) -> None:
+        assert subdomain_from_hostname("acme.localhost") == "acme"
+        assert subdomain_from_hostname("a.b.localhost") is None
+        assert subdomain_from_hostname("localhost") is None
+        assert subdomain_from_hostname("acme.example.com") is None
+
+    def test_invalidate_tenant_clears_resolution(self) -> None:
+        tenant = _tenant(1, "acme")
+        self.cache.set("acme.localhost", tenant)
+
+        with mock.patch("tenants.resolution.transaction.on_commit", side_effect=lambda fn: fn()):
+            invalidate_tenant(tenant)
+
+        assert self.cache.get("acme.localhost") is None
+
+
+@override_settings(TENANT_ROUTING_ENABLED=True)
+class RoutingTableTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.cache = TenantResolutionCache(maxsize=4, ttl=60)
+        for target, value in (
+            ("tenants.resolution.tenant_resolution_cache", self.cache),
+            ("tenants.resolution.routing_subscriber", mock.Mock()),
+        ):
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_resolves_from_routing_table_without_domain_lookup(self) -> None:
+        domain_model = mock.Mock()
+
+        with (
+            mock.patch("tenants.routing.load_route", return_value=_tenant(1, "acme", False)),
+            mock.patch("tenants.resolution.get_tenant_domain_model", return_value=domain_model),
+        ):
+            resolved = resolve_tenant("acme.localhost")
+
+        assert resolved.schema_name == "acme"
+        assert resolved.is_active is False
+        domain_model.objects.select_related.assert_not_called()
+
+    def test_backfills_routing_table_after_domain_lookup(self) -> None:
+        tenant = _tenant(1, "acme")
+        domain_model = mock.Mock()
+        domain_model.objects.select_related.return_value.get.return_value = mock.Mock(tenant=tenant)
+
+        with (
+            mock.patch("tenants.routing.load_route", return_value=None),
+            mock.patch("tenants.routing.store_route") as store_route,
+            mock.patch("tenants.resolution.get_tenant_domain_model", return_value=domain_model),
+        ):
+            resolve_tenant("acme.example.com")
+
+        store_route.assert_called_once_with("acme.example.com", tenant)
+
+    def test_invalidation_publishes_tenant_change(self) -> None:
+        tenant = _tenant(1, "acme")
+
+        with (
+            mock.patch("tenants.resolution.transaction.on_commit", side_effect=lambda fn: fn()),
+            mock.patch("tenants.routing.publish_tenant_change") as publish,
+        ):
+            invalidate_tenant(tenant)
+
+        publish.assert_called_once_with(tenant)
+
+    def test_subscriber_evicts_published_hosts(self) -> None:
+        self.cache.set("acme.localhost", _tenant(1, "acme"))
+        self.cache.set("old.localhost", _tenant(1, "acme"))
+
+        RoutingSubscriber(self.cache).handle_message(
+            '{"tenant_id": 1, "hostnames": ["acme.localhost", "old.localhost"]}'
+        )
+
+        assert self.cache.stats()["size"] == 0
+
+
+@override_settings(TENANT_ROUTING_TTL=60)
+class RouteExpiryTests(SimpleTestCase):
+    def _load(self, raw, now):
+        client = mock.Mock()
+        client.hget.return_value = raw
+        with (
+            mock.patch("tenants.routing._redis", return_value=client),
+            mock.patch("tenants.routing.time", return_value=now),
+        ):
+            return routing.load_route("acme.localhost")
+
+    def test_entry_is_served_until_it_expires(self) -> None:
+        with mock.patch("tenants.routing.time", return_value=1000.0):
+            raw = routing._route_entry(_tenant(1, "acme"))
+
+        assert self._load(raw, now=1059.0).schema_name == "acme"
+        assert self._load(raw, now=1061.0) is None
+
+    def test_entry_without_expiry_is_re_resolved(self) -> None:
+        raw = routing._route_entry(_tenant(1, "acme")).replace('"expires_at"', '"written_at"')
+
+        assert self._load(raw, now=1000.0) is None
+
+
+class RouteReadinessTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.redis = mock.Mock()
+        self.enterContext(mock.patch("tenants.routing._redis", return_value=self.redis))
+        self.tenant = _tenant(1, "acme")
+        self.tenant.provisioning_status = Tenant.ProvisioningStatus.FAILED
+
+    def test_unready_tenant_is_not_served_or_stored(self) -> None:
+        self.redis.hget.return_value = routing._route_entry(self.tenant)
+
+        assert routing.load_route("acme.localhost") is None
+        routing.store_route("acme.localhost", self.tenant)
+        self.redis.pipeline.assert_not_called()
+
+    def test_publishing_unready_tenant_drops_its_routes(self) -> None:
+        reads, writes = mock.Mock(), mock.Mock()
+        self.redis.pipeline.side_effect = [reads, writes]
+        reads.execute.return_value = [{b"acme.localhost"}]
+        # a PATCH on a failed tenant still publishes its change
+        self.tenant._prefetched_objects_cache = {"domains": []}
+
+        routing.publish_tenant_change(self.tenant)
+
+        writes.hdel.assert_called_once_with(routing.ROUTING_TABLE_KEY, "acme.localhost")
+        writes.hset.assert_not_called()
+        writes.publish.assert_called_once()
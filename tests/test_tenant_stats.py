@@ -0,0 +1,150 @@
+from datetime import date
+from unittest import mock
+
+from django.test import RequestFactory, SimpleTestCase
+from django_tenants.models import TenantMixin
+
+from control_plane.views import KnownCountPaginator, _tenant_stats
+from tenants import stats
+from tenants.models import Tenant
+
+
+def _loaded_tenant(is_active):
+    return Tenant.from_db(
+        "default",
+        ["id", "schema_name", "is_active"],
+        [1, "acme", is_active],
+    )
+
+
+class TenantStatsHookTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.record_created = self.enterContext(mock.patch("tenants.stats.record_created"))
+        self.record_status_change = self.enterContext(
+            mock.patch("tenants.stats.record_status_change")
+        )
+        patcher = mock.patch.object(TenantMixin, "save")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_new_tenant_is_counted(self) -> None:
+        tenant = Tenant(schema_name="acme", is_active=True)
+
+        tenant.save()
+
+        self.record_created.assert_called_once_with(tenant)
+
+    def test_status_flip_is_counted_once(self) -> None:
+        tenant = _loaded_tenant(is_active=True)
+
+        tenant.is_active = False
+        tenant.save(update_fields=["is_active", "suspended_at"])
+        tenant.save(update_fields=["is_active", "suspended_at"])
+
+        self.record_status_change.assert_called_once_with(False)
+
+    def test_save_without_status_change_is_ignored(self) -> None:
+        tenant = _loaded_tenant(is_active=True)
+
+        tenant.name = "Acme"
+        tenant.save()
+
+        self.record_status_change.assert_not_called()
+        self.record_created.assert_not_called()
+
+
+class FakeRollup:
+    def __init__(self, data=None):
+        self.data = data
+
+    def hgetall(self, key):
+        return {k.encode(): str(v).encode() for k, v in (self.data or {}).items()}
+
+    def eval(self, script, numkeys, key, *args):
+        if self.data is None:
+            return 0
+        for field, delta in zip(args[::2], args[1::2], strict=True):
+            self.data[field] = self.data.get(field, 0) + delta
+        return 1
+
+
+class TenantStatsRollupTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.redis = FakeRollup()
+        for target, value in (
+            ("tenants.stats._redis", lambda: self.redis),
+            ("tenants.stats.timezone.localdate", lambda *args: date(2026, 10, 18)),
+            ("tenants.stats.transaction.on_commit", lambda fn: fn()),
+        ):
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_reads_counts_from_rollup(self) -> None:
+        self.redis.data = {
+            "total": 12,
+            "active": 9,
+            "suspended": 3,
+            "created:2026-10-18": 2,
+            "created:2026-09-20": 1,
+            "created:2026-09-01": 5,
+        }
+
+        with mock.patch("tenants.stats.rebuild") as rebuild:
+            result = stats.get_stats()
+
+        assert result == {"total": 12, "active": 9, "suspended": 3, "recent": 3}
+        rebuild.assert_not_called()
+
+    def test_missing_rollup_is_rebuilt(self) -> None:
+        with mock.patch("tenants.stats.rebuild", return_value={"total": 1, "active": 1}) as rebuild:
+            result = stats.get_stats()
+
+        rebuild.assert_called_once_with()
+        assert result["total"] == 1
+
+    def test_transitions_update_rollup(self) -> None:
+        self.redis.data = {"total": 2, "active": 2, "suspended": 0}
+        tenant = Tenant(schema_name="acme", is_active=False, created_at=mock.Mock())
+
+        stats.record_created(tenant)
+        stats.record_status_change(True)
+
+        assert self.redis.data == {
+            "total": 3,
+            "active": 3,
+            "suspended": 0,
+            "created:2026-10-18": 1,
+        }
+
+    def test_increments_skip_missing_rollup(self) -> None:
+        stats.record_status_change(True)
+
+        assert self.redis.data is None
+
+
+class TenantStatsViewTests(SimpleTestCase):
+    def test_filtered_views_use_single_aggregate(self) -> None:
+        request = RequestFactory().get("/dashboard/clients", {"status": "active"})
+        queryset = mock.Mock()
+        queryset.aggregate.return_value = {"total": 1}
+
+        with mock.patch("tenants.stats.get_stats") as get_stats:
+            assert _tenant_stats(request, queryset) == {"total": 1}
+
+        queryset.aggregate.assert_called_once()
+        get_stats.assert_not_called()
+
+    def test_unfiltered_views_read_rollup(self) -> None:
+        request = RequestFactory().get("/dashboard/clients")
+
+        with mock.patch("tenants.stats.get_stats", return_value={"total": 4}):
+            assert _tenant_stats(request, mock.Mock()) == {"total": 4}
+
+    def test_paginator_uses_known_count(self) -> None:
+        queryset = mock.MagicMock()
+
+        paginator = KnownCountPaginator(queryset, 10, count=25)
+
+        assert paginator.num_pages == 3
+        queryset.count.assert_not_called()
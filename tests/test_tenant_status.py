@@ -0,0 +1,46 @@
+from unittest import mock
+
+from django.db import connections
+from django.test import SimpleTestCase, override_settings
+
+from control_plane.auth import PLATFORM_JWT_COOKIE, generate_token
+from tenants.models import Tenant
+from tenants.resolution import TenantResolutionCache
+
+
+@override_settings(TENANT_ROUTING_ENABLED=False)
+class SuspendedTenantFastPathTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.cache = TenantResolutionCache(maxsize=4, ttl=60)
+        self.cache.set(
+            "acme.localhost",
+            Tenant(pk=1, schema_name="acme", name="Acme", subdomain="acme", is_active=False),
+        )
+        patcher = mock.patch("tenants.resolution.tenant_resolution_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_suspended_tenant_is_rejected_without_db_or_cache_reads(self) -> None:
+        # The platform JWT cookie makes PlatformUserJWTMiddleware query if it
+        # is ever reached; every connection attempt and cache read is recorded.
+        self.client.cookies[PLATFORM_JWT_COOKIE] = generate_token(1)
+
+        with (
+            mock.patch.object(
+                connections["default"], "cursor", side_effect=RuntimeError("database touched")
+            ) as db_cursor,
+            mock.patch("django_redis.cache.RedisCache.get") as cache_get,
+            mock.patch("django_redis.cache.RedisCache.get_many") as cache_get_many,
+            mock.patch("tenants.routing._redis") as routing_redis,
+        ):
+            response = self.client.get("/api/v1/internal/", HTTP_HOST="acme.localhost")
+
+        assert response.status_code == 403
+        assert response.json() == {
+            "error": "Your account has been suspended. Please contact software vendor."
+        }
+        db_cursor.assert_not_called()
+        cache_get.assert_not_called()
+        cache_get_many.assert_not_called()
+        routing_redis.assert_not_called()
+        assert self.cache.stats()["hits"] == 1
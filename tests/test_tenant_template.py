@@ -0,0 +1,88 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from tenants import provisioning, template
+from tenants.models import Tenant
+
+
+class TemplateFreshnessTests(SimpleTestCase):
+    def test_heads_cover_tenant_apps_only(self) -> None:
+        heads = template.migration_heads()
+
+        apps = {app for app, _ in heads}
+        assert {"user", "auth", "contenttypes"} <= apps
+        assert "tenants" not in apps
+
+    def test_migration_state_digests_heads(self) -> None:
+        with mock.patch(
+            "tenants.template.migration_heads",
+            return_value=frozenset({("user", "0005_trigram_search")}),
+        ):
+            state = template.migration_state()
+
+        assert len(state) == 16
+        assert state != template.migration_state()
+
+    def test_template_at_head_is_current(self) -> None:
+        heads = frozenset({("user", "0005_trigram_search"), ("auth", "0012")})
+        with (
+            mock.patch("tenants.template.schema_exists", return_value=True),
+            mock.patch("tenants.template.migration_heads", return_value=heads),
+            mock.patch(
+                "tenants.template.applied_migrations",
+                return_value={*heads, ("user", "0004_user_user_directory_idx")},
+            ),
+        ):
+            assert template.template_is_current("default")
+
+    def test_template_behind_head_is_stale(self) -> None:
+        with (
+            mock.patch("tenants.template.schema_exists", return_value=True),
+            mock.patch(
+                "tenants.template.migration_heads",
+                return_value=frozenset({("user", "0005_trigram_search")}),
+            ),
+            mock.patch(
+                "tenants.template.applied_migrations",
+                return_value={("user", "0004_user_user_directory_idx")},
+            ),
+        ):
+            assert not template.template_is_current("default")
+
+    def test_missing_template_is_stale(self) -> None:
+        with mock.patch("tenants.template.schema_exists", return_value=False):
+            assert not template.template_is_current("default")
+
+
+@override_settings(TENANT_PROVISIONING_MODE="clone")
+class CloneProvisioningTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.tenant = Tenant(id=3, schema_name="acme", subdomain="acme")
+        self.schema_exists = self.enterContext(mock.patch("tenants.provisioning.schema_exists"))
+        self.connections = self.enterContext(mock.patch("tenants.provisioning.connections"))
+        self.clone_template = self.enterContext(mock.patch("tenants.template.clone_template"))
+        self.schema_exists.return_value = False
+
+    def _cursor(self):
+        return self.connections["default"].cursor.return_value.__enter__.return_value
+
+    def test_clones_current_template(self) -> None:
+        with mock.patch("tenants.template.template_is_current", return_value=True):
+            provisioning.create_schema(self.tenant)
+
+        self.clone_template.assert_called_once_with("acme", "default")
+        self._cursor().execute.assert_not_called()
+
+    def test_stale_template_falls_back_to_empty_schema(self) -> None:
+        with mock.patch("tenants.template.template_is_current", return_value=False):
+            provisioning.create_schema(self.tenant)
+
+        self.clone_template.assert_not_called()
+        self._cursor().execute.assert_called_once_with('CREATE SCHEMA IF NOT EXISTS "acme"')
+
+    @override_settings(TENANT_PROVISIONING_MODE="migrate")
+    def test_migrate_mode_never_clones(self) -> None:
+        provisioning.create_schema(self.tenant)
+
+        self.clone_template.assert_not_called()
@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from control_plane.views import TenantUserViewset
+from tenants import fleet, user_stats
+from tenants.tasks import collect_fleet_user_stats, collect_tenant_user_stats
+
+
+def _user(is_active=True, is_staff=True, is_superuser=False):
+    return SimpleNamespace(is_active=is_active, is_staff=is_staff, is_superuser=is_superuser)
+
+
+class UserDeltaTests(SimpleTestCase):
+    def test_new_user_counts_every_flag(self) -> None:
+        after = user_stats.user_flags(_user(is_superuser=True))
+
+        assert user_stats.user_deltas(None, after) == {
+            "total": 1,
+            "active": 1,
+            "staff": 1,
+            "admins": 1,
+        }
+
+    def test_deactivation_only_moves_active(self) -> None:
+        before = user_stats.user_flags(_user())
+        after = user_stats.user_flags(_user(is_active=False))
+
+        assert user_stats.user_deltas(before, after) == {"active": -1}
+
+    def test_unchanged_user_has_no_deltas(self) -> None:
+        flags = user_stats.user_flags(_user())
+
+        assert user_stats.user_deltas(flags, flags) == {}
+
+
+class UserStatsSnapshotTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.tenant = SimpleNamespace(pk=3, schema_name="acme")
+
+    def test_reads_cached_counts(self) -> None:
+        counts = {"total": 5, "active": 4, "staff": 2, "admins": 1}
+        with (
+            mock.patch("tenants.user_stats.cache.get", return_value=counts),
+            mock.patch("tenants.user_stats.count_users") as count_users,
+        ):
+            assert user_stats.get_user_stats(self.tenant) == counts
+
+        count_users.assert_not_called()
+
+    def test_falls_back_to_snapshot_table(self) -> None:
+        snapshot = {"total": 5, "active": 4, "staff": 2, "admins": 1}
+        with (
+            mock.patch("tenants.user_stats.cache") as cache,
+            mock.patch("tenants.user_stats.TenantUserStats") as model,
+            mock.patch("tenants.user_stats.count_users") as count_users,
+        ):
+            cache.get.return_value = None
+            model.objects.filter.return_value.values.return_value.first.return_value = snapshot
+            assert user_stats.get_user_stats(self.tenant) == snapshot
+
+        cache.set.assert_called_once_with("tenant-user-stats:3", snapshot, timeout=None)
+        count_users.assert_not_called()
+
+    def test_deltas_update_snapshot_after_commit(self) -> None:
+        with (
+            mock.patch("tenants.user_stats.transaction.on_commit") as on_commit,
+            mock.patch("tenants.user_stats.TenantUserStats") as model,
+            mock.patch("tenants.user_stats.cache") as cache,
+        ):
+            user_stats.apply_user_deltas(3, {"active": -1})
+            model.objects.filter.assert_not_called()
+
+            on_commit.call_args.args[0]()
+
+        model.objects.filter.assert_called_once_with(tenant_id=3)
+        (update_kwargs,) = [
+            call.kwargs for call in model.objects.filter.return_value.update.mock_calls
+        ]
+        assert list(update_kwargs) == ["active"]
+        cache.delete.assert_called_once_with("tenant-user-stats:3")
+
+
+class TenantUserViewsetDeltaTests(SimpleTestCase):
+    def test_update_applies_flag_deltas(self) -> None:
+        view = TenantUserViewset()
+        view._tenant = SimpleNamespace(pk=3, schema_name="acme")
+        user = _user()
+        serializer = mock.Mock(instance=user)
+
+        def save():
+            user.is_active = False
+            return user
+
+        serializer.save.side_effect = save
+
+        with (
+            mock.patch("control_plane.views.schema_context"),
+            mock.patch("tenants.user_stats.apply_user_deltas") as apply_user_deltas,
+        ):
+            view.perform_update(serializer)
+
+        apply_user_deltas.assert_called_once_with(3, {"active": -1})
+
+
+class FleetCollectionTests(SimpleTestCase):
+    def test_snapshots_every_tenant_in_one_union_pass(self) -> None:
+        counts = {"total": 4, "active": 3, "staff": 1, "admins": 1}
+        results = [
+            fleet.TenantResult(3, "acme", [counts], "", 0.1),
+            fleet.TenantResult(4, "globex", None, "RuntimeError: timeout", 0.1),
+        ]
+        on_error = mock.Mock()
+
+        with (
+            mock.patch.object(fleet, "query_schemas", return_value=iter(results)) as query,
+            mock.patch("tenants.user_stats.store_snapshot") as store_snapshot,
+        ):
+            assert user_stats.collect_fleet(on_error=on_error) == {"collected": 1, "failed": 1}
+
+        store_snapshot.assert_called_once_with(3, counts)
+        on_error.assert_called_once_with(4, "globex")
+        assert query.call_args.kwargs["union"] is True
+        sql = query.call_args.args[0]
+        assert 'FROM {schema}."user_user"' in sql
+        assert "FILTER (WHERE is_superuser) AS admins" in sql
+
+    def test_failed_schemas_are_recounted_per_schema(self) -> None:
+        with (
+            mock.patch("tenants.tasks.user_stats.collect_fleet") as collect_fleet,
+            mock.patch.object(collect_tenant_user_stats, "apply_async") as apply_async,
+        ):
+            collect_fleet_user_stats.run()
+            collect_fleet.call_args.kwargs["on_error"](4, "globex")
+
+        apply_async.assert_called_once_with(args=(4,), headers={"schema_name": "globex"})
+
+    def test_collector_stores_schema_counts(self) -> None:
+        counts = {"total": 2, "active": 2, "staff": 1, "admins": 1}
+        with (
+            mock.patch("tenants.user_stats.count_users", return_value=counts),
+            mock.patch("tenants.user_stats.store_snapshot") as store_snapshot,
+        ):
+            collect_tenant_user_stats.run(3)
+
+        store_snapshot.assert_called_once_with(3, counts)
@@ -0,0 +1,122 @@
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import RequestFactory, SimpleTestCase
+from django.urls import set_urlconf
+
+from control_plane import views
+from control_plane.views import TenantUserViewset, tenant_users_bulk_status
+from src.user.models import User
+from tenants.models import Tenant
+
+
+def _sql(queryset):
+    return queryset.query.sql_with_params()
+
+
+class SetUsersActiveTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.tenant = Tenant(id=3, schema_name="acme", database_alias="cluster_b")
+        self.schema_context = self.enterContext(mock.patch("control_plane.views.schema_context"))
+        self.transaction = self.enterContext(mock.patch("control_plane.views.transaction"))
+        self.directory = self.enterContext(mock.patch("control_plane.views.directory"))
+        self.user_stats = self.enterContext(mock.patch("control_plane.views.user_stats"))
+        patcher = mock.patch.object(User.objects, "filter")
+        self.filter = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _queryset(self, rows):
+        queryset = mock.Mock()
+        queryset.order_by.return_value.select_for_update.return_value.values_list.return_value = (
+            rows
+        )
+        return queryset
+
+    def test_deactivates_active_users_in_one_update(self) -> None:
+        changed = [User(id=1, username="ann"), User(id=4, username="bob")]
+        self.filter.return_value.only.return_value.order_by.return_value = changed
+
+        matched, users = views._set_users_active(
+            self.tenant, self._queryset([(1, True), (2, False), (4, True)]), is_active=False
+        )
+
+        assert (matched, users) == ([1, 2, 4], changed)
+        self.filter.assert_called_once_with(pk__in=[1, 4])
+        self.filter.return_value.update.assert_called_once_with(is_active=False)
+        self.transaction.atomic.assert_called_once_with(using="cluster_b")
+        self.directory.sync_users.assert_called_once_with(3, changed, using="cluster_b")
+        self.user_stats.apply_user_deltas.assert_called_once_with(3, {"active": -2})
+
+    def test_nothing_to_change_writes_nothing(self) -> None:
+        matched, users = views._set_users_active(
+            self.tenant, self._queryset([(1, True)]), is_active=True
+        )
+
+        assert (matched, users) == ([1], [])
+        self.filter.assert_not_called()
+        self.user_stats.apply_user_deltas.assert_not_called()
+
+
+class BulkStatusViewTests(SimpleTestCase):
+    def setUp(self) -> None:
+        set_urlconf("config.platform_urls")
+        self.addCleanup(set_urlconf, None)
+        self.tenant = Tenant(id=3, schema_name="acme")
+        patcher = mock.patch("control_plane.views.get_object_or_404", return_value=self.tenant)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _request(self, data, **headers):
+        request = RequestFactory().post("/dashboard/clients/3/users/bulk-status", data, **headers)
+        request.platform_user = SimpleNamespace(is_active=True, is_platform_admin=True)
+        return request
+
+    def test_htmx_response_swaps_only_changed_rows(self) -> None:
+        user = User(id=2, username="zed", email="", is_active=False)
+
+        with mock.patch.object(
+            views, "_set_users_active", return_value=([1, 2], [user])
+        ) as set_users_active:
+            response = tenant_users_bulk_status(
+                self._request({"action": "deactivate", "ids": ["1", "2"]}, HTTP_HX_REQUEST="true"),
+                tenant_pk=3,
+            )
+
+        body = response.content.decode()
+        assert body.count("<tr ") == 1
+        assert '<tr id="user-2"' in body
+        assert 'hx-swap-oob="true"' in body
+        assert json.loads(response["HX-Trigger"])["showToast"]["message"] == "1 user(s) disabled."
+        sql, params = _sql(set_users_active.call_args.args[1])
+        assert '"user_user"."id" IN' in sql
+        assert {1, 2} <= set(params)
+        assert set_users_active.call_args.args[2] is False
+
+    def test_empty_selection_is_rejected(self) -> None:
+        with mock.patch.object(views, "_set_users_active") as set_users_active:
+            response = tenant_users_bulk_status(self._request({"action": "activate"}), tenant_pk=3)
+
+        assert response.status_code == 400
+        set_users_active.assert_not_called()
+
+    def test_api_summarises_staff_users(self) -> None:
+        view = TenantUserViewset()
+        view._tenant = self.tenant
+        request = SimpleNamespace(data={"action": "activate", "status": "disabled", "ids": [5, 6]})
+
+        with mock.patch.object(
+            views, "_set_users_active", return_value=([5], [User(id=5)])
+        ) as set_users_active:
+            response = view.bulk_status(request)
+
+        sql, _ = _sql(set_users_active.call_args.args[1])
+        assert '"user_user"."is_staff"' in sql
+        assert set_users_active.call_args.kwargs == {"is_active": True}
+        assert response.data == {
+            "action": "activate",
+            "matched": 1,
+            "updated": 1,
+            "unchanged": 0,
+            "not_found": [6],
+        }
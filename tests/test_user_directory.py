@@ -0,0 +1,158 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.db.models.signals import post_save
+from django.test import SimpleTestCase
+from rest_framework.test import APIRequestFactory
+
+from control_plane.views import UserDirectoryViewset
+from src.user.models import User
+from tenants import directory, fleet
+from tenants.models import UserDirectoryEntry
+
+
+def _sql(queryset):
+    return queryset.query.sql_with_params()
+
+
+class DirectorySyncTests(SimpleTestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch("tenants.directory.connection")
+        self.connection = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.connection.schema_name = "acme"
+        self.connection.tenant = SimpleNamespace(pk=3, schema_name="acme")
+
+    def test_user_save_upserts_entry_after_commit(self) -> None:
+        user = User(id=7, username="JDoe", email="JDoe@Example.com", is_staff=True)
+
+        with (
+            mock.patch("tenants.directory.transaction.on_commit") as on_commit,
+            mock.patch.object(UserDirectoryEntry.objects, "update_or_create") as upsert,
+        ):
+            directory.schedule_sync(user, "cluster_b")
+            callback = on_commit.call_args.args[0]
+            callback()
+
+        assert on_commit.call_args.kwargs == {"using": "cluster_b"}
+        upsert.assert_called_once_with(
+            tenant_id=3,
+            user_id=7,
+            defaults={
+                "username": "JDoe",
+                "email": "jdoe@example.com",
+                "is_active": True,
+                "is_staff": True,
+            },
+        )
+
+    def test_delete_removes_entry(self) -> None:
+        with (
+            mock.patch("tenants.directory.transaction.on_commit", side_effect=lambda f, using: f()),
+            mock.patch("tenants.directory.remove_user") as remove_user,
+        ):
+            directory.schedule_sync(User(id=7), "default", deleted=True)
+
+        remove_user.assert_called_once_with(3, 7)
+
+    def test_public_schema_users_are_not_indexed(self) -> None:
+        self.connection.schema_name = "public"
+
+        with mock.patch("tenants.directory.transaction.on_commit") as on_commit:
+            directory.schedule_sync(User(id=7), "default")
+
+        on_commit.assert_not_called()
+
+    def test_post_save_signal_is_connected(self) -> None:
+        with mock.patch("tenants.directory.schedule_sync") as schedule_sync:
+            post_save.send(sender=User, instance=User(id=7), created=True, using="default")
+
+        schedule_sync.assert_called_once()
+
+    def test_saves_that_skip_directory_fields_do_not_sync(self) -> None:
+        with mock.patch("tenants.directory.schedule_sync") as schedule_sync:
+            for update_fields in ({"last_login"}, {"last_login", "is_active"}):
+                post_save.send(
+                    sender=User,
+                    instance=User(id=7),
+                    created=False,
+                    using="default",
+                    update_fields=frozenset(update_fields),
+                )
+
+        schedule_sync.assert_called_once()
+
+
+class DirectorySearchTests(SimpleTestCase):
+    def test_short_query_is_prefix_only(self) -> None:
+        sql, params = _sql(directory.search("JD"))
+
+        assert 'LOWER("tenants_userdirectoryentry"."username")::text LIKE %s' in sql
+        assert '"tenants_userdirectoryentry"."email"::text LIKE %s' in sql
+        assert "%%>" not in sql
+        assert params == ("jd%", "jd%")
+
+    def test_longer_query_adds_trigram_match_after_prefix_hits(self) -> None:
+        queryset = directory.search("jdoe@exa")
+
+        sql, _ = _sql(queryset)
+        assert '"tenants_userdirectoryentry"."email" %%> %s' in sql
+        assert queryset.query.order_by == (
+            "-prefix_match",
+            "-search_rank",
+            "username_lower",
+            "tenant_id",
+        )
+
+    def test_blank_query_matches_nothing(self) -> None:
+        assert directory.search("  ").query.is_empty()
+
+
+class DirectoryRebuildTests(SimpleTestCase):
+    def test_replaces_each_tenants_rows(self) -> None:
+        results = [
+            fleet.TenantResult(
+                3,
+                "acme",
+                [
+                    {
+                        "user_id": 7,
+                        "username": "jdoe",
+                        "email": "JDoe@Example.com",
+                        "is_active": True,
+                        "is_staff": False,
+                    }
+                ],
+                "",
+                0.1,
+            ),
+            fleet.TenantResult(4, "globex", None, "RuntimeError: timeout", 0.1),
+        ]
+
+        with (
+            mock.patch.object(fleet, "query_schemas", return_value=iter(results)),
+            mock.patch("tenants.directory.transaction.atomic"),
+            mock.patch.object(UserDirectoryEntry.objects, "filter") as filter_,
+            mock.patch.object(UserDirectoryEntry.objects, "bulk_create") as bulk_create,
+        ):
+            result = directory.rebuild()
+
+        assert result == {"tenants": 1, "users": 1, "failed": ["globex"]}
+        filter_.assert_called_once_with(tenant_id=3)
+        (entry,) = bulk_create.call_args.args[0]
+        assert (entry.tenant_id, entry.user_id, entry.email) == (3, 7, "jdoe@example.com")
+
+
+class UserDirectoryViewsetTests(SimpleTestCase):
+    def test_filters_by_client_and_searches(self) -> None:
+        view = UserDirectoryViewset()
+        view.request = SimpleNamespace(
+            query_params=APIRequestFactory().get("/", {"q": "jdoe", "client": "3"}).GET
+        )
+
+        sql, params = _sql(view.get_queryset())
+
+        assert '"tenants_userdirectoryentry"."tenant_id" = %s' in sql
+        assert 3 in params
+        assert "jdoe%" in params
+        assert 'INNER JOIN "tenants_tenant"' in sql
@@ -0,0 +1,225 @@
+import io
+import tempfile
+from concurrent.futures.process import BrokenProcessPool
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+
+from control_plane import user_import
+from control_plane.views import TenantUserViewset
+from src.user.models import User
+from tenants.models import Tenant
+
+
+def _rows(text, file_format):
+    return list(user_import.read_rows(io.BytesIO(text.encode()), file_format))
+
+
+class ReadRowsTests(SimpleTestCase):
+    def test_csv_rows_are_numbered_by_line_and_skip_empty_cells(self) -> None:
+        rows = _rows("username,email,password,is_active\njdoe,jdoe@example.com,s3cret,\n", "csv")
+
+        assert rows == [
+            (2, {"username": "jdoe", "email": "jdoe@example.com", "password": "s3cret"})
+        ]
+
+    def test_ndjson_reports_malformed_lines(self) -> None:
+        rows = _rows('{"username": "jdoe"}\n\nnot json\n[1]\n', "ndjson")
+
+        assert rows[0] == (1, {"username": "jdoe"})
+        assert [number for number, _ in rows] == [1, 3, 4]
+        assert all(isinstance(row, Exception) for _, row in rows[1:])
+
+    def test_format_from_extension(self) -> None:
+        assert user_import.detect_format("staff.jsonl") == "ndjson"
+        assert user_import.detect_format("staff.CSV") == "csv"
+        assert user_import.detect_format("staff") == "csv"
+
+
+def _existing_users(**lookups):
+    """Stand-in for User.objects.filter: "taken" and used@example.com exist."""
+    queryset = mock.Mock()
+    if "email__in" in lookups:
+        # archived users do not hold on to their email
+        assert lookups["is_archived"] is False
+        queryset.values_list.return_value = ["used@example.com"]
+    else:
+        queryset.values_list.return_value = ["taken"]
+    return queryset
+
+
+class ImportUsersTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.tenant = Tenant(id=3, schema_name="acme", database_alias="cluster_b")
+        self.schema_context = self.enterContext(
+            mock.patch("control_plane.user_import.schema_context")
+        )
+        self.transaction = self.enterContext(mock.patch("control_plane.user_import.transaction"))
+        self.directory = self.enterContext(mock.patch("control_plane.user_import.directory"))
+        self.apply_user_deltas = self.enterContext(
+            mock.patch("control_plane.user_import.user_stats.apply_user_deltas")
+        )
+        hasher = mock.patch(
+            "control_plane.user_import.make_password", side_effect=lambda raw: f"hashed:{raw}"
+        )
+        hasher.start()
+        self.addCleanup(hasher.stop)
+
+        existing = mock.patch.object(User.objects, "filter", side_effect=_existing_users)
+        existing.start()
+        self.addCleanup(existing.stop)
+        bulk_create = mock.patch.object(
+            User.objects, "bulk_create", side_effect=lambda users: users
+        )
+        self.bulk_create = bulk_create.start()
+        self.addCleanup(bulk_create.stop)
+
+    def test_creates_valid_rows_and_reports_the_rest(self) -> None:
+        rows = [
+            (2, {"username": "jdoe", "email": "JDoe@example.com", "password": "pw1"}),
+            (3, {"username": "jdoe", "email": "other@example.com", "password": "pw2"}),
+            (4, {"username": "taken", "email": "t@example.com", "password": "pw3"}),
+            (5, {"username": "nomail", "password": "pw4"}),
+            (6, ValueError("Expected a JSON object.")),
+            (
+                7,
+                {
+                    "username": "admin",
+                    "email": "a@example.com",
+                    "password": "pw5",
+                    "is_superuser": "true",
+                },
+            ),
+        ]
+
+        result = user_import.import_users(self.tenant, rows, batch_size=3)
+
+        assert result["created"] == 2
+        assert [error["row"] for error in result["errors"]] == [3, 4, 5, 6]
+        assert result["errors"][0]["errors"] == {"username": ["Duplicate username in this file."]}
+        assert "email" in result["errors"][2]["errors"]
+
+        created = [user for call in self.bulk_create.call_args_list for user in call.args[0]]
+        assert [(u.username, u.email, u.password, u.is_staff) for u in created] == [
+            ("jdoe", "jdoe@example.com", "hashed:pw1", True),
+            ("admin", "a@example.com", "hashed:pw5", True),
+        ]
+        self.transaction.atomic.assert_called_with(using="cluster_b")
+        assert self.directory.sync_users.call_count == 2
+        self.apply_user_deltas.assert_called_once_with(
+            3, {"total": 2, "active": 2, "staff": 2, "admins": 1}
+        )
+
+    def test_rejects_duplicate_emails(self) -> None:
+        rows = [
+            (2, {"username": "ann", "email": "ann@example.com", "password": "pw1"}),
+            (3, {"username": "anne", "email": " ANN@example.com", "password": "pw2"}),
+            (4, {"username": "sam", "email": "Used@example.com", "password": "pw3"}),
+            (5, {"username": "taken", "email": "t@example.com", "password": "pw4"}),
+        ]
+
+        result = user_import.import_users(self.tenant, rows, batch_size=2)
+
+        assert result["created"] == 1
+        assert {error["row"]: error["errors"] for error in result["errors"]} == {
+            3: {"email": ["Duplicate email in this file."]},
+            4: {"email": ["A user with that email already exists."]},
+            5: {"username": ["A user with that username already exists."]},
+        }
+        assert self.bulk_create.call_args.args[0][0].email == "ann@example.com"
+
+    def test_hashes_in_the_pool(self) -> None:
+        pool = mock.Mock()
+        pool.map.side_effect = lambda func, passwords, chunksize: [f"pool:{p}" for p in passwords]
+
+        user_import.import_users(
+            self.tenant,
+            [(2, {"username": "jdoe", "email": "j@example.com", "password": "pw"})],
+            pool,
+        )
+
+        assert self.bulk_create.call_args.args[0][0].password == "pool:pw"
+
+
+class SharedHasherPoolTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.enterContext(mock.patch.object(user_import, "_shared_pool", None))
+        self.hasher_pool = self.enterContext(
+            mock.patch.object(
+                user_import, "hasher_pool", side_effect=lambda processes: mock.Mock(name="pool")
+            )
+        )
+
+    @override_settings(TENANT_USER_IMPORT_WEB_PROCESSES=2)
+    def test_pool_outlives_each_import(self) -> None:
+        with user_import.shared_hasher_pool() as first:
+            pass
+        with user_import.shared_hasher_pool() as second:
+            pass
+
+        assert first is second
+        first.shutdown.assert_not_called()
+        self.hasher_pool.assert_called_once_with(2)
+
+    def test_broken_pool_is_replaced(self) -> None:
+        with self.assertRaises(BrokenProcessPool), user_import.shared_hasher_pool() as broken:
+            raise BrokenProcessPool
+        with user_import.shared_hasher_pool() as replacement:
+            pass
+
+        broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert replacement is not broken
+
+    def test_worker_exit_stops_the_pool(self) -> None:
+        with user_import.shared_hasher_pool() as pool:
+            pass
+
+        user_import.shutdown_shared_hasher_pool()
+        user_import.shutdown_shared_hasher_pool()
+
+        pool.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert user_import._shared_pool is None
+
+
+class BulkImportViewTests(SimpleTestCase):
+    def test_unprovisioned_client_is_rejected(self) -> None:
+        view = TenantUserViewset()
+        view._tenant = Tenant(id=3, provisioning_status=Tenant.ProvisioningStatus.MIGRATING)
+
+        response = view.bulk_import(SimpleNamespace(data={}))
+
+        assert response.status_code == 409
+
+
+class ImportTenantUsersCommandTests(SimpleTestCase):
+    def test_reports_errors_per_row(self) -> None:
+        tenant = Tenant(id=3, schema_name="acme")
+        result = {"created": 1, "failed": 1, "errors": [{"row": 3, "errors": {"email": ["x"]}}]}
+        stdout, stderr = StringIO(), StringIO()
+
+        with (
+            tempfile.NamedTemporaryFile(suffix=".ndjson") as upload,
+            mock.patch.object(Tenant.objects, "filter") as filter_,
+            mock.patch("control_plane.management.commands.import_tenant_users.hasher_pool"),
+            mock.patch(
+                "control_plane.management.commands.import_tenant_users.import_users",
+                return_value=result,
+            ) as import_users,
+        ):
+            filter_.return_value.first.return_value = tenant
+            call_command("import_tenant_users", "acme", upload.name, stdout=stdout, stderr=stderr)
+
+        assert import_users.call_args.args[0] is tenant
+        assert '"row": 3' in stderr.getvalue()
+        assert "Created 1 user(s), 1 row(s) failed" in stdout.getvalue()
+
+    def test_unknown_schema(self) -> None:
+        with (
+            mock.patch.object(Tenant.objects, "filter") as filter_,
+            self.assertRaisesMessage(CommandError, "No provisioned tenant 'nope'"),
+        ):
+            filter_.return_value.first.return_value = None
+            call_command("import_tenant_users", "nope", "users.csv")